@@ -39,9 +39,6 @@ def main():
         sys.exit(1)
 
     if args.command == "serve":
-        import uvicorn
-        from app.server import configure
-
         # 서고 경로 결정: CLI 인자 → 마지막 사용 서고 → 미지정
         library_path = None
 
@@ -65,6 +62,12 @@ def main():
             except Exception:
                 pass
 
+        # uvicorn·app.server(FastAPI + 전체 라우터)는 import 비용이 크다.
+        # 서고 경로 검증이 끝난 뒤에 import해야
+        # "서고를 찾을 수 없습니다" 같은 오류 경로가 즉시 종료된다.
+        import uvicorn
+        from app.server import configure
+
         if library_path:
             configure(library_path)
             print(f"서고: {library_path}")
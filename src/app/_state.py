@@ -4,28 +4,47 @@
 순환 import 방지를 위해 이 모듈은 core/llm/ocr 모듈만 lazy-import한다.
 """
 
+import asyncio
 import re
+import json
 import logging
 import hashlib
+import os
+import stat
 import time
 import copy
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
+from fastapi.responses import JSONResponse, Response
+
+# json_io는 다른 core 모듈을 import하지 않는 말단 모듈이라 순환 import 걱정 없이 바로 가져온다.
+from core.json_io import dumps as _json_dumps, read_json
+
 logger = logging.getLogger(__name__)
 
 # ── 전역 상태 ─────────────────────────────────
 
 _library_path: Path | None = None
+# LLM 라우터: 프로바이더들이 HTTP 클라이언트(커넥션 풀)를 인스턴스 상태로 재사용한다.
+# 교체(서고 전환) 시에는 반드시 aclose()로 keep-alive 연결을 정리해야 한다.
 _llm_router = None
-_llm_drafts: dict = {}
+_llm_drafts: OrderedDict[str, tuple[float, object]] = OrderedDict()
 _ocr_registry = None
 _ocr_pipeline = None
 _llm_result_cache: dict[str, tuple[float, dict]] = {}
 
-# 저장소 ID 패턴: 영문 소문자로 시작, 소문자·숫자·밑줄만 허용 (최대 64자)
+# 저장소 ID 규칙: 영문 소문자로 시작, 소문자·숫자·밑줄만 허용 (최대 64자)
 # document.py의 _DOC_ID_PATTERN, interpretation.py의 _INTERP_ID_PATTERN과 동일한 규칙.
 # 경로 탈출(../ 등)을 원천 차단하기 위해 API 계층에서도 검증한다.
-_REPO_ID_PATTERN = re.compile(r"^[a-z][a-z0-9_]{0,63}$")
+# 모든 문헌/해석 요청마다 실행되므로 정규식 대신 문자 집합으로 검사한다 (_is_valid_repo_id).
+_REPO_ID_FIRST_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz")
+_REPO_ID_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_")
+
+# thinking 모델(kimi-k2.5, qwq 등)의 <think>...</think> 사고 블록.
+# 모든 LLM 응답마다 적용되므로 모듈 로드 시 한 번만 컴파일한다.
+_THINK_TAG_PATTERN = re.compile(r"<think>.*?</think>", re.DOTALL)
 
 
 # ── 상태 접근 함수 ───────────────────────────
@@ -35,17 +54,192 @@ def get_library_path() -> Path | None:
     return _library_path
 
 
+class ApiError(Exception):
+    """라우터 의존성(Depends)에서 요청을 {"error": ...} 응답으로 끝낼 때 던진다.
+
+    왜 HTTPException이 아닌가:
+        HTTPException은 {"detail": ...} 형태로 응답하지만,
+        프론트엔드는 모든 API에서 err.error를 읽는다.
+        server.py에 등록한 핸들러가 이 예외를 기존과 같은 JSONResponse로 바꾼다.
+    """
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+class FastJSONResponse(JSONResponse):
+    """core.json_io.dumps(orjson 우선)로 직렬화하는 JSONResponse.
+
+    왜 ORJSONResponse가 아닌가:
+        FastAPI의 ORJSONResponse는 폐기 예정(deprecated)이고 orjson이 없으면 동작하지 않는다.
+        json_io.dumps는 orjson이 없을 때 표준 json으로 폴백하므로 같은 클래스로 양쪽을 지원한다.
+    큰 주석·사전 데이터를 돌려주는 라우터의 default_response_class로 쓴다.
+    """
+
+    def render(self, content) -> bytes:
+        return _json_dumps(content)
+
+
+def files_etag(signature) -> str:
+    """파일 (이름, mtime_ns, 크기) 목록으로 약한 ETag를 만든다.
+
+    목록 응답은 파일 내용을 그대로 모은 것이므로, 파일들의 stat이 같으면 응답도 같다.
+    """
+    digest = hashlib.blake2b(repr(signature).encode("utf-8"), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def not_modified(request, etag: str):
+    """If-None-Match가 etag와 맞으면 304 응답을, 아니면 None을 반환한다."""
+    header = request.headers.get("if-none-match")
+    if header and (header.strip() == "*" or etag in (t.strip() for t in header.split(","))):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    return None
+
+
+def sse_event(data) -> bytes:
+    """SSE "data:" 이벤트 한 개를 UTF-8 bytes로 만든다.
+
+    스트리밍 중 토큰 단위 진행 이벤트마다 호출되므로 json_io.dumps(orjson 우선)로
+    바로 bytes를 만들고, StreamingResponse가 다시 인코딩하지 않도록 bytes로 내보낸다.
+    """
+    return b"data: " + _json_dumps(data) + b"\n\n"
+
+
+def require_library_path() -> Path:
+    """서고 경로를 반환한다. 설정되지 않았으면 ApiError(500)."""
+    if _library_path is None:
+        raise ApiError("서고가 설정되지 않았습니다.", status_code=500)
+    return _library_path
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    """os.stat 결과를 반환한다. 경로가 없으면 None.
+
+    exists()/is_dir()는 내부에서 stat을 부르고 결과를 버리므로,
+    존재 확인과 종류·mtime 확인이 함께 필요한 곳은 이 결과 하나를 재사용한다.
+    """
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def require_interp(interp_id: str) -> Path:
+    """FastAPI 의존성: 경로 파라미터 interp_id의 해석 저장소 경로를 검증해 반환한다.
+
+    엔드포인트마다 반복하던 "서고 확인 → 경로 조립 → 존재 확인" 서두를 한곳에 모은다.
+    """
+    interp_path = require_library_path() / "interpretations" / interp_id
+    st = _stat_or_none(interp_path)
+    if st is None or not stat.S_ISDIR(st.st_mode):
+        raise ApiError(f"해석 '{interp_id}'를 찾을 수 없습니다.", status_code=404)
+    return interp_path
+
+
+# manifest.json 경로 → ((mtime_ns, size), 파싱된 dict)
+_MANIFEST_CACHE_MAX_SIZE = 128
+_manifest_cache: OrderedDict[Path, tuple[tuple[int, int], dict]] = OrderedDict()
+
+
+def load_manifest(path: Path) -> dict:
+    """manifest.json을 읽어 dict로 반환한다. 파일이 바뀌지 않았으면 캐시를 쓴다.
+
+    왜 캐시하는가:
+        인용 조회·내보내기는 요청마다 source_document_id 하나를 얻으려고
+        매니페스트를 다시 읽고 파싱한다. 매니페스트는 거의 바뀌지 않으므로
+        stat 한 번으로 (mtime_ns, size)를 비교해 같으면 파싱을 건너뛴다.
+    주의: 반환된 dict는 캐시와 공유되므로 호출자가 수정하면 안 된다.
+    예외: 파일이 없으면 FileNotFoundError, 형식이 잘못되면 JSONDecodeError.
+    """
+    st = os.stat(path)
+    sig = (st.st_mtime_ns, st.st_size)
+    cached = _manifest_cache.get(path)
+    if cached is not None and cached[0] == sig:
+        _manifest_cache.move_to_end(path)
+        return cached[1]
+
+    data = read_json(path)
+    _manifest_cache[path] = (sig, data)
+    while len(_manifest_cache) > _MANIFEST_CACHE_MAX_SIZE:
+        _manifest_cache.popitem(last=False)
+    return data
+
+
 def set_library_path(path: Path | None):
     """서고 경로를 설정한다. LLM 라우터 캐시도 리셋된다."""
     global _library_path, _llm_router, _llm_result_cache
     _library_path = path
+    old_router = _llm_router
     _llm_router = None  # 서고 전환 시 LLM 라우터 리셋
     _llm_result_cache.clear()
+    if old_router is not None:
+        _close_llm_router(old_router)
 
 
-def get_llm_drafts() -> dict:
-    """LLM 초안 저장소를 반환한다 (메모리 — 서버 재시작 시 소멸)."""
-    return _llm_drafts
+def _close_llm_router(router):
+    """교체된 LLM 라우터의 HTTP 연결을 백그라운드에서 정리한다.
+
+    set_library_path()는 동기 함수이므로 실행 중인 이벤트 루프가 있을 때만
+    aclose()를 태스크로 예약한다. 루프 밖(서버 시작 전)이라면 아직 열린 연결이 없다.
+    """
+    import asyncio as _asyncio
+
+    try:
+        loop = _asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    loop.create_task(router.aclose())
+
+
+# LLM 초안 보관 한도.
+# 초안은 메모리에만 있고 서버가 오래 떠 있으면 계속 쌓이므로,
+# 오래된 것(TTL 초과)과 개수 초과분(가장 오래 쓰이지 않은 것부터)을 버린다.
+_LLM_DRAFT_TTL_SEC = 3600
+_LLM_DRAFT_MAX_SIZE = 1000
+
+
+def _prune_llm_drafts(now: float):
+    """만료되었거나 개수 한도를 넘은 LLM 초안을 제거한다.
+
+    _llm_drafts는 최근 사용 순서(OrderedDict 끝이 최신)를 유지하므로
+    앞에서부터 검사하면 오래된 항목만 보고 멈출 수 있다.
+    """
+    while _llm_drafts:
+        _draft_id, (ts, _draft) = next(iter(_llm_drafts.items()))
+        if now - ts <= _LLM_DRAFT_TTL_SEC and len(_llm_drafts) <= _LLM_DRAFT_MAX_SIZE:
+            break
+        _llm_drafts.popitem(last=False)
+
+
+def set_llm_draft(draft_id: str, draft):
+    """LLM 초안을 저장한다 (메모리 — 서버 재시작 시 소멸).
+
+    입력: draft_id, LlmDraft 객체.
+    한도(_LLM_DRAFT_MAX_SIZE, _LLM_DRAFT_TTL_SEC)를 넘는 오래된 초안은 함께 정리된다.
+    """
+    now = time.monotonic()
+    _llm_drafts[draft_id] = (now, draft)
+    _llm_drafts.move_to_end(draft_id)
+    _prune_llm_drafts(now)
+
+
+def get_llm_draft(draft_id: str):
+    """LLM 초안을 조회한다. 없거나 만료되었으면 None.
+
+    조회된 초안은 최근 사용으로 갱신되어 TTL이 다시 시작된다
+    (검토 중인 초안이 사라지지 않도록).
+    """
+    now = time.monotonic()
+    _prune_llm_drafts(now)
+    entry = _llm_drafts.get(draft_id)
+    if entry is None:
+        return None
+    _llm_drafts[draft_id] = (now, entry[1])
+    _llm_drafts.move_to_end(draft_id)
+    return entry[1]
 
 
 def configure_library(library_path: str | Path):
@@ -56,7 +250,7 @@ def configure_library(library_path: str | Path):
     서고 전환 시 주의:
         - LLM 라우터 캐시를 초기화한다 (서고별 .env가 다를 수 있음).
         - 최근 서고 목록에 추가한다.
-        - Git 건강 검사를 수행한다.
+        - Git 건강 검사를 백그라운드 스레드에서 수행한다 (서버 기동을 지연시키지 않음).
     """
     resolved = Path(library_path).resolve()
     set_library_path(resolved)
@@ -66,16 +260,33 @@ def configure_library(library_path: str | Path):
         from core.app_config import add_recent_library
         lib_name = resolved.name
         # library_manifest.json에서 이름 읽기 (있으면)
-        manifest_path = resolved / "library_manifest.json"
-        if manifest_path.exists():
-            import json
-            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        # exists() 확인 후 읽으면 stat이 두 번 일어나므로, 바로 읽고 없으면 건너뛴다.
+        try:
+            manifest = read_json(resolved / "library_manifest.json")
             lib_name = manifest.get("name", lib_name)
+        except FileNotFoundError:
+            pass
         add_recent_library(str(resolved), lib_name)
     except Exception as e:
         logger.debug(f"최근 서고 기록 실패 (무시): {e}")
 
-    # Git 건강 검사 — .git 내부 파일 오염 자동 탐지 및 수리
+    # Git 건강 검사 — 서고의 모든 저장소를 훑으므로 문헌이 많으면 오래 걸린다.
+    # 첫 요청 처리에 필요한 작업이 아니라 진단·자동 수리이므로,
+    # 서버가 바로 요청을 받을 수 있도록 백그라운드 스레드에서 실행한다.
+    # (configure_library는 이벤트 루프 시작 전에도 호출되므로 asyncio 태스크 대신 스레드를 쓴다.)
+    threading.Thread(
+        target=_run_git_health_check,
+        args=(resolved,),
+        name="git-health-check",
+        daemon=True,
+    ).start()
+
+
+def _run_git_health_check(resolved: Path):
+    """.git 내부 파일 오염을 탐지하고 자동 수리한다 (configure_library의 백그라운드 작업).
+
+    결과는 로그로만 남긴다. 실패해도 서버 동작에는 영향이 없다.
+    """
     try:
         from core.library import check_git_health, repair_git_contamination
         contaminated = check_git_health(resolved)
@@ -106,6 +317,89 @@ def configure_library(library_path: str | Path):
         logger.debug(f"Git 건강 검사 실패 (무시): {e}")
 
 
+# ── 해석 저장소 자동 커밋 ───────────────────────
+
+# 편집 후 이 시간(초) 동안 추가 편집이 없으면 모아 둔 변경을 한 번에 커밋한다.
+_INTERP_COMMIT_DEBOUNCE_SEC = 2.0
+# 해석 저장소 경로 → (예약된 타이머, 모아 둔 커밋 메시지들)
+_pending_interp_commits: dict[Path, tuple[asyncio.TimerHandle, list[str]]] = {}
+# 같은 저장소에 git 프로세스가 동시에 돌면 index.lock 충돌이 나므로 저장소별로 직렬화한다.
+_interp_commit_locks: dict[Path, asyncio.Lock] = {}
+
+
+def schedule_interp_commit(interp_path: Path, message: str) -> None:
+    """해석 저장소의 git commit을 지연 예약한다. 이벤트 루프 안에서 호출해야 한다.
+
+    왜 바로 커밋하지 않는가:
+        주석·인용 마크는 편집할 때마다 저장되고, 커밋마다 git 프로세스를 띄우면
+        연속 편집 시 수백 ms짜리 커밋이 줄줄이 쌓인다.
+        git_commit_interpretation은 저장소 전체를 add -A로 커밋하므로,
+        마지막 편집 뒤 _INTERP_COMMIT_DEBOUNCE_SEC만큼 기다렸다가 한 번만 커밋해도
+        같은 변경이 모두 기록된다. 메시지는 모아서 본문에 나열한다.
+    """
+    loop = asyncio.get_running_loop()
+    key = Path(interp_path)
+    pending = _pending_interp_commits.get(key)
+    messages = pending[1] if pending else []
+    if pending:
+        pending[0].cancel()
+    messages.append(message)
+    handle = loop.call_later(_INTERP_COMMIT_DEBOUNCE_SEC, _flush_interp_commit, key)
+    _pending_interp_commits[key] = (handle, messages)
+
+
+def _flush_interp_commit(key: Path) -> None:
+    """디바운스 타이머 만료 시 호출 — 모아 둔 메시지로 커밋 태스크를 띄운다."""
+    _handle, messages = _pending_interp_commits.pop(key)
+    asyncio.create_task(
+        _run_interp_commit(key, messages), name=f"git-commit-interp:{key.name}"
+    )
+
+
+def _join_commit_messages(messages: list[str]) -> str:
+    """모아 둔 커밋 메시지를 하나로 합친다. 제목은 마지막 메시지, 본문은 전체 목록."""
+    if len(messages) == 1:
+        return messages[0]
+    return f"{messages[-1]} 외 {len(messages) - 1}건\n\n" + "\n".join(
+        f"- {m}" for m in messages
+    )
+
+
+async def _run_interp_commit(key: Path, messages: list[str]) -> None:
+    """모아 둔 메시지를 하나로 합쳐 커밋한다."""
+    await commit_interp(key, _join_commit_messages(messages))
+
+
+def flush_pending_interp_commits() -> None:
+    """서버 종료 시 호출 — 예약만 되고 아직 실행되지 않은 커밋을 지금 동기적으로 실행한다."""
+    from core.interpretation import git_commit_interpretation
+
+    for key, (handle, messages) in list(_pending_interp_commits.items()):
+        handle.cancel()
+        try:
+            git_commit_interpretation(key, _join_commit_messages(messages))
+        except Exception as e:
+            logger.warning("해석 저장소 자동 커밋 실패 (%s): %s", key.name, e)
+    _pending_interp_commits.clear()
+
+
+async def commit_interp(interp_path: Path, message: str) -> None:
+    """해석 저장소를 지금 바로 커밋한다. 같은 저장소의 커밋과는 순서대로 실행된다.
+
+    수동 커밋처럼 메시지를 합치면 안 되는 경우에 BackgroundTasks로 넘겨 쓴다.
+    실패는 로그만 남긴다 (저장 자체는 이미 끝났으므로).
+    """
+    from core.interpretation import git_commit_interpretation
+
+    key = Path(interp_path)
+    lock = _interp_commit_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        try:
+            await asyncio.to_thread(git_commit_interpretation, key, message)
+        except Exception as e:
+            logger.warning("해석 저장소 자동 커밋 실패 (%s): %s", key.name, e)
+
+
 # ── LLM 라우터 ────────────────────────────────
 
 def _get_llm_router():
@@ -114,6 +408,11 @@ def _get_llm_router():
     왜 lazy-init인가:
         _library_path는 serve 명령에서 설정된다.
         LlmConfig가 서고의 .env를 읽으려면 경로가 필요하다.
+
+    연결 재사용:
+        반환된 라우터의 프로바이더들은 HTTP 클라이언트(httpx/SDK)를 인스턴스 상태로
+        재사용하므로, 같은 라우터로 여러 번 호출해도 TCP·TLS 연결을 다시 맺지 않는다.
+        라우터를 버릴 때는 set_library_path()가 aclose()로 연결을 정리한다.
     """
     global _llm_router
     if _llm_router is None:
@@ -159,19 +458,34 @@ def _get_ocr_pipeline():
 
 # ── 경로 해석 ────────────────────────────────
 
+def _is_valid_repo_id(repo_id: str) -> bool:
+    """repo_id가 저장소 ID 규칙(^[a-z][a-z0-9_]{0,63}$)을 만족하는지 확인한다.
+
+    왜 정규식이 아닌가:
+        frozenset.issuperset(str)은 C 수준에서 한 번에 검사하므로
+        짧은 ID에 대해 정규식 엔진을 거치는 것보다 빠르다.
+        또한 정규식의 $는 끝의 줄바꿈("abc\\n")을 허용하지만, 이 검사는 허용하지 않는다.
+    """
+    return (
+        0 < len(repo_id) <= 64
+        and repo_id[0] in _REPO_ID_FIRST_CHARS
+        and _REPO_ID_CHARS.issuperset(repo_id)
+    )
+
+
 def _resolve_repo_path(repo_type: str, repo_id: str) -> Path | None:
     """repo_type("documents"/"interpretations")과 repo_id로 저장소 경로를 결정한다.
 
     왜 이렇게 하는가:
         원본 저장소와 해석 저장소를 단일 엔드포인트로 처리하기 위해
         repo_type 문자열을 검증하고 경로를 반환한다.
-        repo_id도 정규식으로 검증하여 경로 탈출(path traversal)을 방지한다.
+        repo_id도 _is_valid_repo_id()로 검증하여 경로 탈출(path traversal)을 방지한다.
     """
     if _library_path is None:
         return None
     if repo_type not in ("documents", "interpretations"):
         return None
-    if not _REPO_ID_PATTERN.match(repo_id):
+    if not _is_valid_repo_id(repo_id):
         return None
     return _library_path / repo_type / repo_id
 
@@ -264,6 +578,20 @@ _LLM_MAX_TOKENS_BY_PURPOSE = {
 _LLM_RESULT_CACHE_TTL_SEC = 600
 _LLM_RESULT_CACHE_MAX_SIZE = 256
 
+# 자동 모드에서 앞 프로바이더가 이 시간(초) 안에 끝나지 않으면 다음 프로바이더를 병렬로 시작한다.
+# LLM 응답은 보통 수 초~수십 초 걸리므로, 너무 짧게 잡으면 매 요청이 중복 과금된다.
+_LLM_HEDGE_DELAY_SEC = 20.0
+
+
+def _format_user_prompt(purpose: str, text: str) -> str:
+    """_LLM_PROMPTS의 사용자 프롬프트 템플릿에 원문을 채워 반환한다."""
+    max_items = _get_annotation_max_items(len(text)) if purpose == "annotation" else 0
+    return _LLM_PROMPTS[purpose]["user"].format(
+        text=text,
+        char_count=len(text),
+        max_items=max_items,
+    )
+
 
 def _clamp_int(value: int, min_value: int, max_value: int) -> int:
     return max(min_value, min(max_value, value))
@@ -410,11 +738,7 @@ async def _call_llm_text(purpose: str, text: str,
             "\n6. description must be one line and <= 40 characters."
             "\n7. If uncertain, skip instead of adding speculative items."
         )
-    user_prompt = prompts["user"].format(
-        text=text,
-        char_count=len(text),
-        max_items=max_items,
-    )
+    user_prompt = _format_user_prompt(purpose, text)
     cache_key = _make_llm_cache_key(purpose, text, force_provider, force_model)
     cached = _get_cached_llm_result(cache_key)
     if cached is not None:
@@ -490,47 +814,72 @@ async def _call_llm_text(purpose: str, text: str,
     # ── 자동 모드: 프로바이더 순서대로 시도, JSON 파싱 실패 시 다음으로 ──
     # 가용성을 병렬로 사전 체크 (캐시 활용).
     # Base44(subprocess 5s) + Ollama(HTTP 3s) 순차 체크 → 최대 8초 낭비 방지.
-    avail_results = await _asyncio.gather(
-        *[router.is_available_cached(p) for p in router.providers],
-        return_exceptions=True,
-    )
+    availability = await router.cached_availability_snapshot()
 
-    errors = []
-    tried = []
-    for provider, avail in zip(router.providers, avail_results):
-        if avail is not True:
+    candidates = []
+    for provider in router.providers:
+        if not availability.get(provider.provider_id):
             logger.debug(f"LLM {purpose} — {provider.provider_id}: 사용 불가, 건너뜀")
             continue
+        candidates.append(provider)
+
+    async def _try_provider(provider) -> dict:
+        logger.info(f"LLM {purpose} — {provider.provider_id} 시도 중...")
+        response = await provider.call(
+            user_prompt,
+            system=system_prompt,
+            response_format=_RESPONSE_FORMAT,
+            max_tokens=_MAX_TOKENS,
+            purpose=purpose,
+        )
+        router.usage_tracker.log(response, purpose=purpose)
 
-        try:
-            tried.append(provider.provider_id)
-            logger.info(f"LLM {purpose} — {provider.provider_id} 시도 중...")
-
-            response = await provider.call(
-                user_prompt,
-                system=system_prompt,
-                response_format=_RESPONSE_FORMAT,
-                max_tokens=_MAX_TOKENS,
-                purpose=purpose,
-            )
-            router.usage_tracker.log(response, purpose=purpose)
-
-            logger.info(
-                f"LLM {purpose} — {provider.provider_id}/{response.model} 응답 수신 "
-                f"(길이={len(response.text)}, tokens_out={response.tokens_out})"
-            )
+        logger.info(
+            f"LLM {purpose} — {provider.provider_id}/{response.model} 응답 수신 "
+            f"(길이={len(response.text)}, tokens_out={response.tokens_out})"
+        )
 
-            # JSON 파싱 시도 — 실패하면 다음 프로바이더로
-            parsed = _parse_llm_json(response, _json)
-            _set_cached_llm_result(cache_key, parsed)
-            return parsed
+        # JSON 파싱 시도 — 실패하면 예외가 전파되어 다음 프로바이더로 넘어간다
+        return _parse_llm_json(response, _json)
 
-        except Exception as e:
-            logger.warning(
-                f"LLM {purpose} — {provider.provider_id} 실패: {e}"
+    # 헤지(hedged) 호출:
+    #   우선순위 1번 프로바이더를 먼저 시작하고, 실패하면 즉시 다음 프로바이더를 시작한다.
+    #   실패하지 않았더라도 _LLM_HEDGE_DELAY_SEC 안에 끝나지 않으면
+    #   다음 프로바이더를 병렬로 추가 시작한다 (느린 프로바이더가 전체 응답을 붙잡지 않도록).
+    #   먼저 유효한 JSON을 돌려준 쪽이 이기고, 나머지 태스크는 취소한다.
+    #   지연값을 넉넉히 두는 이유: 유료 프로바이더가 불필요하게 중복 호출되는 것을 막기 위해.
+    errors = []
+    tried = []
+    running: dict = {}  # asyncio.Task → provider_id
+    next_idx = 0
+    try:
+        while next_idx < len(candidates) or running:
+            if next_idx < len(candidates):
+                provider = candidates[next_idx]
+                next_idx += 1
+                tried.append(provider.provider_id)
+                task = _asyncio.create_task(_try_provider(provider))
+                running[task] = provider.provider_id
+
+            # 더 시작할 프로바이더가 남아 있을 때만 헤지 타임아웃을 건다
+            timeout = _LLM_HEDGE_DELAY_SEC if next_idx < len(candidates) else None
+            done, _ = await _asyncio.wait(
+                running.keys(), timeout=timeout, return_when=_asyncio.FIRST_COMPLETED,
             )
-            errors.append(f"{provider.provider_id}: {e}")
-            continue
+            for task in done:
+                provider_id = running.pop(task)
+                try:
+                    parsed = task.result()
+                except Exception as e:
+                    logger.warning(f"LLM {purpose} — {provider_id} 실패: {e}")
+                    errors.append(f"{provider_id}: {e}")
+                    continue
+                _set_cached_llm_result(cache_key, parsed)
+                return parsed
+    finally:
+        # 승자가 나왔거나 호출자가 취소된 경우, 진행 중인 나머지 호출을 정리한다
+        for task in running:
+            task.cancel()
 
     raise ValueError(
         f"모든 LLM 프로바이더가 {purpose} 요청에 실패했습니다 "
@@ -539,6 +888,18 @@ async def _call_llm_text(purpose: str, text: str,
     )
 
 
+# SSE 스트리밍 큐 한도. 프로바이더가 progress를 1초에 한 번 이하로 보고하므로
+# 정상적인 브라우저라면 몇 개 이상 쌓이지 않는다. 응답을 읽지 않는 클라이언트 때문에
+# 이벤트가 끝없이 쌓이지 않도록 한도를 둔다. 넘치면 progress를 하나로 합쳐 보류하고
+# (partial 항목은 누적), complete/error 앞에서 내보낸다 (_put_progress).
+_LLM_STREAM_QUEUE_MAXSIZE = 64
+
+
+def make_llm_stream_queue() -> asyncio.Queue:
+    """_call_llm_text_stream에 넘길 SSE 이벤트 큐를 만든다 (크기 제한 있음)."""
+    return asyncio.Queue(maxsize=_LLM_STREAM_QUEUE_MAXSIZE)
+
+
 async def _call_llm_text_stream(purpose: str, text: str,
                                  queue,
                                  force_provider=None, force_model=None):
@@ -551,6 +912,9 @@ async def _call_llm_text_stream(purpose: str, text: str,
 
     이벤트 형식:
         progress: {"type":"progress","elapsed_sec":N,"tokens":N,"provider":"..."}
+                  표점·주석은 새로 완성된 배열 항목이 있으면 "partial":[...]이 추가된다.
+                  재시도·폴백으로 새 시도가 시작되면 "partial_reset":true가 온다 —
+                  그때까지 받은 partial은 버려야 한다 (새 시도가 같은 항목을 다시 보낸다).
         complete: {"type":"complete","result":{...파싱된 JSON...}}
         error:    {"type":"error","error":"에러 메시지"}
     """
@@ -571,11 +935,7 @@ async def _call_llm_text_stream(purpose: str, text: str,
             "\n6. description must be one line and <= 40 characters."
             "\n7. If uncertain, skip instead of adding speculative items."
         )
-    user_prompt = prompts["user"].format(
-        text=text,
-        char_count=len(text),
-        max_items=max_items,
-    )
+    user_prompt = _format_user_prompt(purpose, text)
     cache_key = _make_llm_cache_key(purpose, text, force_provider, force_model)
     cached = _get_cached_llm_result(cache_key)
     if cached is not None:
@@ -587,20 +947,84 @@ async def _call_llm_text_stream(purpose: str, text: str,
     max_tokens = _MAX_TOKENS
     last_error = None
 
+    # 표점(marks)·주석(annotations)은 결과가 배열이므로, 스트리밍 도중 완성된 항목을
+    # progress 이벤트의 "partial"로 미리 내보낼 수 있다. 번역은 단일 객체라 해당 없음.
+    partial_key = _STREAM_PARTIAL_KEYS.get(purpose)
+    extractor = None
+    # 지금 시도에서 partial을 하나라도 내보냈는지 (새 시도 때 partial_reset을 보낼지)
+    partial_sent = False
+    # 큐가 가득 차서 아직 넣지 못한 progress 이벤트 (하나로 합쳐 보관)
+    overflow = None
+
     def _progress_cb(event):
         """provider의 progress_callback → queue에 넣기.
 
         왜 call_soon_threadsafe가 아닌가:
             progress_callback은 같은 이벤트 루프의 async for 내에서 호출되므로
             put_nowait()으로 충분하다.
+
+        text_delta 처리:
+            네이티브 스트리밍 프로바이더는 직전 보고 이후 받은 텍스트를 text_delta로 넘긴다.
+            브라우저로 원문 조각을 보낼 필요는 없으므로 여기서 떼어내고,
+            새로 완성된 배열 항목이 있으면 "partial"로 대신 붙인다.
         """
+        nonlocal extractor, partial_sent
+        delta = event.pop("text_delta", None)
+        if delta and partial_key:
+            # 자동 폴백으로 프로바이더가 바뀌면 앞 프로바이더의 잔여 텍스트를 버린다.
+            # 앞 프로바이더가 보낸 partial도 새 응답이 다시 보내므로 클라이언트에 리셋을 알린다.
+            if extractor is None or extractor.provider != event.get("provider"):
+                if extractor is not None and partial_sent:
+                    event["partial_reset"] = True
+                    partial_sent = False
+                extractor = _StreamingArrayExtractor(partial_key, event.get("provider"))
+            items = extractor.feed(delta)
+            if items:
+                event["partial"] = items
+                partial_sent = True
+        _put_progress(event)
+
+    def _put_progress(event):
+        """progress 이벤트를 큐에 넣는다. 큐가 가득 차면 버리지 않고 보류한다.
+
+        보류 중인 이벤트가 있으면 새 이벤트에 합친다 — 진행 수치는 최신 값을 쓰고,
+        partial 항목은 잃지 않도록 앞의 것부터 이어 붙인다.
+        새 이벤트가 partial_reset이면 보류된 partial은 어차피 버려질 것이므로 합치지 않고,
+        보류된 쪽이 partial_reset이면 그 표시를 새 이벤트로 넘긴다.
+        """
+        nonlocal overflow
+        if overflow is not None:
+            earlier = overflow.get("partial")
+            if earlier and not event.get("partial_reset"):
+                event["partial"] = earlier + event.get("partial", [])
+            if overflow.get("partial_reset"):
+                event["partial_reset"] = True
+            overflow = None
         try:
             queue.put_nowait(event)
-        except Exception:
-            pass  # queue full — 무시 (progress는 best-effort)
-
-    try:
-        if force_provider:
+        except _asyncio.QueueFull:
+            overflow = event
+
+    async def _put_final(event):
+        """complete/error 이벤트를 넣는다. 보류된 progress(partial)가 있으면 먼저 보낸다."""
+        nonlocal overflow
+        if overflow is not None:
+            pending, overflow = overflow, None
+            await queue.put(pending)
+        await queue.put(event)
+
+    async def _stream_once(max_tokens: int, use_force: bool) -> dict:
+        """call_stream 1회 호출 + JSON 파싱. 시도마다 partial 추출 상태를 초기화한다.
+
+        앞 시도가 partial을 보냈으면 새 시도를 시작하기 전에 partial_reset을 보낸다.
+        새 시도는 처음부터 다시 응답하므로, 리셋 없이는 같은 항목이 두 번 쌓인다.
+        """
+        nonlocal extractor, partial_sent
+        extractor = None
+        if partial_sent:
+            partial_sent = False
+            _put_progress({"type": "progress", "partial_reset": True})
+        if use_force:
             response = await router.call_stream(
                 user_prompt,
                 system=system_prompt,
@@ -608,7 +1032,7 @@ async def _call_llm_text_stream(purpose: str, text: str,
                 force_provider=force_provider,
                 force_model=force_model,
                 purpose=purpose,
-                max_tokens=_MAX_TOKENS,
+                max_tokens=max_tokens,
                 progress_callback=_progress_cb,
             )
         else:
@@ -618,14 +1042,16 @@ async def _call_llm_text_stream(purpose: str, text: str,
                 system=system_prompt,
                 response_format=_RESPONSE_FORMAT,
                 purpose=purpose,
-                max_tokens=_MAX_TOKENS,
+                max_tokens=max_tokens,
                 progress_callback=_progress_cb,
             )
-
         # JSON 파싱 (_parse_llm_json 재사용)
-        result = _parse_llm_json(response, _json)
+        return _parse_llm_json(response, _json)
+
+    try:
+        result = await _stream_once(_MAX_TOKENS, bool(force_provider))
         _set_cached_llm_result(cache_key, result)
-        await queue.put({"type": "complete", "result": result})
+        await _put_final({"type": "complete", "result": result})
         return
 
     except Exception as e:
@@ -635,29 +1061,9 @@ async def _call_llm_text_stream(purpose: str, text: str,
                 try:
                     max_tokens = _next_retry_max_tokens(purpose, max_tokens)
                     await _asyncio.sleep(0.6 + ((_attempt - 1) * 0.4))
-                    if force_provider:
-                        response = await router.call_stream(
-                            user_prompt,
-                            system=system_prompt,
-                            response_format=_RESPONSE_FORMAT,
-                            force_provider=force_provider,
-                            force_model=force_model,
-                            purpose=purpose,
-                            max_tokens=max_tokens,
-                            progress_callback=_progress_cb,
-                        )
-                    else:
-                        response = await router.call_stream(
-                            user_prompt,
-                            system=system_prompt,
-                            response_format=_RESPONSE_FORMAT,
-                            purpose=purpose,
-                            max_tokens=max_tokens,
-                            progress_callback=_progress_cb,
-                        )
-                    result = _parse_llm_json(response, _json)
+                    result = await _stream_once(max_tokens, bool(force_provider))
                     _set_cached_llm_result(cache_key, result)
-                    await queue.put({"type": "complete", "result": result})
+                    await _put_final({"type": "complete", "result": result})
                     return
                 except Exception as re:
                     retry_error = re
@@ -665,24 +1071,90 @@ async def _call_llm_text_stream(purpose: str, text: str,
             if force_provider:
                 try:
                     logger.warning(
-                        f"LLM stream {purpose} forced provider fallback to auto providers: {force_provider}"
-                    )
-                    response = await router.call_stream(
-                        user_prompt,
-                        system=system_prompt,
-                        response_format=_RESPONSE_FORMAT,
-                        purpose=purpose,
-                        max_tokens=max_tokens,
-                        progress_callback=_progress_cb,
+                        f"LLM stream {purpose} forced provider fallback "
+                        f"to auto providers: {force_provider}"
                     )
-                    result = _parse_llm_json(response, _json)
+                    result = await _stream_once(max_tokens, False)
                     _set_cached_llm_result(cache_key, result)
-                    await queue.put({"type": "complete", "result": result})
+                    await _put_final({"type": "complete", "result": result})
                     return
                 except Exception as auto_e:
                     e = auto_e
         logger.error(f"LLM stream {purpose} 실패: {e}")
-        await queue.put({"type": "error", "error": str(e)})
+        await _put_final({"type": "error", "error": str(e)})
+
+
+# 스트리밍 중 "partial"로 미리 내보낼 배열 키 (purpose → JSON 키)
+_STREAM_PARTIAL_KEYS = {
+    "punctuation": "marks",
+    "annotation": "annotations",
+}
+
+
+class _StreamingArrayExtractor:
+    """스트리밍 중인 LLM JSON 텍스트에서 완성된 배열 항목을 점진적으로 꺼낸다.
+
+    왜 필요한가:
+        주석·표점 결과는 {"annotations": [{...}, {...}]} 형태라
+        응답 전체가 끝나기 전에도 앞쪽 항목은 이미 완성되어 있다.
+        완성된 항목부터 내보내면 사용자가 첫 결과를 더 빨리 볼 수 있다.
+
+    동작:
+        feed()로 텍스트 조각을 받을 때마다 배열 시작('[') 이후에서
+        raw_decode로 완성된 dict 항목만 꺼낸다. 이미 꺼낸 부분은 버퍼에서 잘라내므로
+        메모리는 미완성 항목 하나 크기로 유지된다.
+        최종 결과는 여전히 complete 이벤트의 파싱 결과가 기준이다 (partial은 미리보기).
+    """
+
+    def __init__(self, key: str, provider: str | None = None):
+        self.key = key
+        self.provider = provider
+        self._buf = ""
+        self._in_array = False
+        self._closed = False
+        self._decoder = json.JSONDecoder()
+
+    def feed(self, chunk: str) -> list[dict]:
+        """텍스트 조각을 추가하고, 새로 완성된 배열 항목 목록을 반환한다."""
+        if self._closed:
+            return []
+        self._buf += chunk
+
+        if not self._in_array:
+            key_pos = self._buf.find(f'"{self.key}"')
+            if key_pos < 0:
+                return []
+            arr_start = self._buf.find("[", key_pos)
+            if arr_start < 0:
+                return []
+            self._buf = self._buf[arr_start + 1:]
+            self._in_array = True
+
+        items: list[dict] = []
+        buf = self._buf
+        i = 0
+        n = len(buf)
+        while i < n:
+            ch = buf[i]
+            if ch in " \r\n\t,":
+                i += 1
+                continue
+            if ch == "]":
+                self._closed = True
+                break
+            if ch != "{":
+                i += 1
+                continue
+            try:
+                obj, i = self._decoder.raw_decode(buf, i)
+            except json.JSONDecodeError:
+                break  # 아직 항목이 완성되지 않음 — 다음 조각을 기다린다
+            if isinstance(obj, dict):
+                items.append(obj)
+
+        self._buf = buf[i:]
+        return items
+
 
 def _salvage_truncated_array_payload(raw: str, key: str, _json) -> dict | None:
     """Recover completed dict items from a truncated JSON array payload."""
@@ -756,7 +1228,7 @@ def _parse_llm_json(response, _json) -> dict:
     # thinking 모델의 사고 과정 제거:
     #   1. <think>...</think> 태그 (Ollama kimi-k2.5, qwq 등)
     #   2. Gemini thinking 유출: JSON 없이 추론 텍스트만 반환되는 경우
-    raw = re.sub(r'<think>.*?</think>', '', raw, flags=re.DOTALL).strip()
+    raw = _THINK_TAG_PATTERN.sub('', raw).strip()
 
     # thinking 태그 제거 후 빈 응답이 되는 경우 (사고만 하고 출력 없음)
     if not raw:
@@ -875,7 +1347,7 @@ def _parse_llm_json(response, _json) -> dict:  # type: ignore[no-redef]
             f"{response.provider}({response.model}) returned empty response."
         )
 
-    raw = re.sub(r"<think>.*?</think>", "", raw, flags=re.DOTALL).strip()
+    raw = _THINK_TAG_PATTERN.sub("", raw).strip()
     if not raw:
         raise ValueError(f"{response.provider}({response.model}) returned thinking-only output.")
 
@@ -895,6 +1367,17 @@ def _parse_llm_json(response, _json) -> dict:  # type: ignore[no-redef]
         try:
             return _json.loads(candidate)
         except _json.JSONDecodeError:
+            # 첫 '{'부터 raw_decode — JSON 객체가 끝나는 지점에서 멈추므로
+            # 뒤에 붙은 설명문이나 문자열 안의 '}'에 영향을 받지 않는다.
+            first = candidate.find("{")
+            if first >= 0:
+                try:
+                    obj, _end = _json.JSONDecoder().raw_decode(candidate, first)
+                    if isinstance(obj, dict):
+                        return obj
+                except _json.JSONDecodeError:
+                    pass
+
             start = candidate.rfind('{"')
             if start < 0:
                 start = candidate.find("{")
@@ -8,17 +8,32 @@ OCR 결과(L2)와 확정 텍스트(L4) 대조, 이체자 사전 관리(다중 
     정렬/이체자/일괄교정 기능은 독립적이므로 별도 라우터로 분리한다.
 """
 
+import asyncio
+import logging
 import os
 import re
 import shutil
-import subprocess
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
 
 from fastapi import APIRouter, BackgroundTasks
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from starlette.responses import Response
 
+try:
+    from send2trash import send2trash
+except ImportError:  # pyproject 의존성이지만, 빠진 환경에서도 resources/.trash/로 옮긴다
+    send2trash = None
+
 from app._state import get_library_path
+from core.alignment import VariantCharDict, align_page
+from core.document import apply_batch_corrections, git_commit_document, search_char_in_pages
+from core.json_io import JSONDecodeError, dumps, read_json
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["alignment"])
 
@@ -28,21 +43,33 @@ router = APIRouter(tags=["alignment"])
 # ===========================================================================
 # resources/ 폴더에 여러 사전 파일이 공존할 수 있다.
 # 활성 사전 이름은 resources/.active_variant_dict 에 기록.
-_variant_dict = None
-_variant_dict_name: str | None = None  # 현재 로드된 사전 파일명
+# 로드된 사전 캐시: {사전 이름: (파일 mtime_ns, VariantCharDict)}
+# 다중 사전 API를 번갈아 호출해도 매번 JSON을 다시 파싱하지 않도록 여러 개를 보관한다.
+# 파일 mtime이 바뀌면(외부 수정) 해당 항목만 다시 로드한다.
+_vd_cache: OrderedDict = OrderedDict()
+_VD_CACHE_MAX_SIZE = 8
 
+# 추가 로그가 본 사전 파일 크기의 이 비율을 넘으면 전체 저장으로 압축한다.
+_VARIANT_LOG_COMPACT_RATIO = 0.1
+_save_lock = threading.Lock()
 
-def _get_resources_dir() -> str:
-    """resources/ 디렉토리의 절대 경로를 반환한다.
+# 사전 이름 규칙. $는 끝의 개행 하나를 허용하므로("variant_a\n") \Z로 끝을 고정한다.
+_VARIANT_NAME_RE = re.compile(r"^variant_[a-zA-Z0-9_\-]+\Z")
+_active_name_cache: tuple[int, str] | None = None  # (마커 mtime_ns, 활성 사전 이름)
 
-    왜 3단계 상위인가:
-        이 파일은 src/app/routers/alignment.py에 위치한다.
-        routers/ → app/ → src/ → 프로젝트루트 (3단계)
-        resources/는 프로젝트 루트에 있으므로 3번 올라가야 한다.
-    """
-    return os.path.abspath(
-        os.path.join(os.path.dirname(__file__), "..", "..", "..", "resources")
-    )
+
+# 왜 parents[3]인가:
+#     이 파일은 src/app/routers/alignment.py에 위치한다.
+#     routers/ → app/ → src/ → 프로젝트루트 (3단계)
+#     resources/는 프로젝트 루트에 있으므로 3번 올라가야 한다.
+# 프로세스 수명 동안 바뀌지 않으므로 import 시 한 번만 계산한다.
+_RESOURCES_DIR = Path(__file__).resolve().parents[3] / "resources"
+_ACTIVE_MARKER = _RESOURCES_DIR / ".active_variant_dict"
+
+
+def _get_resources_dir() -> Path:
+    """resources/ 디렉토리의 절대 경로를 반환한다."""
+    return _RESOURCES_DIR
 
 
 def _get_active_dict_name() -> str:
@@ -50,78 +77,236 @@ def _get_active_dict_name() -> str:
 
     resources/.active_variant_dict 파일에 기록된 이름을 읽는다.
     파일이 없으면 기본값 'variant_chars'를 반환한다.
+
+    왜 mtime으로 캐시하는가:
+        사전 API는 매 요청마다 이 함수를 부른다.
+        마커 파일은 거의 바뀌지 않으므로 os.stat 한 번으로 변경 여부만 확인하고,
+        바뀌었을 때만 다시 읽는다. (외부에서 파일을 고쳐도 반영된다)
     """
-    marker = os.path.join(_get_resources_dir(), ".active_variant_dict")
-    if os.path.exists(marker):
-        with open(marker, "r", encoding="utf-8") as f:
-            name = f.read().strip()
-            if name:
-                return name
-    return "variant_chars"
+    global _active_name_cache
+    marker = _ACTIVE_MARKER
+    try:
+        mtime = marker.stat().st_mtime_ns
+    except FileNotFoundError:
+        return "variant_chars"
+
+    cached = _active_name_cache
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    # 수십 바이트짜리 파일이므로 read_text 한 번으로 읽는다.
+    name = marker.read_text(encoding="utf-8").strip() or "variant_chars"
+    _active_name_cache = (mtime, name)
+    return name
 
 
 def _set_active_dict_name(name: str) -> None:
     """활성 이체자 사전 이름을 저장한다."""
-    marker = os.path.join(_get_resources_dir(), ".active_variant_dict")
-    with open(marker, "w", encoding="utf-8") as f:
-        f.write(name)
+    global _active_name_cache
+    _ACTIVE_MARKER.write_text(name, encoding="utf-8")
+    # mtime 해상도가 낮은 파일시스템에서 같은 mtime이 나올 수 있으므로 명시적으로 비운다.
+    _active_name_cache = None
 
 
-def _dict_name_to_path(name: str) -> str:
+def _dict_name_to_path(name: str) -> Path:
     """사전 이름을 파일 경로로 변환한다. 예: 'variant_chars' → '.../resources/variant_chars.json'"""
-    return os.path.join(_get_resources_dir(), f"{name}.json")
+    return _RESOURCES_DIR / f"{name}.json"
+
+
+def _sidecar_path(path: Path, suffix: str) -> Path:
+    """사전 파일 옆의 보조 파일 경로. 예: variant_chars.json → variant_chars.json.log"""
+    return path.with_name(path.name + suffix)
+
 
+def _file_mtime_ns(path: Path) -> int | None:
+    """파일의 mtime(ns)을 반환한다. 파일이 없으면 None."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _file_size(path: Path) -> int | None:
+    """파일 크기(bytes)를 반환한다. 파일이 없으면 None."""
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return None
+
+
+def _compact_variant_log(name: str) -> None:
+    """추가 로그가 남아 있으면 본 파일에 합친다.
+
+    복제·삭제는 JSON 파일 하나만 다루므로, 그 전에 로그 내용을 본 파일로 옮겨 둔다.
+    """
+    path = _dict_name_to_path(name)
+    with _save_lock:
+        if _sidecar_path(path, ".log").exists():
+            _get_variant_dict(name).save(path)
+
+
+def _move_to_trash(path: Path) -> None:
+    """파일을 OS 휴지통으로 옮긴다. 실패하면 resources/.trash/로 옮긴다.
 
-def _get_variant_dict(name: str | None = None):
+    send2trash는 OS 휴지통 API를 프로세스 안에서 직접 호출한다.
+    (예전처럼 PowerShell을 띄우면 기동만으로 수백 ms가 걸렸다)
+    """
+    if send2trash is not None:
+        try:
+            send2trash(os.fspath(path))
+            return
+        except Exception as e:
+            logger.warning("휴지통 이동 실패, 이름 변경으로 대체: %s — %s", path, e)
+    # send2trash가 없거나 실패하면 — resources/.trash/ 로 옮긴다.
+    # 같은 이름을 여러 번 지워도 덮어쓰지 않도록 시각을 붙인다.
+    trash_dir = _RESOURCES_DIR / ".trash"
+    trash_dir.mkdir(exist_ok=True)
+    path.replace(trash_dir / f"{path.name}.{int(time.time())}")
+
+
+def _cache_variant_dict(name: str, mtime: int | None, vd) -> None:
+    """사전을 캐시에 넣고, 상한을 넘으면 가장 오래된 항목부터 버린다."""
+    _vd_cache[name] = (mtime, vd)
+    _vd_cache.move_to_end(name)
+    while len(_vd_cache) > _VD_CACHE_MAX_SIZE:
+        _vd_cache.popitem(last=False)
+
+
+def _get_variant_dict(name: str | None = None, *, missing_ok: bool = False):
     """이체자 사전을 로드한다.
 
     name이 None이면 활성 사전을 로드한다.
-    이미 같은 이름이 로드되어 있으면 캐시를 반환한다.
-    """
-    global _variant_dict, _variant_dict_name
-    from core.alignment import VariantCharDict
+    같은 이름이 로드되어 있고 파일 mtime이 그대로면 캐시를 반환한다.
 
+    사전 파일이 없으면 FileNotFoundError를 던진다.
+    엔드포인트가 os.path.exists로 먼저 확인하고 다시 로드하는 대신,
+    로드 한 번으로 존재 확인까지 끝내기 위해서다.
+    missing_ok=True면 빈 사전을 돌려준다 (기존 활성 사전 API — 첫 저장 때 파일이 생긴다).
+    """
     if name is None:
         name = _get_active_dict_name()
 
-    # 캐시된 사전과 같은 이름이면 그대로 반환
-    if _variant_dict is not None and _variant_dict_name == name:
-        return _variant_dict
-
     path = _dict_name_to_path(name)
-    _variant_dict = VariantCharDict(dict_path=path)
-    _variant_dict_name = name
-    return _variant_dict
+    mtime = _file_mtime_ns(path)
+    if mtime is None and not missing_ok:
+        raise FileNotFoundError(path)
+
+    cached = _vd_cache.get(name)
+    if cached is not None and cached[0] == mtime:
+        _vd_cache.move_to_end(name)
+        return cached[1]
+
+    vd = VariantCharDict(dict_path=path)
+    _cache_variant_dict(name, mtime, vd)
+    return vd
+
 
+def _save_variant_dict(vd, name: str | None = None) -> Path:
+    """이체자 사전을 파일로 저장하고 경로를 반환한다.
 
-def _save_variant_dict(vd, name: str | None = None) -> str:
-    """이체자 사전을 파일로 저장하고 경로를 반환한다."""
+    추가만 있었으면 새 쌍을 추가 로그({name}.json.log)에 덧붙이고 끝낸다.
+    쌍 몇 개 때문에 수천 항목짜리 JSON 전체를 다시 쓰지 않기 위해서다.
+    삭제가 있었거나, 로그가 본 파일 크기의 _VARIANT_LOG_COMPACT_RATIO를 넘으면
+    전체 저장(VariantCharDict.save — 임시 파일 + os.replace로 원자적)으로 압축한다.
+
+    저장 직후의 mtime으로 캐시 항목을 갱신하여(write-through),
+    다음 요청이 방금 쓴 파일을 다시 파싱하지 않게 한다.
+    """
     if name is None:
         name = _get_active_dict_name()
     path = _dict_name_to_path(name)
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    vd.save(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # 변경 API는 저장을 BackgroundTasks(스레드풀)로 넘기므로
+    # 같은 사전의 저장이 겹치지 않도록 직렬화한다.
+    with _save_lock:
+        base_size = _file_size(path)
+        if base_size is None or vd.needs_full_save:
+            vd.save(path)
+        else:
+            log_size = vd.append_log(path)
+            if log_size > base_size * _VARIANT_LOG_COMPACT_RATIO:
+                vd.save(path)
+        mtime = _file_mtime_ns(path)
+        _cache_variant_dict(name, mtime, vd)
+        _write_dict_meta(path, vd, mtime)
     return path
 
 
+def _write_dict_meta(path: Path, vd, mtime: int | None) -> None:
+    """사전 옆에 크기 정보 사이드카({name}.json.meta)를 기록한다.
+
+    왜 사이드카인가:
+        사전 목록에 글자 수/쌍 수를 보여주려면 원래 모든 사전 JSON을 파싱해야 한다.
+        수십 바이트짜리 메타 파일을 따로 두면 목록 API는 작은 파일만 읽는다.
+        mtime_ns를 함께 적어 두어, 사전이 외부에서 고쳐졌으면 낡은 메타로 판단한다.
+    """
+    meta = {"size": vd.size, "pair_count": vd.pair_count, "mtime_ns": mtime}
+    try:
+        _sidecar_path(path, ".meta").write_bytes(dumps(meta))
+    except OSError as e:
+        # 메타는 캐시일 뿐이므로 실패해도 저장 자체는 성공으로 본다.
+        logger.warning("이체자 사전 메타 기록 실패: %s — %s", path, e)
+
+
+def _read_dict_meta(name: str) -> dict:
+    """사전의 size/pair_count를 반환한다.
+
+    메타 사이드카가 있고 사전 파일 mtime과 일치하면 그것을 쓰고,
+    없거나 낡았으면 사전을 로드해 계산한 뒤 메타를 다시 기록한다.
+
+    목록 API가 스레드풀에서 부르므로 _vd_cache는 건드리지 않는다.
+    (목록을 한 번 훑는 것만으로 지금 쓰는 사전이 캐시에서 밀려나지 않게 하려는 것도 있다)
+    사전 파일이 깨져 있으면 목록 전체를 실패시키지 않고 size/pair_count를 None으로 둔다.
+    """
+    path = _dict_name_to_path(name)
+    mtime = _file_mtime_ns(path)
+    try:
+        meta = read_json(_sidecar_path(path, ".meta"))
+        if meta.get("mtime_ns") == mtime:
+            return {"size": meta["size"], "pair_count": meta["pair_count"]}
+    except (OSError, JSONDecodeError, KeyError, AttributeError):
+        pass
+
+    try:
+        vd = VariantCharDict(dict_path=path)
+    except (OSError, ValueError, AttributeError, TypeError) as e:
+        logger.warning("이체자 사전 로드 실패: %s — %s", path, e)
+        return {"size": None, "pair_count": None}
+    _write_dict_meta(path, vd, mtime)
+    return {"size": vd.size, "pair_count": vd.pair_count}
+
+
 def _list_variant_dicts() -> list[dict]:
     """resources/ 폴더의 이체자 사전 파일 목록을 반환한다.
 
     variant_chars*.json 패턴에 맞는 파일만 포함한다.
-    반환: [{"name": "variant_chars", "path": "...", "active": True}, ...]
+    반환: [{"name": "variant_chars", "file": "...", "active": True,
+            "size": 123, "pair_count": 45}, ...]
     """
-    import glob as glob_mod
     resources = _get_resources_dir()
     active = _get_active_dict_name()
     result = []
     # variant_ 로 시작하는 JSON 파일 탐색
-    for path in sorted(glob_mod.glob(os.path.join(resources, "variant_*.json"))):
-        basename = os.path.basename(path)
-        name = basename.rsplit(".json", 1)[0]
+    # glob 대신 scandir + 접두/접미사 비교: fnmatch 정규식 없이 DirEntry.name만 본다.
+    try:
+        with os.scandir(resources) as it:
+            filenames = sorted(
+                e.name for e in it
+                if e.name.startswith("variant_")
+                and e.name.endswith(".json")
+                and e.is_file(follow_symlinks=False)
+            )
+    except FileNotFoundError:
+        return result
+
+    for filename in filenames:
+        name = filename[:-len(".json")]
         result.append({
             "name": name,
-            "file": basename,
+            "file": filename,
             "active": name == active,
+            **_read_dict_meta(name),
         })
     return result
 
@@ -198,9 +383,7 @@ async def api_run_alignment(
             status_code=404,
         )
 
-    from core.alignment import align_page
-
-    variant_dict = _get_variant_dict()
+    variant_dict = _get_variant_dict(missing_ok=True)
 
     try:
         block_results = align_page(
@@ -242,7 +425,7 @@ async def api_run_alignment(
 @router.get("/api/alignment/variant-dict")
 async def api_get_variant_dict():
     """활성 이체자 사전 내용을 반환한다. (기존 API 호환)"""
-    variant_dict = _get_variant_dict()
+    variant_dict = _get_variant_dict(missing_ok=True)
     return {
         "variants": variant_dict.to_dict(),
         "size": variant_dict.size,
@@ -252,9 +435,10 @@ async def api_get_variant_dict():
 
 
 @router.post("/api/alignment/variant-dict")
-async def api_add_variant_pair(body: VariantPairRequest):
+async def api_add_variant_pair(body: VariantPairRequest, background_tasks: BackgroundTasks):
     """활성 사전에 이체자 쌍을 추가한다. (기존 API 호환)"""
-    variant_dict = _get_variant_dict()
+    active = _get_active_dict_name()
+    variant_dict = _get_variant_dict(active, missing_ok=True)
 
     if not body.char_a or not body.char_b:
         return JSONResponse({"error": "두 글자 모두 입력해야 합니다."}, status_code=400)
@@ -262,14 +446,15 @@ async def api_add_variant_pair(body: VariantPairRequest):
         return JSONResponse({"error": "같은 글자는 이체자로 등록할 수 없습니다."}, status_code=400)
 
     variant_dict.add_pair(body.char_a, body.char_b)
-    _save_variant_dict(variant_dict)
+    background_tasks.add_task(_save_variant_dict, variant_dict, active)
     return {"status": "ok", "size": variant_dict.size}
 
 
 @router.delete("/api/alignment/variant-dict")
-async def api_delete_variant_pair(body: VariantPairRequest):
+async def api_delete_variant_pair(body: VariantPairRequest, background_tasks: BackgroundTasks):
     """활성 사전에서 이체자 쌍을 삭제한다."""
-    variant_dict = _get_variant_dict()
+    active = _get_active_dict_name()
+    variant_dict = _get_variant_dict(active, missing_ok=True)
 
     if not body.char_a or not body.char_b:
         return JSONResponse({"error": "두 글자 모두 입력해야 합니다."}, status_code=400)
@@ -278,23 +463,26 @@ async def api_delete_variant_pair(body: VariantPairRequest):
     if not removed:
         return JSONResponse({"error": "해당 이체자 쌍이 존재하지 않습니다."}, status_code=404)
 
-    _save_variant_dict(variant_dict)
+    background_tasks.add_task(_save_variant_dict, variant_dict, active)
     return {"status": "ok", "removed": True, "size": variant_dict.size}
 
 
 @router.post("/api/alignment/variant-dict/import")
-async def api_import_variant_dict(body: VariantImportRequest):
+async def api_import_variant_dict(
+    body: VariantImportRequest, background_tasks: BackgroundTasks
+):
     """활성 사전에 이체자 데이터를 대량 가져온다. (기존 API 호환)"""
     if not body.text or not body.text.strip():
         return JSONResponse(
             {"error": "가져올 데이터가 비어 있습니다."}, status_code=400
         )
 
-    variant_dict = _get_variant_dict()
+    active = _get_active_dict_name()
+    variant_dict = _get_variant_dict(active, missing_ok=True)
     result = variant_dict.import_bulk(body.text, body.format)
 
     if result["added"] > 0:
-        _save_variant_dict(variant_dict)
+        background_tasks.add_task(_save_variant_dict, variant_dict, active)
 
     return {
         "status": "ok",
@@ -311,19 +499,21 @@ async def api_import_variant_dict(body: VariantImportRequest):
 async def api_list_variant_dicts():
     """resources/ 폴더의 이체자 사전 목록을 반환한다.
 
-    출력: { "dicts": [{"name": "variant_chars", "file": "variant_chars.json", "active": true}] }
+    출력: { "dicts": [{"name": "variant_chars", "file": "variant_chars.json", "active": true,
+                       "size": 123, "pair_count": 45}] }
+          메타가 없는 사전은 파싱해야 하므로 이벤트 루프 밖(스레드)에서 만든다.
+          읽을 수 없는 사전은 size/pair_count가 null이다.
     """
-    return {"dicts": _list_variant_dicts()}
+    return {"dicts": await asyncio.to_thread(_list_variant_dicts)}
 
 
 @router.get("/api/variant-dicts/{name}")
 async def api_get_variant_dict_by_name(name: str):
     """특정 이름의 이체자 사전 내용을 반환한다."""
-    path = _dict_name_to_path(name)
-    if not os.path.exists(path):
+    try:
+        vd = _get_variant_dict(name)
+    except FileNotFoundError:
         return JSONResponse({"error": f"사전을 찾을 수 없습니다: {name}"}, status_code=404)
-
-    vd = _get_variant_dict(name)
     return {
         "name": name,
         "variants": vd.to_dict(),
@@ -333,29 +523,41 @@ async def api_get_variant_dict_by_name(name: str):
     }
 
 
-@router.post("/api/variant-dicts")
-async def api_create_variant_dict(body: CreateDictRequest):
-    """빈 이체자 사전을 새로 생성한다.
+def _normalize_new_dict_name(raw: str):
+    """새 사전 이름을 정규화하고 검증한다 (생성·복제 공용).
 
-    이름은 자동으로 'variant_' 접두사가 붙는다.
-    예: 'kangxi' → 'variant_kangxi'
+    'variant_' 접두사가 없으면 붙인다. 예: 'kangxi' → 'variant_kangxi'
+    출력: (이름, 사전 파일 경로) 또는 에러 JSONResponse
+          (형식 오류 400, 이미 존재 409).
     """
-    # variant_ 접두사 자동 추가
-    raw_name = body.name.strip()
-    if not raw_name.startswith("variant_"):
-        raw_name = f"variant_{raw_name}"
+    name = raw.strip()
+    if not name.startswith("variant_"):
+        name = f"variant_{name}"
 
-    if not re.match(r'^variant_[a-zA-Z0-9_\-]+$', raw_name):
+    if not _VARIANT_NAME_RE.match(name):
         return JSONResponse(
             {"error": "사전 이름은 영문, 숫자, 밑줄, 하이픈만 사용할 수 있습니다."},
             status_code=400,
         )
 
-    path = _dict_name_to_path(raw_name)
-    if os.path.exists(path):
-        return JSONResponse({"error": f"이미 존재하는 사전입니다: {raw_name}"}, status_code=409)
+    path = _dict_name_to_path(name)
+    if path.exists():
+        return JSONResponse({"error": f"이미 존재하는 사전입니다: {name}"}, status_code=409)
+    return name, path
+
+
+@router.post("/api/variant-dicts")
+async def api_create_variant_dict(body: CreateDictRequest):
+    """빈 이체자 사전을 새로 생성한다.
+
+    이름은 자동으로 'variant_' 접두사가 붙는다.
+    예: 'kangxi' → 'variant_kangxi'
+    """
+    normalized = _normalize_new_dict_name(body.name)
+    if isinstance(normalized, JSONResponse):
+        return normalized
+    raw_name, path = normalized
 
-    from core.alignment import VariantCharDict
     vd = VariantCharDict(dict_path=None)  # 빈 사전
     vd.save(path)
     return {"status": "ok", "name": raw_name}
@@ -364,24 +566,16 @@ async def api_create_variant_dict(body: CreateDictRequest):
 @router.post("/api/variant-dicts/{name}/copy")
 async def api_copy_variant_dict(name: str, body: CopyDictRequest):
     """기존 사전을 새 이름으로 복제한다."""
-    new_name = body.new_name.strip()
-    if not new_name.startswith("variant_"):
-        new_name = f"variant_{new_name}"
-
-    if not re.match(r'^variant_[a-zA-Z0-9_\-]+$', new_name):
-        return JSONResponse(
-            {"error": "사전 이름은 영문, 숫자, 밑줄, 하이픈만 사용할 수 있습니다."},
-            status_code=400,
-        )
-
     src_path = _dict_name_to_path(name)
-    if not os.path.exists(src_path):
+    if not src_path.exists():
         return JSONResponse({"error": f"원본 사전을 찾을 수 없습니다: {name}"}, status_code=404)
 
-    dst_path = _dict_name_to_path(new_name)
-    if os.path.exists(dst_path):
-        return JSONResponse({"error": f"이미 존재하는 사전입니다: {new_name}"}, status_code=409)
+    normalized = _normalize_new_dict_name(body.new_name)
+    if isinstance(normalized, JSONResponse):
+        return normalized
+    new_name, dst_path = normalized
 
+    _compact_variant_log(name)
     shutil.copy2(src_path, dst_path)
     return {"status": "ok", "name": new_name}
 
@@ -400,22 +594,19 @@ async def api_delete_variant_dict(name: str):
         )
 
     path = _dict_name_to_path(name)
-    if not os.path.exists(path):
+    if not path.exists():
         return JSONResponse({"error": f"사전을 찾을 수 없습니다: {name}"}, status_code=404)
 
+    _compact_variant_log(name)
+    _vd_cache.pop(name, None)
+
     # 휴지통으로 이동 (CLAUDE.md: 영구 삭제 금지)
-    try:
-        subprocess.run(
-            ["powershell", "-Command",
-             f"Add-Type -AssemblyName Microsoft.VisualBasic; "
-             f"[Microsoft.VisualBasic.FileIO.FileSystem]::DeleteFile("
-             f"'{path}', 'OnlyErrorDialogs', 'SendToRecycleBin')"],
-            check=True, capture_output=True,
-        )
-    except Exception:
-        # PowerShell 실패 시 (Linux 등) — 이름 변경으로 "삭제"
-        trash_path = path + ".deleted"
-        os.rename(path, trash_path)
+    # 크기 메타 사이드카(.json.meta)도 함께 옮긴다. 남겨 두면 같은 이름으로 새 사전을
+    # 만들 때까지 고아 파일로 남는다. (추가 로그는 위 _compact_variant_log가 이미 합쳤다)
+    _move_to_trash(path)
+    meta_path = _sidecar_path(path, ".meta")
+    if meta_path.exists():
+        _move_to_trash(meta_path)
 
     return {"status": "ok", "deleted": name}
 
@@ -424,66 +615,71 @@ async def api_delete_variant_dict(name: str):
 async def api_activate_variant_dict(name: str):
     """지정한 사전을 활성 사전으로 설정한다."""
     path = _dict_name_to_path(name)
-    if not os.path.exists(path):
+    if not path.exists():
         return JSONResponse({"error": f"사전을 찾을 수 없습니다: {name}"}, status_code=404)
 
     _set_active_dict_name(name)
 
-    # 캐시 무효화 → 다음 _get_variant_dict() 호출 시 새 사전 로드
-    global _variant_dict, _variant_dict_name
-    _variant_dict = None
-    _variant_dict_name = None
+    # 사전 캐시는 이름별로 보관되므로 활성 사전이 바뀌어도 비울 필요가 없다.
+    # 활성 이름 캐시만 비워서 다음 _get_variant_dict() 호출이 새 사전을 가리키게 한다.
+    global _active_name_cache
+    _active_name_cache = None
 
     return {"status": "ok", "active": name}
 
 
 @router.post("/api/variant-dicts/{name}/pair")
-async def api_add_pair_to_dict(name: str, body: VariantPairRequest):
+async def api_add_pair_to_dict(
+    name: str, body: VariantPairRequest, background_tasks: BackgroundTasks
+):
     """지정한 사전에 이체자 쌍을 추가한다."""
-    path = _dict_name_to_path(name)
-    if not os.path.exists(path):
+    try:
+        vd = _get_variant_dict(name)
+    except FileNotFoundError:
         return JSONResponse({"error": f"사전을 찾을 수 없습니다: {name}"}, status_code=404)
     if not body.char_a or not body.char_b:
         return JSONResponse({"error": "두 글자 모두 입력해야 합니다."}, status_code=400)
     if body.char_a == body.char_b:
         return JSONResponse({"error": "같은 글자는 이체자로 등록할 수 없습니다."}, status_code=400)
 
-    vd = _get_variant_dict(name)
     vd.add_pair(body.char_a, body.char_b)
-    _save_variant_dict(vd, name)
+    background_tasks.add_task(_save_variant_dict, vd, name)
     return {"status": "ok", "size": vd.size}
 
 
 @router.delete("/api/variant-dicts/{name}/pair")
-async def api_delete_pair_from_dict(name: str, body: VariantPairRequest):
+async def api_delete_pair_from_dict(
+    name: str, body: VariantPairRequest, background_tasks: BackgroundTasks
+):
     """지정한 사전에서 이체자 쌍을 삭제한다."""
-    path = _dict_name_to_path(name)
-    if not os.path.exists(path):
+    try:
+        vd = _get_variant_dict(name)
+    except FileNotFoundError:
         return JSONResponse({"error": f"사전을 찾을 수 없습니다: {name}"}, status_code=404)
-
-    vd = _get_variant_dict(name)
     removed = vd.remove_pair(body.char_a, body.char_b)
     if not removed:
         return JSONResponse({"error": "해당 이체자 쌍이 존재하지 않습니다."}, status_code=404)
 
-    _save_variant_dict(vd, name)
+    background_tasks.add_task(_save_variant_dict, vd, name)
     return {"status": "ok", "removed": True, "size": vd.size}
 
 
 @router.post("/api/variant-dicts/{name}/import")
-async def api_import_to_dict(name: str, body: VariantImportRequest):
+async def api_import_to_dict(
+    name: str, body: VariantImportRequest, background_tasks: BackgroundTasks
+):
     """지정한 사전에 이체자 데이터를 대량 가져온다."""
-    path = _dict_name_to_path(name)
-    if not os.path.exists(path):
+    try:
+        vd = _get_variant_dict(name)
+    except FileNotFoundError:
         return JSONResponse({"error": f"사전을 찾을 수 없습니다: {name}"}, status_code=404)
     if not body.text or not body.text.strip():
         return JSONResponse({"error": "가져올 데이터가 비어 있습니다."}, status_code=400)
 
-    vd = _get_variant_dict(name)
     result = vd.import_bulk(body.text, body.format)
 
     if result["added"] > 0:
-        _save_variant_dict(vd, name)
+        background_tasks.add_task(_save_variant_dict, vd, name)
 
     return {
         "status": "ok",
@@ -494,31 +690,45 @@ async def api_import_to_dict(name: str, body: VariantImportRequest):
     }
 
 
+def _iter_csv_chunks(vd, rows_per_chunk: int = 1000):
+    """사전 CSV를 rows_per_chunk 행씩 묶어 UTF-8 bytes로 내보낸다.
+
+    행마다 전송하면 ASGI send 호출이 수천 번 일어나므로 적당히 묶는다.
+    """
+    batch = []
+    for row in vd.iter_csv_rows():
+        batch.append(row)
+        if len(batch) >= rows_per_chunk:
+            yield ("\n".join(batch) + "\n").encode("utf-8")
+            batch.clear()
+    if batch:
+        yield ("\n".join(batch) + "\n").encode("utf-8")
+
+
 @router.get("/api/variant-dicts/{name}/export")
 async def api_export_variant_dict(name: str, format: str = "json"):
     """이체자 사전을 파일로 내보낸다.
 
     format: "json" (기본) 또는 "csv"
     """
-    path = _dict_name_to_path(name)
-    if not os.path.exists(path):
+    try:
+        vd = _get_variant_dict(name)
+    except FileNotFoundError:
         return JSONResponse({"error": f"사전을 찾을 수 없습니다: {name}"}, status_code=404)
 
-    vd = _get_variant_dict(name)
-
     if format == "csv":
-        csv_text = vd.export_csv()
-        return Response(
-            content=csv_text,
+        # 큰 사전도 CSV 전체를 문자열로 만들지 않고 행 묶음 단위로 흘려보낸다.
+        return StreamingResponse(
+            _iter_csv_chunks(vd),
             media_type="text/csv; charset=utf-8",
             headers={"Content-Disposition": f'attachment; filename="{name}.csv"'},
         )
     else:
-        # JSON: 원본 파일을 그대로 반환
-        return FileResponse(
-            path=path,
+        # JSON: 캐시된 사전을 파일과 같은 형식으로 직렬화해 반환 (파일을 다시 열지 않음)
+        return Response(
+            content=vd.to_json_bytes(),
             media_type="application/json; charset=utf-8",
-            filename=f"{name}.json",
+            headers={"Content-Disposition": f'attachment; filename="{name}.json"'},
         )
 
 
@@ -527,16 +737,60 @@ async def api_export_variant_dict(name: str, format: str = "json"):
 # ───────────────────────────────────────────────────
 
 
+def _max_text_page(doc_path, part_id: str) -> int:
+    """L4_text/pages/ 에 있는 해당 권의 마지막 페이지 번호를 반환한다. 없으면 0.
+
+    파일명 컨벤션: {part_id}_page_{NNN}.txt (core.document._text_file_path)
+    """
+    prefix = f"{part_id}_page_"
+    max_page = 0
+    try:
+        with os.scandir(doc_path / "L4_text" / "pages") as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(prefix) and name.endswith(".txt"):
+                    num = name[len(prefix):-4]
+                    if num.isdigit():
+                        max_page = max(max_page, int(num))
+    except FileNotFoundError:
+        return 0
+    return max_page
+
+
+def _validate_batch_request(doc_path, body: BatchCorrectionRequest):
+    """일괄 교정 요청을 검증하고 실제로 훑을 페이지 범위를 반환한다.
+
+    출력: (page_start, page_end) 또는 에러 JSONResponse.
+
+    왜 미리 검증하는가:
+        빈 글자나 뒤집힌 범위로 요청하면 아무것도 매칭되지 않는데도
+        범위 안의 모든 페이지 파일을 열어 본다.
+        끝 페이지도 실제로 존재하는 마지막 텍스트 페이지로 잘라서
+        page_end=99999 같은 요청이 빈 페이지를 헛돌지 않게 한다.
+    """
+    if not body.original_char:
+        return JSONResponse({"error": "교정 전 글자를 입력해야 합니다."}, status_code=400)
+    if body.page_start < 1 or body.page_end < body.page_start:
+        return JSONResponse(
+            {"error": f"페이지 범위가 잘못되었습니다: {body.page_start}~{body.page_end}"},
+            status_code=400,
+        )
+    return body.page_start, min(body.page_end, _max_text_page(doc_path, body.part_id))
+
+
 @router.post("/api/documents/{doc_id}/batch-corrections/preview")
 async def api_batch_correction_preview(doc_id: str, body: BatchCorrectionRequest):
     """일괄 교정 미리보기 — 대상 글자가 어느 페이지에서 몇 건 매칭되는지 반환한다."""
     _library_path = get_library_path()
     doc_path = _library_path / "documents" / doc_id
 
-    from core.document import search_char_in_pages
+    page_range = _validate_batch_request(doc_path, body)
+    if isinstance(page_range, JSONResponse):
+        return page_range
+    page_start, page_end = page_range
 
     results = search_char_in_pages(
-        doc_path, body.part_id, body.page_start, body.page_end, body.original_char
+        doc_path, body.part_id, page_start, page_end, body.original_char
     )
     total = sum(r["count"] for r in results)
     return {
@@ -557,13 +811,16 @@ async def api_batch_correction_execute(
     _library_path = get_library_path()
     doc_path = _library_path / "documents" / doc_id
 
-    from core.document import apply_batch_corrections, git_commit_document
+    page_range = _validate_batch_request(doc_path, body)
+    if isinstance(page_range, JSONResponse):
+        return page_range
+    page_start, page_end = page_range
 
     result = apply_batch_corrections(
         doc_path,
         body.part_id,
-        body.page_start,
-        body.page_end,
+        page_start,
+        page_end,
         body.original_char,
         body.corrected_char,
         body.correction_type,
@@ -9,18 +9,39 @@ L7 주석 CRUD, 사전형 주석 생성/내보내기/가져오기, 참조 사전
 """
 
 import asyncio
-import json
+import copy
+import functools
 import logging
+import os
+import re
+import weakref
+from collections import OrderedDict
 from pathlib import Path
+from typing import Any
 
-from fastapi import APIRouter, Query, Request
+from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import JSONResponse, Response, StreamingResponse
-from pydantic import BaseModel
-
-from app._state import get_library_path, _get_llm_router, _call_llm_text, _call_llm_text_stream
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
+
+from app._state import (
+    FastJSONResponse,
+    files_etag,
+    get_library_path,
+    load_manifest,
+    make_llm_stream_queue,
+    not_modified,
+    require_interp,
+    schedule_interp_commit,
+    sse_event,
+    _get_llm_router,
+    _call_llm_text,
+    _call_llm_text_stream,
+)
 
 from core.annotation import (
+    _annotation_file_path,
     add_annotation as add_ann,
+    add_annotations as add_ann_many,
     check_translation_changed,
     get_annotation_summary,
     get_annotations_by_type,
@@ -59,35 +80,61 @@ from core.annotation_types import (
 )
 from core.citation_mark import (
     add_citation_mark,
+    citation_marks_signature,
     export_citations,
+    find_citation_mark,
     format_citation,
     list_all_citation_marks,
     load_citation_marks,
     remove_citation_mark,
     resolve_citation_context,
+    resolve_citation_contexts_bulk,
     save_citation_marks,
     update_citation_mark,
+    validate_citation_marks,
 )
 from core.entity import list_entities
-from core.interpretation import git_commit_interpretation
+from core.json_io import dumps, read_json
 from core.translation import load_translations
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(tags=["annotation"])
+router = APIRouter(tags=["annotation"], default_response_class=FastJSONResponse)
+
+
+def _llm_max_concurrency() -> int:
+    """일괄 생성에서 동시에 보낼 LLM 호출 수 상한.
+
+    왜 환경변수인가: 제공자·요금제마다 요청 한도(rate limit)가 달라서
+    배포 환경에서 코드 수정 없이 조정할 수 있어야 한다. 잘못된 값이면 기본값 8.
+    """
+    try:
+        return max(1, int(os.getenv("LLM_MAX_CONCURRENCY", "8")))
+    except ValueError:
+        return 8
 
 
 # ── Pydantic 모델 ─────────────────────────────────
 
 
-class AnnotationAddRequest(BaseModel):
+class _RequestModel(BaseModel):
+    """이 라우터 요청 본문의 공통 설정.
+
+    핸들러는 요청 본문을 읽기만 하므로 불변(frozen)으로 둔다.
+    extra는 기본값(무시)을 유지한다 — 프론트엔드가 보내는 부가 필드
+    (예: 인용 설정의 preset)로 요청이 422가 되지 않게 하기 위해서다.
+    """
+    model_config = ConfigDict(frozen=True)
+
+
+class AnnotationAddRequest(_RequestModel):
     """수동 주석 추가 요청."""
     target: dict
     type: str
     content: dict
 
 
-class AnnotationUpdateRequest(BaseModel):
+class AnnotationUpdateRequest(_RequestModel):
     """주석 수정 요청."""
     target: dict | None = None
     type: str | None = None
@@ -101,12 +148,12 @@ class AnnotationUpdateRequest(BaseModel):
     status: str | None = None
 
 
-class AnnotationCommitRequest(BaseModel):
+class AnnotationCommitRequest(_RequestModel):
     """주석 Draft 확정 요청."""
     modifications: dict | None = None
 
 
-class CustomTypeRequest(BaseModel):
+class CustomTypeRequest(_RequestModel):
     """사용자 정의 주석 유형 추가 요청."""
     id: str
     label: str
@@ -114,51 +161,76 @@ class CustomTypeRequest(BaseModel):
     icon: str = "🏷️"
 
 
-class DictStageRequest(BaseModel):
+class DictStageRequest(_RequestModel):
     """사전형 주석 단계별 생성 요청."""
     block_id: str
     force_provider: str | None = None
     force_model: str | None = None
 
 
-class DictBatchRequest(BaseModel):
+class DictBatchRequest(_RequestModel):
     """사전형 주석 일괄 생성 요청 (Stage 3 직행)."""
     pages: list[int] | None = None  # None이면 전체 페이지
     force_provider: str | None = None
     force_model: str | None = None
 
 
-class DictImportRequest(BaseModel):
+class DictImportRequest(_RequestModel):
     """사전 가져오기 요청."""
     dictionary_data: dict
     merge_strategy: str = "merge"
     target_page: int = 1
 
 
-class RefDictRegisterRequest(BaseModel):
+class RefDictRegisterRequest(_RequestModel):
     """참조 사전 등록 요청."""
     dictionary_data: dict
     filename: str | None = None
 
 
-class RefDictMatchRequest(BaseModel):
+class RefDictMatchBlock(_RequestModel):
+    """참조 사전 매칭 대상 블록."""
+    block_id: str = ""
+    text: str = ""
+
+
+class RefDictMatchRequest(_RequestModel):
     """참조 사전 매칭 요청."""
-    blocks: list[dict]
+    blocks: list[RefDictMatchBlock]
     ref_filenames: list[str] | None = None
 
 
-class CitationMarkAddRequest(BaseModel):
-    """인용 마크 추가 요청."""
+class CitationMarkSource(_RequestModel):
+    """인용 마크가 가리키는 블록 구간."""
     block_id: str
     start: int
     end: int
+
+
+class CitationMarkAddRequest(_RequestModel):
+    """인용 마크 추가 요청.
+
+    저장되는 mark와 같은 모양이므로 핸들러는 model_dump()를 그대로 쓴다.
+    이전 평면 형식({block_id, start, end, ...})도 source로 묶어서 받는다.
+    """
+    source: CitationMarkSource
     marked_from: str  # "original" | "translation"
     source_text_snapshot: str
     label: str | None = None
     tags: list[str] = []
 
+    @model_validator(mode="before")
+    @classmethod
+    def _accept_flat_source(cls, data):
+        if isinstance(data, dict) and "source" not in data:
+            data = dict(data)
+            data["source"] = {
+                key: data.pop(key) for key in ("block_id", "start", "end") if key in data
+            }
+        return data
+
 
-class CitationMarkUpdateRequest(BaseModel):
+class CitationMarkUpdateRequest(_RequestModel):
     """인용 마크 수정 요청."""
     label: str | None = None
     tags: list[str] | None = None
@@ -167,27 +239,61 @@ class CitationMarkUpdateRequest(BaseModel):
     marked_from: str | None = None
 
 
-class CitationExportRequest(BaseModel):
-    """인용 내보내기 요청.
+class CitationExportOptions(_RequestModel):
+    """인용 내보내기 서식 옵션 (core.citation_mark.format_citation 참조).
 
-    export_options:
-        bracket_replace_single — 「」 → 〈〉 치환 여부.
-        bracket_replace_double — 『』 → 《》 치환 여부.
-        wrap_double_quotes — 원문을 \u201c\u201d로 감쌀지 여부.
-        field_order — 인용 필드 순서 배열.
+    bracket_replace_single — 「」↔〈〉 치환: "none" | "corner_to_angle" | "angle_to_corner".
+    bracket_replace_double — 『』↔《》 치환: 값은 위와 같음.
+        (하위 호환: True는 "corner_to_angle"로 취급된다.)
+    wrap_double_quotes — 원문을 \u201c\u201d로 감쌀지 여부.
+    field_order — 인용 필드 순서 배열.
     """
+    bracket_replace_single: bool | str | None = None
+    bracket_replace_double: bool | str | None = None
+    wrap_double_quotes: bool = False
+    field_order: list[str] | None = None
+
+
+class CitationExportRequest(_RequestModel):
+    """인용 내보내기 요청."""
     mark_ids: list[str]
     include_translation: bool = True
-    export_options: dict | None = None
+    export_options: CitationExportOptions | None = None
 
 
-class AiAnnotationRequest(BaseModel):
+class AiAnnotationRequest(_RequestModel):
     """AI 주석 태깅 요청."""
     text: str                         # 태깅할 원문 텍스트
     force_provider: str | None = None
     force_model: str | None = None
 
 
+def _llm_overrides(body: DictStageRequest | DictBatchRequest | None) -> dict:
+    """요청 본문의 provider/모델 지정을 생성 함수 키워드 인자로 바꾼다.
+
+    왜 라우터 속성에 넣지 않는가: LLM 라우터는 모든 요청이 공유하므로,
+    라우터를 수정하면 동시에 들어온 다른 요청까지 같은 모델로 바뀐다.
+    """
+    return {
+        "force_provider": body.force_provider if body else None,
+        "force_model": body.force_model if body else None,
+    }
+
+
+# 일괄 생성 대상 페이지를 찾을 때 쓰는 파일명 패턴
+_L4_PAGE_FILE_RE = re.compile(r"main_page_(\d+)_text\.json\Z")
+_L6_PAGE_FILE_RE = re.compile(r"main_page_(\d+)_translation\.json\Z")
+
+
+def _scan_page_nums(directory: Path, pattern: re.Pattern) -> set[int]:
+    """디렉토리에서 pattern과 일치하는 파일명의 페이지 번호를 모은다. 디렉토리가 없으면 빈 집합."""
+    try:
+        with os.scandir(directory) as it:
+            return {int(m.group(1)) for entry in it if (m := pattern.match(entry.name))}
+    except FileNotFoundError:
+        return set()
+
+
 def _l4_text_file(interp_path: Path, page_num: int, part_id: str = "main") -> Path:
     """L4 원문 파일 경로를 반환한다."""
     return interp_path / "L4_text" / "main_text" / f"{part_id}_page_{page_num:03d}_text.json"
@@ -196,11 +302,11 @@ def _l4_text_file(interp_path: Path, page_num: int, part_id: str = "main") -> Pa
 def _load_page_blocks(interp_path: Path, page_num: int, part_id: str = "main") -> list[dict]:
     """L4 원문 파일에서 페이지 블록 목록을 로드한다."""
     text_file = _l4_text_file(interp_path, page_num, part_id)
-    if not text_file.exists():
-        raise FileNotFoundError(f"L4 원문 파일이 없습니다: {text_file.name}")
-
-    with open(text_file, encoding="utf-8") as f:
-        text_data = json.load(f)
+    # exists() 후 읽으면 stat이 한 번 더 일어나므로 바로 읽고 없을 때만 메시지를 바꾼다.
+    try:
+        text_data = read_json(text_file)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"L4 원문 파일이 없습니다: {text_file.name}") from None
     return text_data.get("blocks", [])
 
 
@@ -406,6 +512,74 @@ def _set_block_annotations(data: dict, block_id: str, annotations: list[dict]) -
     data.setdefault("blocks", []).append({"block_id": block_id, "annotations": annotations})
 
 
+# ── L7 주석 페이지 캐시 ──
+# 왜 필요한가: 주석 편집 API는 매번 "읽기 → 수정 → 저장"을 하므로, 방금 저장한 파일을
+# 다음 요청에서 다시 읽고 파싱하게 된다. 파일의 (mtime_ns, size)가 그대로면
+# 메모리의 dict를 재사용하고, 다른 경로(일괄 생성, 사전 가져오기 등)로 파일이 바뀌면
+# 서명이 달라져 다시 읽는다.
+# 캐시된 dict는 요청 사이에 공유되므로 수정은 반드시 _page_lock 안에서 한다
+# (같은 페이지의 동시 수정이 서로를 덮어쓰는 문제도 함께 막는다).
+# 잠금은 약한 참조로만 보관한다. 잡고 있거나 기다리는 요청이 있는 동안만 살아 있고,
+# 아무도 쓰지 않으면 사라지므로 한 번이라도 건드린 페이지마다 잠금이 쌓이지 않는다.
+_PAGE_CACHE_MAX_SIZE = 64
+_page_cache: OrderedDict[tuple[str, str, int], tuple[tuple[int, int] | None, dict]] = OrderedDict()
+_page_locks: weakref.WeakValueDictionary[tuple[str, str, int], asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _page_file_sig(file_path: Path) -> tuple[int, int] | None:
+    """주석 파일의 (mtime_ns, size). 파일이 없으면 None."""
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _page_lock(interp_path: Path, part_id: str, page_num: int) -> asyncio.Lock:
+    """페이지 주석의 수정·저장을 직렬화하는 잠금."""
+    return _page_locks.setdefault((str(interp_path), part_id, page_num), asyncio.Lock())
+
+
+async def _load_page_annotations(interp_path: Path, part_id: str, page_num: int) -> dict:
+    """페이지 주석을 반환한다. 파일이 바뀌지 않았으면 캐시된 dict를 그대로 돌려준다."""
+    key = (str(interp_path), part_id, page_num)
+    # 읽기 전에 서명을 잡아 둔다 — 읽는 사이 파일이 바뀌면 다음 요청에서 다시 읽힌다.
+    sig = _page_file_sig(_annotation_file_path(interp_path, part_id, page_num))
+    cached = _page_cache.get(key)
+    if cached is not None and cached[0] == sig:
+        _page_cache.move_to_end(key)
+        return cached[1]
+
+    data = await asyncio.to_thread(load_annotations, interp_path, part_id, page_num)
+    _page_cache[key] = (sig, data)
+    _page_cache.move_to_end(key)
+    while len(_page_cache) > _PAGE_CACHE_MAX_SIZE:
+        _page_cache.popitem(last=False)
+    return data
+
+
+async def _save_page_annotations(
+    interp_path: Path, part_id: str, page_num: int, data: dict,
+) -> None:
+    """페이지 주석을 저장하고 캐시를 갱신한다.
+
+    저장에 실패하면(스키마 검증 오류 등) 캐시의 dict는 이미 수정된 상태이므로
+    버려서 다음 요청이 파일에서 다시 읽게 한다.
+    """
+    key = (str(interp_path), part_id, page_num)
+    try:
+        file_path = await asyncio.to_thread(save_annotations, interp_path, part_id, page_num, data)
+    except Exception:
+        _page_cache.pop(key, None)
+        raise
+    _page_cache[key] = (_page_file_sig(file_path), data)
+    _page_cache.move_to_end(key)
+    while len(_page_cache) > _PAGE_CACHE_MAX_SIZE:
+        _page_cache.popitem(last=False)
+
+
 def _resolve_stage_block_id(
     request: Request,
     body: DictStageRequest | None,
@@ -448,222 +622,195 @@ def _resolve_stage_block_id(
 
 @router.get("/api/interpretations/{interp_id}/pages/{page_num}/annotations")
 async def api_get_annotations(
-    interp_id: str,
     page_num: int,
     type: str | None = None,
     part_id: str = Query("main", description="권 식별자"),
+    interp_path: Path = Depends(require_interp),
 ):
     """주석 조회.
 
     목적: 특정 페이지의 L7 주석 데이터를 반환한다.
     쿼리 파라미터: type — 특정 유형만 필터링 (선택).
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse({"error": f"해석 저장소 '{interp_id}'를 찾을 수 없습니다."}, status_code=404)
-
-    data = load_annotations(interp_path, part_id, page_num)
+    data = await _load_page_annotations(interp_path, part_id, page_num)
 
     if type:
         filtered = get_annotations_by_type(data, type)
-        return {"part_id": part_id, "page_number": page_num, "filtered_type": type, "results": filtered}
+        return FastJSONResponse({
+            "part_id": part_id,
+            "page_number": page_num,
+            "filtered_type": type,
+            "results": filtered,
+        })
 
-    return data
+    # 파일에서 읽은 JSON 그대로이므로 jsonable_encoder의 전체 순회 없이 바로 직렬화한다.
+    return FastJSONResponse(data)
 
 
 @router.get("/api/interpretations/{interp_id}/pages/{page_num}/annotations/summary")
-async def api_annotation_summary(interp_id: str, page_num: int):
+async def api_annotation_summary(page_num: int, interp_path: Path = Depends(require_interp)):
     """주석 상태 요약.
 
     목적: 페이지의 주석 현황을 한눈에 파악.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
     part_id = "main"
-    data = load_annotations(interp_path, part_id, page_num)
-    return get_annotation_summary(data)
+    data = await _load_page_annotations(interp_path, part_id, page_num)
+    return FastJSONResponse(get_annotation_summary(data))
 
 
 @router.post("/api/interpretations/{interp_id}/pages/{page_num}/annotations/__add/{block_id}")
 async def api_add_annotation(
-    interp_id: str, page_num: int, block_id: str, body: AnnotationAddRequest
+    page_num: int,
+    block_id: str,
+    body: AnnotationAddRequest,
+    interp_path: Path = Depends(require_interp),
 ):
     """수동 주석 추가.
 
     목적: 사용자가 직접 주석을 입력한다. annotator.type = "human", status = "accepted".
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
     part_id = "main"
 
-    data = load_annotations(interp_path, part_id, page_num)
-
-    annotation = {
-        "target": body.target,
-        "type": body.type,
-        "content": body.content,
-        "annotator": {"type": "human", "model": None, "draft_id": None},
-        "status": "accepted",
-        "reviewed_by": None,
-        "reviewed_at": None,
-    }
-    result = add_ann(data, block_id, annotation)
+    async with _page_lock(interp_path, part_id, page_num):
+        data = await _load_page_annotations(interp_path, part_id, page_num)
+
+        annotation = {
+            "target": body.target,
+            "type": body.type,
+            "content": body.content,
+            "annotator": {"type": "human", "model": None, "draft_id": None},
+            "status": "accepted",
+            "reviewed_by": None,
+            "reviewed_at": None,
+        }
+        result = add_ann(data, block_id, annotation)
 
-    try:
-        save_annotations(interp_path, part_id, page_num, data)
         try:
-            git_commit_interpretation(interp_path, f"feat: L7 주석 추가 — page {page_num}")
-        except Exception:
-            pass
-        return JSONResponse(result, status_code=201)
-    except Exception as e:
-        return JSONResponse({"error": f"주석 저장 실패: {e}"}, status_code=400)
+            await _save_page_annotations(interp_path, part_id, page_num, data)
+            schedule_interp_commit(interp_path, f"feat: L7 주석 추가 — page {page_num}")
+            return JSONResponse(result, status_code=201)
+        except Exception as e:
+            return JSONResponse({"error": f"주석 저장 실패: {e}"}, status_code=400)
 
 
 @router.put("/api/interpretations/{interp_id}/pages/{page_num}/annotations/{block_id}/{ann_id}")
 async def api_update_annotation(
-    interp_id: str, page_num: int, block_id: str, ann_id: str,
+    page_num: int,
+    block_id: str,
+    ann_id: str,
     body: AnnotationUpdateRequest,
+    interp_path: Path = Depends(require_interp),
 ):
     """주석 수정."""
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
     part_id = "main"
 
-    data = load_annotations(interp_path, part_id, page_num)
-    updates = {}
-    if body.target is not None:
-        updates["target"] = body.target
-    if body.type is not None:
-        updates["type"] = body.type
-    if body.content is not None:
-        updates["content"] = body.content
-    if body.dictionary is not None:
-        updates["dictionary"] = body.dictionary
-    if body.current_stage is not None:
-        updates["current_stage"] = body.current_stage
-    if body.generation_history is not None:
-        updates["generation_history"] = body.generation_history
-    if body.source_text_snapshot is not None:
-        updates["source_text_snapshot"] = body.source_text_snapshot
-    if body.translation_snapshot is not None:
-        updates["translation_snapshot"] = body.translation_snapshot
-    if body.annotator is not None:
-        updates["annotator"] = body.annotator
-    if body.status is not None:
-        updates["status"] = body.status
-
-    result = update_ann(data, block_id, ann_id, updates)
-    if result is None:
-        return JSONResponse({"error": f"주석 '{ann_id}'를 찾을 수 없습니다."}, status_code=404)
+    async with _page_lock(interp_path, part_id, page_num):
+        data = await _load_page_annotations(interp_path, part_id, page_num)
+        updates = {}
+        if body.target is not None:
+            updates["target"] = body.target
+        if body.type is not None:
+            updates["type"] = body.type
+        if body.content is not None:
+            updates["content"] = body.content
+        if body.dictionary is not None:
+            updates["dictionary"] = body.dictionary
+        if body.current_stage is not None:
+            updates["current_stage"] = body.current_stage
+        if body.generation_history is not None:
+            updates["generation_history"] = body.generation_history
+        if body.source_text_snapshot is not None:
+            updates["source_text_snapshot"] = body.source_text_snapshot
+        if body.translation_snapshot is not None:
+            updates["translation_snapshot"] = body.translation_snapshot
+        if body.annotator is not None:
+            updates["annotator"] = body.annotator
+        if body.status is not None:
+            updates["status"] = body.status
+
+        result = update_ann(data, block_id, ann_id, updates)
+        if result is None:
+            return JSONResponse({"error": f"주석 '{ann_id}'를 찾을 수 없습니다."}, status_code=404)
 
-    try:
-        save_annotations(interp_path, part_id, page_num, data)
         try:
-            git_commit_interpretation(interp_path, f"feat: L7 주석 수정 — page {page_num}")
-        except Exception:
-            pass
-        return result
-    except Exception as e:
-        return JSONResponse({"error": f"주석 저장 실패: {e}"}, status_code=400)
+            await _save_page_annotations(interp_path, part_id, page_num, data)
+            schedule_interp_commit(interp_path, f"feat: L7 주석 수정 — page {page_num}")
+            return result
+        except Exception as e:
+            return JSONResponse({"error": f"주석 저장 실패: {e}"}, status_code=400)
 
 
 @router.delete("/api/interpretations/{interp_id}/pages/{page_num}/annotations/{block_id}/{ann_id}")
 async def api_delete_annotation(
-    interp_id: str, page_num: int, block_id: str, ann_id: str
+    page_num: int,
+    block_id: str,
+    ann_id: str,
+    interp_path: Path = Depends(require_interp),
 ):
     """주석 삭제."""
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
     part_id = "main"
 
-    data = load_annotations(interp_path, part_id, page_num)
-    removed = remove_ann(data, block_id, ann_id)
+    async with _page_lock(interp_path, part_id, page_num):
+        data = await _load_page_annotations(interp_path, part_id, page_num)
+        removed = remove_ann(data, block_id, ann_id)
 
-    if not removed:
-        return JSONResponse({"error": f"주석 '{ann_id}'를 찾을 수 없습니다."}, status_code=404)
+        if not removed:
+            return JSONResponse({"error": f"주석 '{ann_id}'를 찾을 수 없습니다."}, status_code=404)
 
-    save_annotations(interp_path, part_id, page_num, data)
-    return Response(status_code=204)
+        await _save_page_annotations(interp_path, part_id, page_num, data)
+        return Response(status_code=204)
 
 
 @router.post("/api/interpretations/{interp_id}/pages/{page_num}/annotations/{block_id}/{ann_id}/commit")
 async def api_commit_annotation(
-    interp_id: str, page_num: int, block_id: str, ann_id: str,
+    page_num: int,
+    block_id: str,
+    ann_id: str,
     body: AnnotationCommitRequest,
+    interp_path: Path = Depends(require_interp),
 ):
     """주석 Draft 개별 확정.
 
     목적: 연구자가 Draft를 검토 후 확정. status → "accepted".
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
     part_id = "main"
 
-    data = load_annotations(interp_path, part_id, page_num)
-    result = commit_annotation_draft(data, block_id, ann_id, body.modifications)
+    async with _page_lock(interp_path, part_id, page_num):
+        data = await _load_page_annotations(interp_path, part_id, page_num)
+        result = commit_annotation_draft(data, block_id, ann_id, body.modifications)
 
-    if result is None:
-        return JSONResponse({"error": f"주석 '{ann_id}'를 찾을 수 없습니다."}, status_code=404)
+        if result is None:
+            return JSONResponse({"error": f"주석 '{ann_id}'를 찾을 수 없습니다."}, status_code=404)
 
-    try:
-        save_annotations(interp_path, part_id, page_num, data)
         try:
-            git_commit_interpretation(interp_path, f"feat: L7 주석 확정 — page {page_num}")
-        except Exception:
-            pass
-        return result
-    except Exception as e:
-        return JSONResponse({"error": f"주석 저장 실패: {e}"}, status_code=400)
+            await _save_page_annotations(interp_path, part_id, page_num, data)
+            schedule_interp_commit(interp_path, f"feat: L7 주석 확정 — page {page_num}")
+            return result
+        except Exception as e:
+            return JSONResponse({"error": f"주석 저장 실패: {e}"}, status_code=400)
 
 
 @router.post("/api/interpretations/{interp_id}/pages/{page_num}/annotations/commit-all")
-async def api_commit_all_annotations(interp_id: str, page_num: int):
+async def api_commit_all_annotations(page_num: int, interp_path: Path = Depends(require_interp)):
     """주석 Draft 일괄 확정.
 
     목적: 페이지의 모든 draft 주석을 한번에 accepted로 변경.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
     part_id = "main"
 
-    data = load_annotations(interp_path, part_id, page_num)
-    count = commit_all_drafts(data)
+    async with _page_lock(interp_path, part_id, page_num):
+        data = await _load_page_annotations(interp_path, part_id, page_num)
+        count = commit_all_drafts(data)
 
-    if count == 0:
-        return {"message": "확정할 draft 주석이 없습니다.", "committed": 0}
+        if count == 0:
+            return {"message": "확정할 draft 주석이 없습니다.", "committed": 0}
 
-    try:
-        save_annotations(interp_path, part_id, page_num, data)
         try:
-            git_commit_interpretation(interp_path, f"feat: L7 주석 일괄 확정 — page {page_num}")
-        except Exception:
-            pass
-        return {"message": f"{count}개 주석을 확정했습니다.", "committed": count}
-    except Exception as e:
-        return JSONResponse({"error": f"주석 저장 실패: {e}"}, status_code=400)
+            await _save_page_annotations(interp_path, part_id, page_num, data)
+            schedule_interp_commit(interp_path, f"feat: L7 주석 일괄 확정 — page {page_num}")
+            return {"message": f"{count}개 주석을 확정했습니다.", "committed": count}
+        except Exception as e:
+            return JSONResponse({"error": f"주석 저장 실패: {e}"}, status_code=400)
 
 
 # --- 주석 유형 관리 API ---
@@ -749,34 +896,23 @@ async def api_restore_annotation_type(type_id: str):
 
 @router.post("/api/interpretations/{interp_id}/pages/{page_num}/annotations/generate-stage1")
 async def api_dict_generate_stage1(
-    interp_id: str,
     page_num: int,
     request: Request,
     body: DictStageRequest | None = None,
+    interp_path: Path = Depends(require_interp),
 ):
     """1단계 사전 생성: 원문에서 사전 항목 추출.
 
     목적: L4 원문을 분석하여 표제어, 독음, 사전적 의미, 출전을 생성한다.
     전제 조건: L4 원문이 존재해야 한다.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse({"error": f"해석 '{interp_id}'를 찾을 수 없습니다."}, status_code=404)
-
     try:
         llm_router = _get_llm_router()
-        if body and body.force_provider:
-            llm_router.force_provider = body.force_provider
-        if body and body.force_model:
-            llm_router.force_model = body.force_model
+        llm_overrides = _llm_overrides(body)
 
         block_id = _resolve_stage_block_id(request, body, interp_path, page_num, "main")
 
-        ann_data = load_annotations(interp_path, "main", page_num)
+        ann_data = await _load_page_annotations(interp_path, "main", page_num)
         existing_annotations = _get_block_annotations(ann_data, block_id)
         original_text = _load_original_block_text(interp_path, page_num, block_id, "main")
 
@@ -785,14 +921,19 @@ async def api_dict_generate_stage1(
             block_id=block_id,
             router=llm_router,
             existing_annotations=existing_annotations,
+            **llm_overrides,
         )
 
         # 기존 주석(수동 태깅 등)과 병합하여 저장한다.
         # 왜: generate_stage1은 LLM 결과만 반환하므로,
         # 병합 없이 교체하면 기존 태깅이 사라진다.
         merged = merge_annotations(existing_annotations, generated, "from_original")
-        _set_block_annotations(ann_data, block_id, merged)
-        save_annotations(interp_path, "main", page_num, ann_data)
+        # LLM 응답을 기다리는 동안 다른 요청이 같은 페이지를 저장했을 수 있으므로
+        # 잠금 안에서 최신 주석을 다시 받아 이 블록만 교체한다.
+        async with _page_lock(interp_path, "main", page_num):
+            ann_data = await _load_page_annotations(interp_path, "main", page_num)
+            _set_block_annotations(ann_data, block_id, merged)
+            await _save_page_annotations(interp_path, "main", page_num, ann_data)
 
         return {
             "page_number": page_num,
@@ -808,34 +949,23 @@ async def api_dict_generate_stage1(
 
 @router.post("/api/interpretations/{interp_id}/pages/{page_num}/annotations/generate-stage2")
 async def api_dict_generate_stage2(
-    interp_id: str,
     page_num: int,
     request: Request,
     body: DictStageRequest | None = None,
+    interp_path: Path = Depends(require_interp),
 ):
     """2단계 사전 생성: 번역으로 보강.
 
     목적: 1단계 결과에 L6 번역의 문맥적 의미를 보강한다.
     전제 조건: 1단계 완료 + L6 번역이 존재해야 한다.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse({"error": f"해석 '{interp_id}'를 찾을 수 없습니다."}, status_code=404)
-
     try:
         llm_router = _get_llm_router()
-        if body and body.force_provider:
-            llm_router.force_provider = body.force_provider
-        if body and body.force_model:
-            llm_router.force_model = body.force_model
+        llm_overrides = _llm_overrides(body)
 
         block_id = _resolve_stage_block_id(request, body, interp_path, page_num, "main")
 
-        ann_data = load_annotations(interp_path, "main", page_num)
+        ann_data = await _load_page_annotations(interp_path, "main", page_num)
         existing_annotations = _get_block_annotations(ann_data, block_id)
         original_text = _load_original_block_text(interp_path, page_num, block_id, "main")
         translation_text = _load_translation_block_text(interp_path, page_num, block_id, "main")
@@ -846,10 +976,13 @@ async def api_dict_generate_stage2(
             block_id=block_id,
             router=llm_router,
             existing_annotations=existing_annotations,
+            **llm_overrides,
         )
 
-        _set_block_annotations(ann_data, block_id, generated)
-        save_annotations(interp_path, "main", page_num, ann_data)
+        async with _page_lock(interp_path, "main", page_num):
+            ann_data = await _load_page_annotations(interp_path, "main", page_num)
+            _set_block_annotations(ann_data, block_id, generated)
+            await _save_page_annotations(interp_path, "main", page_num, ann_data)
 
         return {
             "page_number": page_num,
@@ -865,34 +998,23 @@ async def api_dict_generate_stage2(
 
 @router.post("/api/interpretations/{interp_id}/pages/{page_num}/annotations/generate-stage3")
 async def api_dict_generate_stage3(
-    interp_id: str,
     page_num: int,
     request: Request,
     body: DictStageRequest | None = None,
+    interp_path: Path = Depends(require_interp),
 ):
     """3단계 사전 생성: 원문+번역 최종 통합.
 
     목적: 원문과 번역을 종합하여 사전 항목을 최종 정리한다.
     전제 조건: 원문 + 번역이 모두 존재. 1→2단계 완료 또는 일괄 생성 모드.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse({"error": f"해석 '{interp_id}'를 찾을 수 없습니다."}, status_code=404)
-
     try:
         llm_router = _get_llm_router()
-        if body and body.force_provider:
-            llm_router.force_provider = body.force_provider
-        if body and body.force_model:
-            llm_router.force_model = body.force_model
+        llm_overrides = _llm_overrides(body)
 
         block_id = _resolve_stage_block_id(request, body, interp_path, page_num, "main")
 
-        ann_data = load_annotations(interp_path, "main", page_num)
+        ann_data = await _load_page_annotations(interp_path, "main", page_num)
         existing_annotations = _get_block_annotations(ann_data, block_id)
         original_text = _load_original_block_text(interp_path, page_num, block_id, "main")
         translation_text = _load_translation_block_text(interp_path, page_num, block_id, "main")
@@ -903,10 +1025,13 @@ async def api_dict_generate_stage3(
             block_id=block_id,
             router=llm_router,
             existing_annotations=existing_annotations,
+            **llm_overrides,
         )
 
-        _set_block_annotations(ann_data, block_id, generated)
-        save_annotations(interp_path, "main", page_num, ann_data)
+        async with _page_lock(interp_path, "main", page_num):
+            ann_data = await _load_page_annotations(interp_path, "main", page_num)
+            _set_block_annotations(ann_data, block_id, generated)
+            await _save_page_annotations(interp_path, "main", page_num, ann_data)
 
         return {
             "page_number": page_num,
@@ -922,36 +1047,28 @@ async def api_dict_generate_stage3(
 
 @router.post("/api/interpretations/{interp_id}/pages/{page_num}/annotations/{block_id}")
 async def api_add_annotation_legacy_path(
-    interp_id: str,
     page_num: int,
     block_id: str,
     body: AnnotationAddRequest,
+    interp_path: Path = Depends(require_interp),
 ):
     """Legacy add route kept after static routes to avoid path shadowing."""
-    return await api_add_annotation(interp_id, page_num, block_id, body)
+    return await api_add_annotation(page_num, block_id, body, interp_path)
 
 
 @router.post("/api/interpretations/{interp_id}/annotations/generate-batch")
-async def api_dict_generate_batch(interp_id: str, body: DictBatchRequest | None = None):
+async def api_dict_generate_batch(
+    body: DictBatchRequest | None = None,
+    interp_path: Path = Depends(require_interp),
+):
     """일괄 사전 생성 (Stage 3 직행).
 
     목적: 완성된 원문+번역 쌍에서 모든 페이지의 사전을 한번에 생성한다.
     용도: 이미 완성된 작업에서 사전을 추출하여 다른 문헌 참조 사전으로 활용.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse({"error": f"해석 '{interp_id}'를 찾을 수 없습니다."}, status_code=404)
-
     try:
         llm_router = _get_llm_router()
-        if body and body.force_provider:
-            llm_router.force_provider = body.force_provider
-        if body and body.force_model:
-            llm_router.force_model = body.force_model
+        llm_overrides = _llm_overrides(body)
 
         text_dir = interp_path / "L4_text" / "main_text"
         if (not text_dir.exists()) and (not (interp_path / "L6_translation" / "main_text").exists()):
@@ -965,24 +1082,10 @@ async def api_dict_generate_batch(interp_id: str, body: DictBatchRequest | None
         if body and body.pages:
             pages = body.pages
         else:
-            pages_from_l4: set[int] = set()
-            text_dir = interp_path / "L4_text" / "main_text"
-            if text_dir.exists():
-                for f in text_dir.glob("main_page_*_text.json"):
-                    try:
-                        pages_from_l4.add(int(f.stem.split("_page_")[1].split("_")[0]))
-                    except Exception:
-                        continue
-
-            pages_from_l6: set[int] = set()
-            tr_dir = interp_path / "L6_translation" / "main_text"
-            if tr_dir.exists():
-                for f in tr_dir.glob("main_page_*_translation.json"):
-                    try:
-                        pages_from_l6.add(int(f.stem.split("_page_")[1].split("_")[0]))
-                    except Exception:
-                        continue
-
+            pages_from_l4 = _scan_page_nums(interp_path / "L4_text" / "main_text", _L4_PAGE_FILE_RE)
+            pages_from_l6 = _scan_page_nums(
+                interp_path / "L6_translation" / "main_text", _L6_PAGE_FILE_RE
+            )
             pages = sorted(pages_from_l4 | pages_from_l6)
             if not pages:
                 return JSONResponse(
@@ -991,46 +1094,101 @@ async def api_dict_generate_batch(interp_id: str, body: DictBatchRequest | None
                 )
 
         # 각 페이지별 블록에 대해 Stage 3 실행
-        total_results = {"pages_processed": 0, "total_annotations": 0, "errors": []}
+        # 왜 동시 실행인가: 블록마다 LLM 응답을 차례로 기다리면 전체 시간이
+        #   블록 수에 비례한다. 모든 (페이지, 블록) 호출을 한꺼번에 띄우고
+        #   세마포어로 동시 호출 수만 제한한다.
+        #   페이지 저장은 그 페이지의 블록이 모두 끝난 뒤 한 번만 한다.
+        semaphore = asyncio.Semaphore(_llm_max_concurrency())
+
+        def _read_page_inputs(page_num: int):
+            """페이지의 주석·블록 ID·블록별 (원문, 번역)을 한 번에 읽는다.
+
+            왜 한 함수로 묶는가: 이 파일 읽기들이 이벤트 루프에서 블록마다 따로
+            일어나면 LLM 호출이 시작되기 전에 루프가 막힌다. 워커 스레드 한 번으로
+            모아 두면 페이지들의 읽기가 서로 겹쳐 진행된다.
+            블록 텍스트를 못 읽으면 예외 객체를 그 자리에 넣어 블록 오류로 보고한다.
+            """
+            ann_data = load_annotations(interp_path, "main", page_num)
+            block_ids = _load_page_block_ids(interp_path, page_num, "main")
+            texts: dict[str, tuple[str, str] | Exception] = {}
+            for block_id in block_ids:
+                try:
+                    texts[block_id] = (
+                        _load_original_block_text(interp_path, page_num, block_id, "main"),
+                        _load_translation_block_text(interp_path, page_num, block_id, "main"),
+                    )
+                except Exception as e:
+                    texts[block_id] = e
+            return ann_data, block_ids, texts
+
+        async def _generate_block(block_id: str, texts, ann_data: dict) -> list:
+            if isinstance(texts, Exception):
+                raise texts
+            original_text, translation_text = texts
+            existing_annotations = _get_block_annotations(ann_data, block_id)
+            async with semaphore:
+                return await generate_stage3_from_both(
+                    original_text=original_text,
+                    translation_text=translation_text,
+                    block_id=block_id,
+                    router=llm_router,
+                    existing_annotations=existing_annotations,
+                    **llm_overrides,
+                )
 
-        for page_num in pages:
-            try:
-                ann_data = load_annotations(interp_path, "main", page_num)
-                block_ids = _load_page_block_ids(interp_path, page_num, "main")
-                if not block_ids:
-                    total_results["errors"].append({"page": page_num, "error": "L4 블록이 없습니다."})
-                    continue
+        async def _process_page(page_num: int) -> tuple[int, list[dict]]:
+            """한 페이지의 블록을 동시에 생성하고 저장한다. (생성 주석 수, 오류 목록) 반환."""
+            ann_data, block_ids, texts = await asyncio.to_thread(_read_page_inputs, page_num)
+            if not block_ids:
+                raise ValueError("L4 블록이 없습니다.")
 
-                for block_id in block_ids:
-                    try:
-                        original_text = _load_original_block_text(interp_path, page_num, block_id, "main")
-                        translation_text = _load_translation_block_text(interp_path, page_num, block_id, "main")
-                        existing_annotations = _get_block_annotations(ann_data, block_id)
-
-                        generated = await generate_stage3_from_both(
-                            original_text=original_text,
-                            translation_text=translation_text,
-                            block_id=block_id,
-                            router=llm_router,
-                            existing_annotations=existing_annotations,
+            outcomes = await asyncio.gather(
+                *(_generate_block(block_id, texts[block_id], ann_data) for block_id in block_ids),
+                return_exceptions=True,
+            )
+
+            # 결과 반영은 gather가 끝난 뒤 블록 순서대로
+            # — 오류 목록 순서가 실행 순서에 흔들리지 않는다.
+            # 저장은 잠금 안에서 최신 주석을 다시 받아 생성된 블록만 교체한다
+            # (단건 생성 API와 동일).
+            count = 0
+            errors: list[dict] = []
+            async with _page_lock(interp_path, "main", page_num):
+                ann_data = await _load_page_annotations(interp_path, "main", page_num)
+                for block_id, generated in zip(block_ids, outcomes):
+                    if isinstance(generated, BaseException):
+                        errors.append(
+                            {"page": page_num, "block_id": block_id, "error": str(generated)}
                         )
+                        continue
+                    _set_block_annotations(ann_data, block_id, generated)
+                    count += len(generated)
 
-                        _set_block_annotations(ann_data, block_id, generated)
-                        total_results["total_annotations"] += len(generated)
-                    except Exception as block_error:
-                        total_results["errors"].append({
-                            "page": page_num,
-                            "block_id": block_id,
-                            "error": str(block_error),
-                        })
+                await _save_page_annotations(interp_path, "main", page_num, ann_data)
+            return count, errors
 
-                save_annotations(interp_path, "main", page_num, ann_data)
+        page_outcomes = await asyncio.gather(
+            *(_process_page(page_num) for page_num in pages),
+            return_exceptions=True,
+        )
 
-                total_results["pages_processed"] += 1
-            except Exception as e:
-                total_results["errors"].append({"page": page_num, "error": str(e)})
+        pages_processed = 0
+        total_annotations = 0
+        all_errors: list[dict] = []
+        for page_num, outcome in zip(pages, page_outcomes):
+            if isinstance(outcome, BaseException):
+                all_errors.append({"page": page_num, "error": str(outcome)})
+                continue
+            count, errors = outcome
+            pages_processed += 1
+            total_annotations += count
+            all_errors.extend(errors)
 
-        return total_results
+        return {
+            "pages_processed": pages_processed,
+            "total_annotations": total_annotations,
+            "errors": all_errors,
+        }
     except Exception as e:
         return JSONResponse({"error": f"일괄 사전 생성 실패: {e}"}, status_code=500)
 
@@ -1038,37 +1196,72 @@ async def api_dict_generate_batch(interp_id: str, body: DictBatchRequest | None
 # ── 사전 내보내기/가져오기 ──
 
 
+@functools.lru_cache(maxsize=256)
+def _load_meta(path_str: str, mtime_ns: int) -> tuple[str | None, str | None]:
+    """interpretation.json에서 (document_id, document_title)을 읽는다.
+
+    왜 mtime_ns를 키에 넣는가: 메타 파일은 거의 바뀌지 않으므로 내보내기마다
+    다시 파싱할 필요가 없다. 파일이 수정되면 mtime이 달라져 자연히 새로 읽는다.
+    """
+    meta = read_json(path_str)
+    return meta.get("document_id"), meta.get("document_title")
+
+
+def _interp_document_meta(interp_path: Path, interp_id: str) -> tuple[str, str]:
+    """해석이 가리키는 문헌의 (doc_id, doc_title). 메타 파일이 없으면 interp_id로 대체."""
+    meta_file = interp_path / "interpretation.json"
+    try:
+        st = meta_file.stat()
+    except FileNotFoundError:
+        return interp_id, interp_id
+    doc_id, doc_title = _load_meta(str(meta_file), st.st_mtime_ns)
+    return doc_id or interp_id, doc_title or interp_id
+
+
+async def _stream_dictionary_json(data: dict, entries_per_chunk: int = 200):
+    """내보내기 dict를 JSON bytes 조각으로 나눠 내보낸다.
+
+    왜 dict를 그대로 반환하지 않는가: FastAPI가 jsonable_encoder로 사본을 만든 뒤
+    다시 직렬화하므로 큰 사전에서는 메모리가 두 배로 든다.
+    키 순서는 원래 dict와 같고, entries만 entries_per_chunk개씩 묶어 보낸다.
+    """
+    yield b"{"
+    for i, (key, value) in enumerate(data.items()):
+        prefix = (b"," if i else b"") + dumps(key) + b":"
+        if key != "entries":
+            yield prefix + dumps(value)
+            continue
+        yield prefix + b"["
+        for start in range(0, len(value), entries_per_chunk):
+            chunk = b",".join(dumps(e) for e in value[start:start + entries_per_chunk])
+            yield (b"," if start else b"") + chunk
+            # 큰 사전을 직렬화하는 동안 다른 요청이 이벤트 루프를 쓸 수 있도록 양보
+            await asyncio.sleep(0)
+        yield b"]"
+    yield b"}"
+
+
 @router.get("/api/interpretations/{interp_id}/export/dictionary")
-async def api_export_dictionary(interp_id: str, page_start: int | None = None, page_end: int | None = None):
+async def api_export_dictionary(
+    interp_id: str,
+    page_start: int | None = None,
+    page_end: int | None = None,
+    interp_path: Path = Depends(require_interp),
+):
     """사전 내보내기.
 
     목적: 해석의 L7 사전형 주석을 독립 사전 JSON으로 추출한다.
     쿼리 파라미터: page_start, page_end — 페이지 범위 (선택).
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse({"error": f"해석 '{interp_id}'를 찾을 수 없습니다."}, status_code=404)
-
     # 문서 정보 가져오기
-    meta_file = interp_path / "interpretation.json"
-    doc_id = interp_id
-    doc_title = interp_id
-    if meta_file.exists():
-        import json as _json
-        with open(meta_file, encoding="utf-8") as f:
-            meta = _json.load(f)
-        doc_id = meta.get("document_id", interp_id)
-        doc_title = meta.get("document_title", interp_id)
+    doc_id, doc_title = _interp_document_meta(interp_path, interp_id)
 
     page_range = None
     if page_start is not None and page_end is not None:
         page_range = (page_start, page_end)
 
-    result = export_dictionary(
+    result = await asyncio.to_thread(
+        export_dictionary,
         interp_path=interp_path,
         doc_id=doc_id,
         doc_title=doc_title,
@@ -1076,36 +1269,22 @@ async def api_export_dictionary(interp_id: str, page_start: int | None = None, p
         page_range=page_range,
     )
 
-    return result
+    return StreamingResponse(_stream_dictionary_json(result), media_type="application/json")
 
 
 @router.post("/api/interpretations/{interp_id}/export/dictionary/save")
-async def api_save_export(interp_id: str):
+async def api_save_export(interp_id: str, interp_path: Path = Depends(require_interp)):
     """사전 내보내기 파일 저장.
 
     목적: 내보내기 결과를 해석 저장소의 exports/ 디렉토리에 저장한다.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse({"error": f"해석 '{interp_id}'를 찾을 수 없습니다."}, status_code=404)
-
     # 먼저 전체 내보내기 생성
-    meta_file = interp_path / "interpretation.json"
-    doc_id = interp_id
-    doc_title = interp_id
-    if meta_file.exists():
-        import json as _json
-        with open(meta_file, encoding="utf-8") as f:
-            meta = _json.load(f)
-        doc_id = meta.get("document_id", interp_id)
-        doc_title = meta.get("document_title", interp_id)
-
-    dictionary_data = export_dictionary(interp_path, doc_id, doc_title, interp_id)
-    saved_path = save_export(interp_path, dictionary_data)
+    doc_id, doc_title = _interp_document_meta(interp_path, interp_id)
+
+    dictionary_data = await asyncio.to_thread(
+        export_dictionary, interp_path, doc_id, doc_title, interp_id
+    )
+    saved_path = await asyncio.to_thread(save_export, interp_path, dictionary_data)
 
     return {
         "saved_path": str(saved_path),
@@ -1114,20 +1293,16 @@ async def api_save_export(interp_id: str):
 
 
 @router.post("/api/interpretations/{interp_id}/import/dictionary")
-async def api_import_dictionary(interp_id: str, body: DictImportRequest):
+async def api_import_dictionary(
+    body: DictImportRequest,
+    interp_path: Path = Depends(require_interp),
+):
     """사전 가져오기.
 
     목적: 다른 문헌에서 내보낸 사전을 현재 해석에 병합한다.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse({"error": f"해석 '{interp_id}'를 찾을 수 없습니다."}, status_code=404)
-
-    result = import_dictionary(
+    result = await asyncio.to_thread(
+        import_dictionary,
         interp_path=interp_path,
         dictionary_data=body.dictionary_data,
         target_page=body.target_page,
@@ -1141,50 +1316,34 @@ async def api_import_dictionary(interp_id: str, body: DictImportRequest):
 
 
 @router.get("/api/interpretations/{interp_id}/reference-dicts")
-async def api_list_reference_dicts(interp_id: str):
+async def api_list_reference_dicts(interp_path: Path = Depends(require_interp)):
     """참조 사전 목록 조회.
 
     목적: 등록된 참조 사전 파일 목록을 반환한다.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse({"error": f"해석 '{interp_id}'를 찾을 수 없습니다."}, status_code=404)
-
-    dicts = list_reference_dicts(interp_path)
-    return {"reference_dicts": dicts}
+    dicts = await asyncio.to_thread(list_reference_dicts, interp_path)
+    return FastJSONResponse({"reference_dicts": dicts})
 
 
 @router.post("/api/interpretations/{interp_id}/reference-dicts")
-async def api_register_reference_dict(interp_id: str, body: RefDictRegisterRequest):
+async def api_register_reference_dict(
+    body: RefDictRegisterRequest,
+    interp_path: Path = Depends(require_interp),
+):
     """참조 사전 등록.
 
     목적: 내보내기된 사전 파일을 참조 사전으로 등록한다.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse({"error": f"해석 '{interp_id}'를 찾을 수 없습니다."}, status_code=404)
-
-    saved_path = register_reference_dict(interp_path, body.dictionary_data, body.filename)
+    saved_path = await asyncio.to_thread(
+        register_reference_dict, interp_path, body.dictionary_data, body.filename
+    )
     return {"saved_path": str(saved_path), "filename": saved_path.name}
 
 
 @router.delete("/api/interpretations/{interp_id}/reference-dicts/{filename}")
-async def api_remove_reference_dict(interp_id: str, filename: str):
+async def api_remove_reference_dict(filename: str, interp_path: Path = Depends(require_interp)):
     """참조 사전 삭제."""
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    removed = remove_reference_dict(interp_path, filename)
+    removed = await asyncio.to_thread(remove_reference_dict, interp_path, filename)
     if not removed:
         return JSONResponse({"error": f"참조 사전 '{filename}'을 찾을 수 없습니다."}, status_code=404)
 
@@ -1192,22 +1351,22 @@ async def api_remove_reference_dict(interp_id: str, filename: str):
 
 
 @router.post("/api/interpretations/{interp_id}/reference-dicts/match")
-async def api_match_reference_dicts(interp_id: str, body: RefDictMatchRequest):
+async def api_match_reference_dicts(
+    body: RefDictMatchRequest,
+    interp_path: Path = Depends(require_interp),
+):
     """참조 사전 매칭.
 
     목적: 원문 블록에서 참조 사전의 표제어를 자동 매칭한다.
     입력: blocks — [{block_id, text}, ...], ref_filenames — 사용할 참조 사전 (선택).
     출력: 매칭 결과 리스트.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse({"error": f"해석 '{interp_id}'를 찾을 수 없습니다."}, status_code=404)
-
-    matches = match_page_blocks(interp_path, body.blocks, body.ref_filenames)
+    matches = await asyncio.to_thread(
+        match_page_blocks,
+        interp_path,
+        [b.model_dump() for b in body.blocks],
+        body.ref_filenames,
+    )
 
     return {"matches": matches}
 
@@ -1216,39 +1375,184 @@ async def api_match_reference_dicts(interp_id: str, body: RefDictMatchRequest):
 
 
 @router.get("/api/interpretations/{interp_id}/pages/{page_num}/annotations/translation-changed")
-async def api_check_translation_changed(interp_id: str, page_num: int):
+async def api_check_translation_changed(page_num: int, interp_path: Path = Depends(require_interp)):
     """번역 변경 감지.
 
     목적: 주석의 translation_snapshot과 현재 번역을 비교하여 변경 여부를 반환한다.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse({"error": f"해석 '{interp_id}'를 찾을 수 없습니다."}, status_code=404)
-
     part_id = "main"
-    ann_data = load_annotations(interp_path, part_id, page_num)
+    ann_data = await _load_page_annotations(interp_path, part_id, page_num)
 
     from core.translation import load_translations
-    tr_data = load_translations(interp_path, part_id, page_num)
+    tr_data = await asyncio.to_thread(load_translations, interp_path, part_id, page_num)
 
     changed = check_translation_changed(ann_data, tr_data)
-    return {"translation_changed": len(changed) > 0, "changed_annotations": changed}
+    return FastJSONResponse(
+        {"translation_changed": len(changed) > 0, "changed_annotations": changed}
+    )
 
 
 # ──────────────────────────────────────
 # 인용 마크 (Citation Mark) API
 # ──────────────────────────────────────
 
+# 인용 마크 지연 저장.
+# 라벨·태그를 연달아 고치면 편집마다 파일 전체를 다시 쓰게 되므로,
+# 마지막 편집 뒤 이 시간(초) 동안 추가 편집이 없을 때 한 번만 쓴다.
+# git 커밋은 schedule_interp_commit이 따로 모아서 한다.
+#
+# 응답은 파일에 쓰기 전에 나가므로, 지연된 쓰기가 실패해도 편집을 버리지 않는다.
+# 실패한 페이지는 예약 항목을 그대로 남겨 다음 flush에서 다시 쓰고,
+# 그 페이지의 다음 편집은 미루지 않고 즉시 써서 실패를 그 요청의 오류로 돌려준다.
+_CITATION_SAVE_DEBOUNCE_SEC = 0.3
+# (해석 경로, part_id, page_num)
+#   → (예약된 타이머 — 쓰는 중·실패 후면 None, 메모리상의 최신 페이지 데이터)
+_pending_citation_saves: dict[
+    tuple[Path, str, int], tuple[asyncio.TimerHandle | None, dict]
+] = {}
+# 마지막 쓰기가 실패한 페이지 → 오류 메시지. 쓰기가 성공하면 지운다.
+_citation_save_errors: dict[tuple[Path, str, int], str] = {}
+# 같은 페이지의 쓰기가 겹쳐 옛 데이터가 나중에 덮어쓰지 않도록 쓰기를 직렬화한다.
+# (_page_locks와 같이 약한 참조로 보관 — 쓰는 중에만 살아 있다)
+_citation_write_locks: weakref.WeakValueDictionary[tuple[Path, str, int], asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+# 편집 API의 "읽기 → 수정 → 저장 예약"을 페이지 단위로 직렬화한다.
+# 읽기가 to_thread로 양보하는 사이 같은 페이지의 다른 편집이 같은 파일 상태를 읽으면,
+# 나중에 예약한 쪽이 먼저 예약한 편집을 덮어쓴다. 쓰기 잠금과 따로 두는 이유는
+# 저장 예약이 실패 후 즉시 쓰기(_write_citation_marks)에서 쓰기 잠금을 잡기 때문이다.
+_citation_page_locks: weakref.WeakValueDictionary[tuple[Path, str, int], asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _citation_page_lock(interp_path: Path, part_id: str, page_num: int) -> asyncio.Lock:
+    """페이지 인용 마크의 편집(읽기 → 수정 → 저장 예약)을 직렬화하는 잠금."""
+    return _citation_page_locks.setdefault((interp_path, part_id, page_num), asyncio.Lock())
+
+
+async def _load_page_citation_marks(interp_path: Path, part_id: str, page_num: int) -> dict:
+    """페이지 인용 마크를 읽는다. 아직 파일에 쓰지 않은 편집이 있으면 그 데이터의 사본을 돌려준다.
+
+    사본을 주는 이유: 호출자가 고친 뒤 검증에 실패하면 예약된 데이터가 오염되지 않아야 하고,
+    워커 스레드가 직렬화하는 중인 dict를 이벤트 루프에서 건드리지 않아야 한다.
+    """
+    pending = _pending_citation_saves.get((interp_path, part_id, page_num))
+    if pending is not None:
+        return copy.deepcopy(pending[1])
+    return await asyncio.to_thread(load_citation_marks, interp_path, part_id, page_num)
+
+
+async def _schedule_citation_save(
+    interp_path: Path, part_id: str, page_num: int, data: dict,
+) -> None:
+    """검증은 지금 하고, 파일 쓰기는 _CITATION_SAVE_DEBOUNCE_SEC 뒤로 미룬다.
+
+    검증을 먼저 하므로 잘못된 편집은 기존처럼 호출한 요청에서 400으로 돌려줄 수 있다.
+    이 페이지의 직전 지연 쓰기가 실패했다면 미루지 않고 지금 쓴다 — 또 실패하면
+    예외가 호출한 요청으로 올라가므로 저장되지 않은 편집을 성공으로 알리지 않는다.
+    Raises: jsonschema.ValidationError — 스키마 불일치 시.
+            OSError 등 — 직전 쓰기 실패 후 즉시 쓰기도 실패했을 때.
+    """
+    validate_citation_marks(data)
+    key = (interp_path, part_id, page_num)
+    pending = _pending_citation_saves.get(key)
+    if pending is not None and pending[0] is not None:
+        pending[0].cancel()
+    if key in _citation_save_errors:
+        _pending_citation_saves[key] = (None, data)
+        await _write_citation_marks(key, data, raise_on_error=True)
+        return
+    handle = asyncio.get_running_loop().call_later(
+        _CITATION_SAVE_DEBOUNCE_SEC, _flush_citation_save, key
+    )
+    _pending_citation_saves[key] = (handle, data)
+
+
+def _flush_citation_save(key: tuple[Path, str, int]) -> None:
+    """디바운스 타이머 만료 시 호출 — 예약된 데이터를 워커 스레드에서 쓴다.
+
+    항목은 쓰기가 끝날 때까지 남겨 두어, 그 사이의 읽기가 옛 파일을 보지 않게 한다.
+    """
+    _handle, data = _pending_citation_saves[key]
+    _pending_citation_saves[key] = (None, data)
+    asyncio.create_task(
+        _write_citation_marks(key, data),
+        name=f"save-citation-marks:{key[0].name}:{key[2]}",
+    )
+
+
+async def _write_citation_marks(
+    key: tuple[Path, str, int], data: dict, *, raise_on_error: bool = False,
+) -> None:
+    """예약된 페이지 데이터를 파일에 쓴다.
+
+    실패하면 예약 항목을 남기고 _citation_save_errors에 기록한다 (다음 flush·편집에서 재시도).
+    raise_on_error가 True면 예외를 호출자에게 다시 던진다.
+    """
+    interp_path, part_id, page_num = key
+    try:
+        async with _citation_write_locks.setdefault(key, asyncio.Lock()):
+            await asyncio.to_thread(save_citation_marks, interp_path, part_id, page_num, data)
+    except Exception as e:
+        _citation_save_errors[key] = str(e)
+        logger.error("인용 마크 저장 실패 (%s page %s): %s", interp_path.name, page_num, e)
+        if raise_on_error:
+            raise
+        return
+    _citation_save_errors.pop(key, None)
+    pending = _pending_citation_saves.get(key)
+    # 쓰는 동안 새 편집이 예약되지 않았을 때만 항목을 치운다.
+    if pending is not None and pending[0] is None and pending[1] is data:
+        del _pending_citation_saves[key]
+
+
+async def _flush_citation_saves_now(interp_path: Path) -> None:
+    """해석 저장소의 예약된 인용 마크 저장을 지금 실행한다.
+
+    파일을 직접 훑는 list_all_citation_marks 앞에서 호출해 최신 편집이 보이게 한다.
+    직전 쓰기가 실패한 페이지도 여기서 다시 쓴다.
+    """
+    for key, (handle, data) in list(_pending_citation_saves.items()):
+        if key[0] != interp_path:
+            continue
+        if handle is None and key not in _citation_save_errors:
+            continue  # 이미 쓰는 중
+        if handle is not None:
+            handle.cancel()
+        _pending_citation_saves[key] = (None, data)
+        await _write_citation_marks(key, data)
+
+
+def flush_pending_citation_saves() -> list[tuple[Path, str, int]]:
+    """서버 종료 시 호출 — 아직 쓰지 않은(또는 쓰기에 실패한) 인용 마크를 동기적으로 저장한다.
+
+    출력: 끝내 저장하지 못한 페이지 키 목록. 각 페이지는 오류 로그로도 남긴다.
+    """
+    failed = []
+    for key, (handle, data) in list(_pending_citation_saves.items()):
+        if handle is not None:
+            handle.cancel()
+        try:
+            save_citation_marks(*key, data)
+        except Exception as e:
+            failed.append(key)
+            logger.error(
+                "종료 중 인용 마크 저장 실패 — 이 페이지의 편집은 기록되지 않았습니다 "
+                "(%s page %s): %s",
+                key[0].name, key[2], e,
+            )
+    _pending_citation_saves.clear()
+    _citation_save_errors.clear()
+    return failed
+
 
 @router.get("/api/interpretations/{interp_id}/pages/{page_num}/citation-marks")
 async def api_get_citation_marks(
     interp_id: str,
     page_num: int,
     part_id: str = Query("main", description="권 식별자"),
+    interp_path: Path = Depends(require_interp),
 ):
     """페이지의 인용 마크 목록을 반환한다.
 
@@ -1259,80 +1563,46 @@ async def api_get_citation_marks(
         part_id — 권 식별자.
     출력: {part_id, page_number, marks: [...]}.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse(
-            {"error": f"해석 저장소를 찾을 수 없습니다: {interp_id}"},
-            status_code=404,
-        )
-
-    return load_citation_marks(interp_path, part_id, page_num)
+    data = await _load_page_citation_marks(interp_path, part_id, page_num)
+    return FastJSONResponse(data)
 
 
 @router.post("/api/interpretations/{interp_id}/pages/{page_num}/citation-marks")
 async def api_add_citation_mark(
-    interp_id: str,
     page_num: int,
     body: CitationMarkAddRequest,
     part_id: str = Query("main", description="권 식별자"),
+    interp_path: Path = Depends(require_interp),
 ):
     """인용 마크를 추가한다.
 
     목적: 연구자가 원문 또는 번역에서 텍스트를 드래그하여 인용 마크를 생성.
     입력:
-        body — {block_id, start, end, marked_from, source_text_snapshot, label?, tags?}.
+        body — {source: {block_id, start, end}, marked_from, source_text_snapshot, label?, tags?}.
     출력: 추가된 인용 마크.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
+    async with _citation_page_lock(interp_path, part_id, page_num):
+        data = await _load_page_citation_marks(interp_path, part_id, page_num)
+        mark = body.model_dump()
 
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse(
-            {"error": f"해석 저장소를 찾을 수 없습니다: {interp_id}"},
-            status_code=404,
-        )
-
-    data = load_citation_marks(interp_path, part_id, page_num)
-    mark = {
-        "source": {
-            "block_id": body.block_id,
-            "start": body.start,
-            "end": body.end,
-        },
-        "marked_from": body.marked_from,
-        "source_text_snapshot": body.source_text_snapshot,
-        "label": body.label,
-        "tags": body.tags,
-    }
-
-    try:
-        added = add_citation_mark(data, mark)
-        save_citation_marks(interp_path, part_id, page_num, data)
-        # git commit을 별도 스레드에서 실행하여 이벤트 루프 블로킹 방지
-        asyncio.get_event_loop().create_task(
-            asyncio.to_thread(
-                git_commit_interpretation, interp_path,
-                f"feat: 인용 마크 추가 — page {page_num}, {body.block_id}",
+        try:
+            added = add_citation_mark(data, mark)
+            await _schedule_citation_save(interp_path, part_id, page_num, data)
+            schedule_interp_commit(
+                interp_path, f"feat: 인용 마크 추가 — page {page_num}, {body.source.block_id}"
             )
-        )
-        return added
-    except Exception as e:
-        return JSONResponse({"error": f"인용 마크 추가 실패: {e}"}, status_code=400)
+            return added
+        except Exception as e:
+            return JSONResponse({"error": f"인용 마크 추가 실패: {e}"}, status_code=400)
 
 
 @router.put("/api/interpretations/{interp_id}/pages/{page_num}/citation-marks/{mark_id}")
 async def api_update_citation_mark(
-    interp_id: str,
     page_num: int,
     mark_id: str,
     body: CitationMarkUpdateRequest,
     part_id: str = Query("main", description="권 식별자"),
+    interp_path: Path = Depends(require_interp),
 ):
     """인용 마크를 수정한다.
 
@@ -1342,58 +1612,43 @@ async def api_update_citation_mark(
         body — 수정할 필드.
     출력: 수정된 인용 마크.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse(
-            {"error": f"해석 저장소를 찾을 수 없습니다: {interp_id}"},
-            status_code=404,
-        )
-
-    data = load_citation_marks(interp_path, part_id, page_num)
-
-    # body에서 None이 아닌 필드만 업데이트
-    updates = {}
-    if body.label is not None:
-        updates["label"] = body.label
-    if body.tags is not None:
-        updates["tags"] = body.tags
-    if body.citation_override is not None:
-        updates["citation_override"] = body.citation_override
-    if body.status is not None:
-        updates["status"] = body.status
-    if body.marked_from is not None:
-        updates["marked_from"] = body.marked_from
-
-    updated = update_citation_mark(data, mark_id, updates)
-    if updated is None:
-        return JSONResponse(
-            {"error": f"인용 마크를 찾을 수 없습니다: {mark_id}"},
-            status_code=404,
-        )
-
-    try:
-        save_citation_marks(interp_path, part_id, page_num, data)
-        asyncio.get_event_loop().create_task(
-            asyncio.to_thread(
-                git_commit_interpretation, interp_path,
-                f"fix: 인용 마크 수정 — {mark_id}",
+    async with _citation_page_lock(interp_path, part_id, page_num):
+        data = await _load_page_citation_marks(interp_path, part_id, page_num)
+
+        # body에서 None이 아닌 필드만 업데이트
+        updates = {}
+        if body.label is not None:
+            updates["label"] = body.label
+        if body.tags is not None:
+            updates["tags"] = body.tags
+        if body.citation_override is not None:
+            updates["citation_override"] = body.citation_override
+        if body.status is not None:
+            updates["status"] = body.status
+        if body.marked_from is not None:
+            updates["marked_from"] = body.marked_from
+
+        updated = update_citation_mark(data, mark_id, updates)
+        if updated is None:
+            return JSONResponse(
+                {"error": f"인용 마크를 찾을 수 없습니다: {mark_id}"},
+                status_code=404,
             )
-        )
-        return updated
-    except Exception as e:
-        return JSONResponse({"error": f"인용 마크 수정 실패: {e}"}, status_code=400)
+
+        try:
+            await _schedule_citation_save(interp_path, part_id, page_num, data)
+            schedule_interp_commit(interp_path, f"fix: 인용 마크 수정 — {mark_id}")
+            return updated
+        except Exception as e:
+            return JSONResponse({"error": f"인용 마크 수정 실패: {e}"}, status_code=400)
 
 
 @router.delete("/api/interpretations/{interp_id}/pages/{page_num}/citation-marks/{mark_id}")
 async def api_delete_citation_mark(
-    interp_id: str,
     page_num: int,
     mark_id: str,
     part_id: str = Query("main", description="권 식별자"),
+    interp_path: Path = Depends(require_interp),
 ):
     """인용 마크를 삭제한다.
 
@@ -1401,62 +1656,47 @@ async def api_delete_citation_mark(
     입력: mark_id — 인용 마크 ID.
     출력: {status: "deleted"}.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse(
-            {"error": f"해석 저장소를 찾을 수 없습니다: {interp_id}"},
-            status_code=404,
-        )
-
-    data = load_citation_marks(interp_path, part_id, page_num)
-    removed = remove_citation_mark(data, mark_id)
-
-    if not removed:
-        return JSONResponse(
-            {"error": f"인용 마크를 찾을 수 없습니다: {mark_id}"},
-            status_code=404,
-        )
+    async with _citation_page_lock(interp_path, part_id, page_num):
+        data = await _load_page_citation_marks(interp_path, part_id, page_num)
+        removed = remove_citation_mark(data, mark_id)
 
-    try:
-        save_citation_marks(interp_path, part_id, page_num, data)
-        asyncio.get_event_loop().create_task(
-            asyncio.to_thread(
-                git_commit_interpretation, interp_path,
-                f"fix: 인용 마크 삭제 — {mark_id}",
+        if not removed:
+            return JSONResponse(
+                {"error": f"인용 마크를 찾을 수 없습니다: {mark_id}"},
+                status_code=404,
             )
-        )
-        return {"status": "deleted", "mark_id": mark_id}
-    except Exception as e:
-        return JSONResponse({"error": f"인용 마크 삭제 실패: {e}"}, status_code=400)
+
+        try:
+            await _schedule_citation_save(interp_path, part_id, page_num, data)
+            schedule_interp_commit(interp_path, f"fix: 인용 마크 삭제 — {mark_id}")
+            return {"status": "deleted", "mark_id": mark_id}
+        except Exception as e:
+            return JSONResponse({"error": f"인용 마크 삭제 실패: {e}"}, status_code=400)
 
 
 @router.get("/api/interpretations/{interp_id}/citation-marks/all")
 async def api_list_all_citation_marks(
+    request: Request,
     interp_id: str,
     part_id: str = Query("main", description="권 식별자"),
+    interp_path: Path = Depends(require_interp),
 ):
     """전체 페이지의 인용 마크를 통합 수집하여 반환한다.
 
     목적: 인용 패널의 "전체 보기" 모드.
     입력: interp_id, part_id.
     출력: [{page_number, id, source, ...}, ...].
+          마크 파일들의 stat으로 ETag를 붙이고, 바뀌지 않았으면 304로 답한다.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse(
-            {"error": f"해석 저장소를 찾을 수 없습니다: {interp_id}"},
-            status_code=404,
-        )
-
-    return list_all_citation_marks(interp_path, part_id)
+    await _flush_citation_saves_now(interp_path)
+    etag = files_etag(
+        await asyncio.to_thread(citation_marks_signature, interp_path, part_id)
+    )
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    marks = await asyncio.to_thread(list_all_citation_marks, interp_path, part_id)
+    return FastJSONResponse(marks, headers={"ETag": etag, "Cache-Control": "no-cache"})
 
 
 @router.post("/api/interpretations/{interp_id}/pages/{page_num}/citation-marks/{mark_id}/resolve")
@@ -1465,6 +1705,7 @@ async def api_resolve_citation_mark(
     page_num: int,
     mark_id: str,
     part_id: str = Query("main", description="권 식별자"),
+    interp_path: Path = Depends(require_interp),
 ):
     """인용 마크 1개의 통합 컨텍스트(L4+L5+L6+L7+서지정보)를 조회한다.
 
@@ -1473,23 +1714,10 @@ async def api_resolve_citation_mark(
     출력: {mark, original_text, punctuated_text, translations, annotations, bibliography, text_changed}.
     """
     _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse(
-            {"error": f"해석 저장소를 찾을 수 없습니다: {interp_id}"},
-            status_code=404,
-        )
 
     # 인용 마크 찾기
-    data = load_citation_marks(interp_path, part_id, page_num)
-    mark = None
-    for m in data.get("marks", []):
-        if m["id"] == mark_id:
-            mark = m
-            break
+    data = await _load_page_citation_marks(interp_path, part_id, page_num)
+    mark = find_citation_mark(data, mark_id)
 
     if mark is None:
         return JSONResponse(
@@ -1498,17 +1726,19 @@ async def api_resolve_citation_mark(
         )
 
     # 문서 ID 조회 (해석 매니페스트에서)
-    manifest_path = interp_path / "manifest.json"
-    if not manifest_path.exists():
+    try:
+        manifest = await asyncio.to_thread(load_manifest, interp_path / "manifest.json")
+    except FileNotFoundError:
         return JSONResponse(
             {"error": "해석 매니페스트를 찾을 수 없습니다."},
             status_code=404,
         )
-    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
     doc_id = manifest.get("source_document_id", "")
 
     try:
-        context = resolve_citation_context(
+        # 4개 레이어 파일을 읽으므로 워커 스레드에서 처리해 이벤트 루프를 막지 않는다.
+        context = await asyncio.to_thread(
+            resolve_citation_context,
             library_path=_library_path,
             doc_id=doc_id,
             interp_path=interp_path,
@@ -1523,9 +1753,9 @@ async def api_resolve_citation_mark(
 
 @router.post("/api/interpretations/{interp_id}/citation-marks/export")
 async def api_export_citations(
-    interp_id: str,
     body: CitationExportRequest,
     part_id: str = Query("main", description="권 식별자"),
+    interp_path: Path = Depends(require_interp),
 ):
     """선택한 인용 마크들을 학술 인용 형식으로 변환한다.
 
@@ -1534,32 +1764,36 @@ async def api_export_citations(
         body — {mark_ids: [...], include_translation: bool}.
     출력: {citations: "formatted text", count: N}.
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
+    # 선택한 마크가 없으면 권 전체 마크를 훑을 필요가 없다.
+    if not body.mark_ids:
+        return FastJSONResponse({"citations": "", "count": 0, "skipped": 0})
 
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse(
-            {"error": f"해석 저장소를 찾을 수 없습니다: {interp_id}"},
-            status_code=404,
-        )
+    _library_path = get_library_path()
 
     # 문서 ID 조회
-    manifest_path = interp_path / "manifest.json"
-    if not manifest_path.exists():
+    try:
+        manifest = await asyncio.to_thread(load_manifest, interp_path / "manifest.json")
+    except FileNotFoundError:
         return JSONResponse(
             {"error": "해석 매니페스트를 찾을 수 없습니다."},
             status_code=404,
         )
-    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
     doc_id = manifest.get("source_document_id", "")
+    if not doc_id:
+        return JSONResponse(
+            {"error": "해석 매니페스트에 source_document_id가 없습니다."},
+            status_code=400,
+        )
 
     # 전체 마크에서 선택된 것 찾기
-    all_marks = list_all_citation_marks(interp_path, part_id)
-    mark_map = {m["id"]: m for m in all_marks}
-
-    contexts = []
+    await _flush_citation_saves_now(interp_path)
+    all_marks = await asyncio.to_thread(list_all_citation_marks, interp_path, part_id)
+    # 선택된 마크만 색인한다 (권 전체 마크를 다 담지 않도록).
+    wanted = set(body.mark_ids)
+    mark_map = {m["id"]: m for m in all_marks if m["id"] in wanted}
+
+    # 같은 페이지의 마크를 묶어 페이지 파일(번역·주석·표점 등)을 한 번만 읽는다.
+    by_page: dict[int, list[dict]] = {}
     skipped = 0
     for mid in body.mark_ids:
         if mid not in mark_map:
@@ -1567,35 +1801,36 @@ async def api_export_citations(
             skipped += 1
             continue
         mark = mark_map[mid]
-        page_num = mark.get("page_number", 1)
-        try:
-            ctx = resolve_citation_context(
-                library_path=_library_path,
-                doc_id=doc_id,
-                interp_path=interp_path,
-                part_id=part_id,
-                page_num=page_num,
-                mark=mark,
-            )
-            contexts.append(ctx)
-        except Exception as e:
+        by_page.setdefault(mark.get("page_number", 1), []).append(mark)
+
+    resolved: dict[str, dict] = {}
+    for page_num, page_marks in by_page.items():
+        page_contexts, failures = await asyncio.to_thread(
+            resolve_citation_contexts_bulk,
+            _library_path, doc_id, interp_path, part_id, page_num, page_marks,
+        )
+        for ctx in page_contexts:
+            resolved[ctx["mark"]["id"]] = ctx
+        for mark, e in failures:
             logger.warning(
                 "인용 내보내기: mark '%s' (page %s) resolve 실패: %s",
-                mid, page_num, e,
+                mark["id"], page_num, e,
             )
             skipped += 1
-            continue
+
+    # 출력 순서는 사용자가 선택한 순서(body.mark_ids)를 따른다.
+    contexts = [resolved[mid] for mid in body.mark_ids if mid in resolved]
 
     citations_text = export_citations(
         contexts,
         include_translation=body.include_translation,
-        export_options=body.export_options,
+        export_options=body.export_options.model_dump() if body.export_options else None,
     )
-    return {
+    return FastJSONResponse({
         "citations": citations_text,
         "count": len(contexts),
         "skipped": skipped,
-    }
+    })
 
 
 # ──────────────────────────────────────────────────────────
@@ -1636,10 +1871,7 @@ async def api_llm_annotation_stream(body: AiAnnotationRequest):
     기존 api_llm_annotation과 동일한 결과를 반환하되,
     LLM 응답 대기 중 progress 이벤트를 실시간으로 전달한다.
     """
-    import asyncio
-    import json as _json
-
-    queue: asyncio.Queue = asyncio.Queue()
+    queue = make_llm_stream_queue()
 
     async def _run_llm():
         await _call_llm_text_stream(
@@ -1654,7 +1886,7 @@ async def api_llm_annotation_stream(body: AiAnnotationRequest):
             while True:
                 data = await queue.get()
                 event_type = data.get("type", "progress")
-                yield f"data: {_json.dumps(data, ensure_ascii=False)}\n\n"
+                yield sse_event(data)
                 if event_type in ("complete", "error"):
                     break
         finally:
@@ -1671,70 +1903,63 @@ async def api_llm_annotation_stream(body: AiAnnotationRequest):
     )
 
 
-class AnnotationBatchSaveRequest(BaseModel):
+class AnnotationBatchItem(_RequestModel):
+    """일괄 저장할 주석 1건. 빠진 필드는 AI 태깅 결과의 기본값으로 채운다."""
+    target: dict = {}
+    type: str = "term"
+    content: dict = {}
+    annotator: dict | None = Field(
+        default_factory=lambda: {"type": "llm", "model": None, "draft_id": None}
+    )
+    status: str = "draft"
+
+
+class AnnotationBatchSaveRequest(_RequestModel):
     """주석 일괄 저장 요청.
 
     왜 필요한가:
         AI 태깅 후 N개 주석을 개별 POST로 저장하면 N번의 왕복이 필요하다.
         이 엔드포인트는 1회 POST로 N개를 저장한다.
+    항목은 핸들러에서 하나씩 AnnotationBatchItem으로 검증한다. 목록 전체를 모델로 받으면
+    잘못된 항목 하나 때문에 요청 전체가 422가 되어, 나머지 항목도 저장되지 않는다.
     """
-    annotations: list[dict]
+    annotations: list[Any]
 
 
 @router.post(
     "/api/interpretations/{interp_id}/pages/{page_num}/annotations/{block_id}/batch"
 )
 async def api_batch_save_annotations(
-    interp_id: str, page_num: int, block_id: str,
+    page_num: int,
+    block_id: str,
     body: AnnotationBatchSaveRequest,
+    interp_path: Path = Depends(require_interp),
 ):
     """주석 일괄 저장. N건을 1 POST로 처리.
 
     입력: annotations — [{target, type, content}, ...] 배열.
     출력: {saved: N, errors: [...]}
     """
-    _library_path = get_library_path()
-    if _library_path is None:
-        return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-
-    interp_path = _library_path / "interpretations" / interp_id
-    if not interp_path.exists():
-        return JSONResponse(
-            {"error": f"해석 저장소 '{interp_id}'를 찾을 수 없습니다."},
-            status_code=404,
-        )
-
     part_id = "main"
-    data = load_annotations(interp_path, part_id, page_num)
+    async with _page_lock(interp_path, part_id, page_num):
+        data = await _load_page_annotations(interp_path, part_id, page_num)
 
-    saved = 0
-    errors = []
-    for i, ann in enumerate(body.annotations):
-        try:
-            annotation = {
-                "target": ann.get("target", {}),
-                "type": ann.get("type", "term"),
-                "content": ann.get("content", {}),
-                "annotator": ann.get("annotator", {
-                    "type": "llm", "model": None, "draft_id": None,
-                }),
-                "status": ann.get("status", "draft"),
-                "reviewed_by": None,
-                "reviewed_at": None,
-            }
-            add_ann(data, block_id, annotation)
-            saved += 1
-        except Exception as e:
-            errors.append({"index": i, "error": str(e)})
+        # 항목별로 검증해, 잘못된 항목은 errors에 모으고 나머지는 그대로 저장한다.
+        valid: list[dict] = []
+        errors: list[dict] = []
+        for i, ann in enumerate(body.annotations):
+            try:
+                valid.append(AnnotationBatchItem.model_validate(ann).model_dump())
+            except ValidationError as e:
+                errors.append({"index": i, "error": str(e)})
+        added = add_ann_many(data, block_id, valid)
+        saved = len(added)
 
-    try:
-        save_annotations(interp_path, part_id, page_num, data)
         try:
-            git_commit_interpretation(
+            await _save_page_annotations(interp_path, part_id, page_num, data)
+            schedule_interp_commit(
                 interp_path, f"feat: L7 주석 일괄 저장 — page {page_num} ({saved}건)"
             )
-        except Exception:
-            pass
-        return {"saved": saved, "errors": errors}
-    except Exception as e:
-        return JSONResponse({"error": f"주석 저장 실패: {e}"}, status_code=400)
+            return {"saved": saved, "errors": errors}
+        except Exception as e:
+            return JSONResponse({"error": f"주석 저장 실패: {e}"}, status_code=400)
@@ -6,15 +6,23 @@ server.py에서 분리된 문헌 CRUD, 텍스트/레이아웃/교정/서지정
 라우터 태그: documents
 """
 
-import json
+import asyncio
 import logging
+import shutil
+import tempfile
 from pathlib import Path
 
-from fastapi import APIRouter, BackgroundTasks, File, Form, Query, UploadFile
+from fastapi import APIRouter, BackgroundTasks, File, Form, Query, Request, UploadFile
 from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel
 
-from app._state import get_library_path, _get_llm_router
+from app._state import (
+    FastJSONResponse,
+    files_etag,
+    get_library_path,
+    not_modified,
+    _get_llm_router,
+)
 
 from core.document import (
     create_document_from_hwp,
@@ -30,6 +38,7 @@ from core.document import (
     get_pdf_path,
     git_commit_document,
     import_hwp_text_to_document,
+    list_page_texts,
     list_pages,
     match_hwp_text_to_layout_blocks,
     save_bibliography,
@@ -38,13 +47,15 @@ from core.document import (
     save_page_text,
 )
 from core.library import (
+    documents_signature,
     list_documents,
     trash_document,
 )
+from core.json_io import JSONDecodeError, loads, read_json, write_json_atomic
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(tags=["documents"])
+router = APIRouter(tags=["documents"], default_response_class=FastJSONResponse)
 
 
 # ── Pydantic 모델 ─────────────────────────────────
@@ -221,16 +232,154 @@ def _suggest_doc_id(title: str) -> str:
     return result[:64] if result else ""
 
 
+# 업로드 복사 단위. 파일 전체를 bytes로 읽지 않고 이 크기씩 옮긴다.
+_UPLOAD_COPY_CHUNK = 1 << 20
+
+
+async def _spool_upload(file: UploadFile, suffix: str) -> Path:
+    """업로드 파일을 임시 파일로 옮기고 그 경로를 반환한다. 삭제는 호출자 몫.
+
+    왜 file.read()가 아닌가:
+        수백 MB짜리 HWP/PDF를 한 번에 읽으면 업로드 크기만큼 메모리를 더 쓰고,
+        임시 파일에 쓰는 동안 이벤트 루프가 멈춘다.
+        UploadFile.file(SpooledTemporaryFile)에서 1MiB씩 복사하고,
+        복사 자체도 워커 스레드에서 한다.
+    """
+    def _copy() -> Path:
+        file.file.seek(0)
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+            tmp_path = Path(tmp.name)
+            try:
+                shutil.copyfileobj(file.file, tmp, _UPLOAD_COPY_CHUNK)
+            except BaseException:
+                # delete=False이므로 복사 도중 실패하면 직접 지워야 임시 파일이 남지 않는다.
+                tmp.close()
+                tmp_path.unlink(missing_ok=True)
+                raise
+        return tmp_path
+
+    return await asyncio.to_thread(_copy)
+
+
+class _PdfFileResponse(FileResponse):
+    """원본 PDF 서빙용 FileResponse. 한 번에 1MiB씩 읽어 보낸다.
+
+    왜 기본 FileResponse가 아닌가:
+        Starlette는 서버가 http.response.pathsend 확장을 지원하면 파일 전송을 서버에
+        넘기지만(제로카피), uvicorn은 지원하지 않아 64KiB씩 스레드 풀에서 읽어 보낸다.
+        수백 MB짜리 고서 스캔 PDF면 청크가 수천 개이고 청크마다 스레드 왕복이 생긴다.
+        청크를 키우면 왕복 횟수가 1/16로 준다. Range 요청(PDF.js 부분 로딩)도 그대로 동작한다.
+    """
+
+    chunk_size = 1024 * 1024
+
+
+# 이 크기 이하의 PDF 업로드는 임시 파일 없이 메모리에서 바로 연다.
+_PDF_IN_MEMORY_LIMIT = 16 * 1024 * 1024
+
+
+async def _read_upload_if_small(file: UploadFile, limit: int) -> bytes | None:
+    """업로드 크기가 limit 이하이면 내용을 bytes로 반환하고, 크거나 모르면 None.
+
+    왜 이렇게 하는가:
+        PDF는 PyMuPDF가 bytes에서 바로 열 수 있다. 작은 파일까지 임시 파일로
+        옮겨 쓰고 다시 읽으면 디스크를 두 번 지나간다. 큰 파일은 메모리를 아끼기 위해
+        지금처럼 _spool_upload로 옮긴다.
+    """
+    if file.size is None or file.size > limit:
+        return None
+
+    def _read() -> bytes:
+        file.file.seek(0)
+        return file.file.read()
+
+    return await asyncio.to_thread(_read)
+
+
+def _open_pdf_upload(
+    pdf_bytes: bytes | None, tmp_path: Path | None, filename: str | None,
+):
+    """_read_upload_if_small / _spool_upload 결과 중 있는 쪽으로 PdfTextExtractor를 연다."""
+    from text_import.pdf_extractor import PdfTextExtractor
+
+    if pdf_bytes is not None:
+        return PdfTextExtractor.from_bytes(pdf_bytes, filename or "<upload>")
+    return PdfTextExtractor(tmp_path)
+
+
+def _read_hwp_text(tmp_path: Path) -> str:
+    """HWP/HWPX 파일의 전체 텍스트를 뽑는다. 섹션 사이는 빈 줄로 잇는다.
+
+    동기 함수 — 파일 크기에 따라 수 초가 걸리므로 핸들러는 asyncio.to_thread로 부른다.
+    """
+    from hwp.reader import get_reader
+
+    reader = get_reader(tmp_path)
+    if hasattr(reader, "extract_sections"):
+        return "\n\n".join(s["text"] for s in reader.extract_sections())
+    return reader.extract_text()
+
+
+def _read_hwp_preview(
+    tmp_path: Path, head_len: int,
+) -> tuple[dict, str, int, int]:
+    """HWP/HWPX 미리보기용으로 (메타데이터, 앞부분 텍스트, 전체 길이, 섹션 수)를 뽑는다.
+
+    왜 _read_hwp_text를 쓰지 않는가:
+        미리보기는 앞 head_len자와 전체 길이만 필요하다. 책 한 권 분량의 HWP에서
+        섹션 전체를 하나의 문자열로 이어 붙였다가 앞부분만 자르면 문서 크기만큼
+        메모리를 잡는다. 섹션 단위로 앞부분만 잇고, 길이는 섹션 길이 합으로 계산한다.
+    """
+    from hwp.reader import get_reader
+
+    reader = get_reader(tmp_path)
+    metadata = reader.extract_metadata()
+
+    if not hasattr(reader, "extract_sections"):
+        full_text = reader.extract_text()
+        sections_count = len([
+            t for t in full_text.split("\n\n") if t.strip()
+        ])
+        return metadata, full_text[:head_len], len(full_text), sections_count
+
+    sections = reader.extract_sections()
+    head_pieces: list[str] = []
+    head_size = 0
+    for sec in sections:
+        if head_size >= head_len:
+            break
+        if head_pieces:
+            head_size += 2  # 구분자 "\n\n"
+        head_pieces.append(sec["text"])
+        head_size += len(sec["text"])
+    head = "\n\n".join(head_pieces)[:head_len]
+    # "\n\n".join과 같은 길이: 섹션 길이 합 + 구분자 2자 × (섹션 수 - 1)
+    total_len = sum(len(sec["text"]) for sec in sections)
+    if sections:
+        total_len += 2 * (len(sections) - 1)
+    return metadata, head, total_len, len(sections)
+
+
 # ── 문헌 CRUD API ──────────────────────────────
 
 
 @router.get("/api/documents")
-async def api_documents():
-    """서고의 문헌 목록을 반환한다."""
+async def api_documents(request: Request):
+    """서고의 문헌 목록을 반환한다.
+
+    manifest.json들의 stat으로 ETag를 붙이고, 바뀌지 않았으면 304로 답한다.
+    """
     _library_path = get_library_path()
     if _library_path is None:
         return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-    return list_documents(_library_path)
+    etag = files_etag(documents_signature(_library_path))
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    # manifest.json 내용 그대로라 jsonable_encoder 순회 없이 바로 직렬화한다.
+    return FastJSONResponse(
+        list_documents(_library_path), headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
 
 
 @router.delete("/api/documents/{doc_id}")
@@ -412,17 +561,12 @@ async def api_preview_hwp(file: UploadFile = File(...)):
             "sample_clean_text": str (첫 섹션의 정리 결과),
         }
     """
-    import tempfile
-
-    from hwp.reader import detect_format, get_reader
+    from hwp.reader import detect_format
     from hwp.text_cleaner import clean_hwp_text
 
     # 업로드된 파일을 임시 파일로 저장
     suffix = Path(file.filename or "").suffix or ".hwpx"
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = Path(tmp.name)
+    tmp_path = await _spool_upload(file, suffix)
 
     try:
         # 형식 감지
@@ -433,28 +577,18 @@ async def api_preview_hwp(file: UploadFile = File(...)):
                 status_code=400,
             )
 
-        # 텍스트 추출
-        reader = get_reader(tmp_path)
-        metadata = reader.extract_metadata()
-
-        if hasattr(reader, "extract_sections"):
-            sections = reader.extract_sections()
-            full_text = "\n\n".join(s["text"] for s in sections)
-            sections_count = len(sections)
-        else:
-            full_text = reader.extract_text()
-            sections_count = len([
-                t for t in full_text.split("\n\n") if t.strip()
-            ])
+        # 텍스트 추출 — 파싱은 동기·CPU 작업이므로 이벤트 루프 밖에서 돌린다
+        metadata, sample_text, full_text_length, sections_count = (
+            await asyncio.to_thread(_read_hwp_preview, tmp_path, 2000)
+        )
 
-        # 표점·현토 감지 (샘플)
-        sample_text = full_text[:2000]
-        sample_result = clean_hwp_text(sample_text)
+        # 표점·현토 감지 (샘플 — 앞 2000자)
+        sample_result = await asyncio.to_thread(clean_hwp_text, sample_text)
 
         return {
             "metadata": metadata,
-            "text_preview": full_text[:500],
-            "full_text_length": len(full_text),
+            "text_preview": sample_text[:500],
+            "full_text_length": full_text_length,
             "sections_count": sections_count,
             "detected_punctuation": sample_result.had_punctuation,
             "detected_hyeonto": sample_result.had_hyeonto,
@@ -500,8 +634,6 @@ async def api_import_hwp(
         - doc_id가 없으면 → 시나리오 2 (새 문헌 생성)
     출력: {document_id, title, mode, pages_saved, text_pages, cleaned_stats}
     """
-    import tempfile
-
     _library_path = get_library_path()
     if _library_path is None:
         return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
@@ -514,8 +646,8 @@ async def api_import_hwp(
     parsed_mapping = None
     if page_mapping:
         try:
-            parsed_mapping = json.loads(page_mapping)
-        except json.JSONDecodeError:
+            parsed_mapping = loads(page_mapping)
+        except JSONDecodeError:
             return JSONResponse(
                 {"error": "page_mapping이 올바른 JSON이 아닙니다."},
                 status_code=400,
@@ -523,10 +655,7 @@ async def api_import_hwp(
 
     # 업로드된 파일을 임시 파일로 저장
     suffix = Path(file.filename or "").suffix or ".hwpx"
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = Path(tmp.name)
+    tmp_path = await _spool_upload(file, suffix)
 
     try:
         doc_path = _library_path / "documents" / doc_id
@@ -535,7 +664,8 @@ async def api_import_hwp(
         if doc_path.exists() and manifest_path.exists():
             # 시나리오 1: 기존 문서에 텍스트 가져오기
             # manifest.json이 있는 정상 문헌에만 적용한다.
-            result = import_hwp_text_to_document(
+            result = await asyncio.to_thread(
+                import_hwp_text_to_document,
                 library_path=_library_path,
                 doc_id=doc_id,
                 hwp_file=tmp_path,
@@ -556,7 +686,8 @@ async def api_import_hwp(
                     "manifest 없는 불완전 문헌 디렉토리 발견: %s → %s 로 백업",
                     doc_path, backup_path,
                 )
-            result = create_document_from_hwp(
+            result = await asyncio.to_thread(
+                create_document_from_hwp,
                 library_path=_library_path,
                 hwp_file=tmp_path,
                 doc_id=doc_id,
@@ -641,10 +772,6 @@ async def api_pdf_analyze(file: UploadFile = File(...)):
             "detected_structure": {pattern_type, original_markers, ...} | null,
         }
     """
-    import tempfile
-
-    from text_import.pdf_extractor import PdfTextExtractor
-
     suffix = Path(file.filename or "").suffix or ".pdf"
     if suffix.lower() != ".pdf":
         return JSONResponse(
@@ -652,16 +779,22 @@ async def api_pdf_analyze(file: UploadFile = File(...)):
             status_code=400,
         )
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = Path(tmp.name)
+    pdf_bytes = await _read_upload_if_small(file, _PDF_IN_MEMORY_LIMIT)
+    tmp_path = None if pdf_bytes is not None else await _spool_upload(file, suffix)
+
+    def _sample() -> tuple[bool, int, list]:
+        extractor = _open_pdf_upload(pdf_bytes, tmp_path, file.filename)
+        try:
+            return (
+                extractor.has_text_layer(),
+                extractor.page_count,
+                extractor.get_sample_text(max_pages=3),
+            )
+        finally:
+            extractor.close()
 
     try:
-        extractor = PdfTextExtractor(tmp_path)
-        has_text = extractor.has_text_layer()
-        page_count = extractor.page_count
-        sample_pages = extractor.get_sample_text(max_pages=3)
+        has_text, page_count, sample_pages = await asyncio.to_thread(_sample)
 
         # 텍스트 레이어가 있으면 LLM으로 구조 분석 시도
         detected_structure = None
@@ -676,8 +809,6 @@ async def api_pdf_analyze(file: UploadFile = File(...)):
             except Exception as e:
                 logging.getLogger(__name__).warning("구조 분석 실패 (비치명적): %s", e)
 
-        extractor.close()
-
         return {
             "page_count": page_count,
             "has_text_layer": has_text,
@@ -690,10 +821,11 @@ async def api_pdf_analyze(file: UploadFile = File(...)):
             status_code=400,
         )
     finally:
-        try:
-            tmp_path.unlink()
-        except OSError:
-            pass
+        if tmp_path is not None:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
 
 
 @router.post("/api/text-import/hwp/separate")
@@ -717,9 +849,6 @@ async def api_hwp_separate(
       LLM 없이 각 줄의 \\p{Han} vs \\p{Hangul} 비율만으로 정확하게 분류할 수 있다.
       LLM은 느리고, 비용이 들고, 500자 제한 등 문제가 있었다.
     """
-    import tempfile
-
-    from hwp.reader import get_reader
     from text_import.common import separate_by_script
 
     suffix = Path(file.filename or "").suffix or ".hwpx"
@@ -729,25 +858,17 @@ async def api_hwp_separate(
             status_code=400,
         )
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = Path(tmp.name)
+    tmp_path = await _spool_upload(file, suffix)
 
     try:
         # HWP에서 전체 텍스트 추출
-        reader = get_reader(tmp_path)
-        if hasattr(reader, "extract_sections"):
-            sections = reader.extract_sections()
-            full_text = "\n\n".join(s["text"] for s in sections)
-        else:
-            full_text = reader.extract_text()
+        full_text = await asyncio.to_thread(_read_hwp_text, tmp_path)
 
         if not full_text.strip():
             return JSONResponse({"error": "텍스트가 비어 있습니다."}, status_code=400)
 
         # 유니코드 문자 유형 기반 분리
-        sep_result = separate_by_script(full_text)
+        sep_result = await asyncio.to_thread(separate_by_script, full_text)
 
         return {
             "method": "unicode_script",
@@ -796,8 +917,6 @@ async def api_pdf_separate(
       LLM 없이 각 줄의 \\p{Han} vs \\p{Hangul} 비율만으로 정확하게 분류할 수 있다.
       LLM은 느리고, 비용이 들고, API 키 미설정 시 사용 불가했다.
     """
-    import tempfile
-
     from text_import.common import separate_by_script
 
     suffix = Path(file.filename or "").suffix or ".pdf"
@@ -807,25 +926,22 @@ async def api_pdf_separate(
             status_code=400,
         )
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = Path(tmp.name)
+    pdf_bytes = await _read_upload_if_small(file, _PDF_IN_MEMORY_LIMIT)
+    tmp_path = None if pdf_bytes is not None else await _spool_upload(file, suffix)
 
-    try:
-        from text_import.pdf_extractor import PdfTextExtractor
-
-        extractor = PdfTextExtractor(tmp_path)
-        pages = extractor.extract_all_pages()
-        page_count = extractor.page_count
-        extractor.close()
+    def _extract_and_separate() -> dict:
+        """추출 + 페이지별 분리. 동기·CPU 작업이라 워커 스레드에서 돈다."""
+        extractor = _open_pdf_upload(pdf_bytes, tmp_path, file.filename)
+        try:
+            pages = extractor.extract_all_pages()
+            page_count = extractor.page_count
+        finally:
+            extractor.close()
 
         # 페이지별 유니코드 문자 유형 기반 분리
+        # 통계는 지역 정수로 누적하고 루프가 끝난 뒤 한 번만 dict로 만든다.
         results = []
-        total_stats = {
-            "total_lines": 0, "original_lines": 0,
-            "translation_lines": 0, "skipped_lines": 0,
-        }
+        total_lines = original_lines = translation_lines = skipped_lines = 0
 
         for page in pages:
             text = page.get("text", "").strip()
@@ -845,15 +961,26 @@ async def api_pdf_separate(
             })
 
             # 통계 누적
-            for key in total_stats:
-                total_stats[key] += sep["stats"].get(key, 0)
+            st = sep["stats"]
+            total_lines += st.get("total_lines", 0)
+            original_lines += st.get("original_lines", 0)
+            translation_lines += st.get("translation_lines", 0)
+            skipped_lines += st.get("skipped_lines", 0)
 
         return {
             "method": "unicode_script",
             "page_count": page_count,
-            "stats": total_stats,
+            "stats": {
+                "total_lines": total_lines,
+                "original_lines": original_lines,
+                "translation_lines": translation_lines,
+                "skipped_lines": skipped_lines,
+            },
             "results": results,
         }
+
+    try:
+        return await asyncio.to_thread(_extract_and_separate)
     except Exception as e:
         logging.getLogger(__name__).exception("PDF 텍스트 분리 실패")
         return JSONResponse(
@@ -861,10 +988,11 @@ async def api_pdf_separate(
             status_code=500,
         )
     finally:
-        try:
-            tmp_path.unlink()
-        except OSError:
-            pass
+        if tmp_path is not None:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
 
 
 @router.post("/api/text-import/align-preview")
@@ -918,17 +1046,15 @@ async def api_align_preview(body: AlignPreviewRequest):
                 status_code=400,
             )
 
-        # 각 페이지의 기존 L4 텍스트 조회
-        page_texts: list[dict] = []
-        for pg in range(1, page_count + 1):
-            page_info = get_page_text(doc_path, part_id, pg)
-            page_texts.append({
-                "page_num": pg,
-                "text": page_info.get("text", ""),
-            })
+        # 각 페이지의 기존 L4 텍스트 조회 — 디렉토리를 한 번만 훑어 일괄로 읽는다
+        page_texts = await asyncio.to_thread(
+            list_page_texts, doc_path, part_id, page_count,
+        )
 
         # 자동 매핑 실행
-        alignments = align_text_to_pages(page_texts, body.original_text)
+        alignments = await asyncio.to_thread(
+            align_text_to_pages, page_texts, body.original_text,
+        )
 
         return {
             "page_count": page_count,
@@ -976,90 +1102,107 @@ async def api_pdf_apply(body: PdfApplyRequest, background_tasks: BackgroundTasks
         parts = manifest.get("parts", [])
         default_part_id = body.part_id or (parts[0]["part_id"] if parts else "vol1")
 
-        l4_files = []
-        pages_saved = 0
-        translations_saved = 0
+        # page_mapping을 source_page로 색인한다 — 페이지마다 목록 전체를 훑지 않도록.
+        # 같은 source_page가 여러 번 나오면 예전처럼 첫 항목을 쓴다 (setdefault).
+        mapping_by_source: dict = {}
+        for m in body.page_mapping or ():
+            mapping_by_source.setdefault(m.get("source_page"), m)
+
+        def _save_pages() -> tuple[list[str], int, int, int]:
+            """페이지별 정리·저장 루프. (L4 파일 목록, 저장 페이지 수, 번역 수, 최대 page_num)
+
+            페이지당 파일을 최대 4개(L4 텍스트, 표점·서식·번역 사이드카) 쓰고
+            표점 분리도 CPU 작업이라, 루프 전체를 워커 스레드 한 번으로 넘긴다.
+            """
+            l4_files = []
+            pages_saved = 0
+            translations_saved = 0
+            # page_count 갱신용. 빈 페이지도 포함한 원본 page_num의 최댓값이다.
+            # 같은 루프에서 잰다 — results를 한 번 더 훑을 필요가 없다.
+            max_page = 0
+
+            for item in body.results:
+                page_num = item.get("page_num", 0)
+                if page_num > max_page:
+                    max_page = page_num
+                original_text = item.get("original_text", "")
+                translation_text = item.get("translation_text", "")
+                if not original_text.strip():
+                    continue
+
+                # page_mapping이 있으면 대상 페이지/part 변환
+                target_page = page_num
+                target_part = default_part_id
+                m = mapping_by_source.get(page_num)
+                if m is not None:
+                    target_page = m.get("target_page", page_num)
+                    target_part = m.get("part_id", default_part_id)
+
+                # 표점·현토 분리 (옵션)
+                if body.strip_punctuation or body.strip_hyeonto:
+                    result = clean_hwp_text(
+                        original_text,
+                        strip_punct=body.strip_punctuation,
+                        strip_hyeonto=body.strip_hyeonto,
+                    )
+                    text_to_save = result.clean_text
 
-        for item in body.results:
-            page_num = item.get("page_num", 0)
-            original_text = item.get("original_text", "")
-            translation_text = item.get("translation_text", "")
-            if not original_text.strip():
-                continue
+                    # 사이드카 데이터 저장
+                    save_punctuation_sidecar(
+                        doc_path, target_part, target_page,
+                        result.punctuation_marks, result.hyeonto_annotations,
+                        raw_text_length=len(original_text),
+                        clean_text_length=len(result.clean_text),
+                        source="pdf_import",
+                    )
 
-            # page_mapping이 있으면 대상 페이지/part 변환
-            target_page = page_num
-            target_part = default_part_id
-            if body.page_mapping:
-                for m in body.page_mapping:
-                    if m.get("source_page") == page_num:
-                        target_page = m.get("target_page", page_num)
-                        target_part = m.get("part_id", default_part_id)
-                        break
-
-            # 표점·현토 분리 (옵션)
-            if body.strip_punctuation or body.strip_hyeonto:
-                result = clean_hwp_text(
-                    original_text,
-                    strip_punct=body.strip_punctuation,
-                    strip_hyeonto=body.strip_hyeonto,
-                )
-                text_to_save = result.clean_text
-
-                # 사이드카 데이터 저장
-                save_punctuation_sidecar(
-                    doc_path, target_part, target_page,
-                    result.punctuation_marks, result.hyeonto_annotations,
-                    raw_text_length=len(original_text),
-                    clean_text_length=len(result.clean_text),
-                    source="pdf_import",
+                    if result.taidu_marks:
+                        save_formatting_sidecar(
+                            doc_path, target_part, target_page,
+                            result.taidu_marks,
+                        )
+                else:
+                    text_to_save = original_text
+
+                # L4 텍스트 저장 (원문)
+                file_path = save_text_to_l4(
+                    doc_path, target_part, target_page, text_to_save,
                 )
+                l4_files.append(file_path.relative_to(doc_path).as_posix())
+                pages_saved += 1
 
-                if result.taidu_marks:
-                    save_formatting_sidecar(
+                # 번역 사이드카 저장 (분리된 번역이 있으면)
+                if translation_text and translation_text.strip():
+                    tr_path = save_translation_sidecar(
                         doc_path, target_part, target_page,
-                        result.taidu_marks,
+                        translation_text, source="text_import",
                     )
-            else:
-                text_to_save = original_text
-
-            # L4 텍스트 저장 (원문)
-            file_path = save_text_to_l4(doc_path, target_part, target_page, text_to_save)
-            l4_files.append(file_path.relative_to(doc_path).as_posix())
-            pages_saved += 1
-
-            # 번역 사이드카 저장 (분리된 번역이 있으면)
-            if translation_text and translation_text.strip():
-                tr_path = save_translation_sidecar(
-                    doc_path, target_part, target_page,
-                    translation_text, source="text_import",
-                )
-                if tr_path:
-                    l4_files.append(tr_path.relative_to(doc_path).as_posix())
-                    translations_saved += 1
+                    if tr_path:
+                        l4_files.append(tr_path.relative_to(doc_path).as_posix())
+                        translations_saved += 1
+
+            return l4_files, pages_saved, translations_saved, max_page
+
+        l4_files, pages_saved, translations_saved, max_page = (
+            await asyncio.to_thread(_save_pages)
+        )
 
         # completeness_status 업데이트
         manifest["completeness_status"] = "text_imported"
-        (doc_path / "manifest.json").write_text(
-            json.dumps(manifest, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
 
         # page_count 업데이트 — 사이드바에 페이지 목록이 뜨도록
-        max_page = 0
-        for item in body.results:
-            pn = item.get("page_num", 0)
-            if pn > max_page:
-                max_page = pn
         if max_page > 0:
             for part in manifest.get("parts", []):
                 if part["part_id"] == default_part_id:
                     existing = part.get("page_count") or 0
                     part["page_count"] = max(existing, max_page)
-            (doc_path / "manifest.json").write_text(
-                json.dumps(manifest, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
+
+        # 두 변경을 모아 한 번만 쓴다. 예전에는 상태 변경 후 한 번, page_count 변경 후
+        # 또 한 번 매니페스트 전체를 직렬화했다. 임시 파일 + os.replace라서
+        # 쓰는 도중 실패해도 manifest.json이 잘리지 않는다.
+        await asyncio.to_thread(
+            write_json_atomic, doc_path / "manifest.json", manifest,
+        )
 
         # git commit (백그라운드)
         commit_msg = f"feat: 텍스트 가져오기 — {pages_saved}페이지"
@@ -1122,7 +1265,7 @@ async def api_document_pdf(doc_id: str, part_id: str):
     doc_path = _library_path / "documents" / doc_id
     try:
         pdf_path = get_pdf_path(doc_path, part_id)
-        return FileResponse(
+        return _PdfFileResponse(
             str(pdf_path),
             media_type="application/pdf",
             filename=pdf_path.name,
@@ -1289,9 +1432,7 @@ async def api_block_types():
             {"error": "block_types.json을 찾을 수 없습니다."},
             status_code=404,
         )
-    import json
-    data = json.loads(block_types_path.read_text(encoding="utf-8"))
-    return data
+    return read_json(block_types_path)
 
 
 # --- 교정 API (Phase 6) ---
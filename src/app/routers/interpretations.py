@@ -13,7 +13,7 @@ from fastapi import APIRouter, BackgroundTasks, Query
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
-from app._state import get_library_path
+from app._state import FastJSONResponse, commit_interp, get_library_path
 from core.interpretation import (
     acknowledge_changes,
     check_dependency,
@@ -43,7 +43,7 @@ from core.library import (
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(tags=["interpretations"])
+router = APIRouter(tags=["interpretations"], default_response_class=FastJSONResponse)
 
 
 # =========================================
@@ -183,7 +183,7 @@ async def api_interpretations():
     _library_path = get_library_path()
     if _library_path is None:
         return JSONResponse({"error": "서고가 설정되지 않았습니다."}, status_code=500)
-    return list_interpretations(_library_path)
+    return FastJSONResponse(list_interpretations(_library_path))
 
 
 @router.delete("/api/interpretations/{interp_id}")
@@ -425,7 +425,7 @@ async def api_interp_manual_commit(interp_id: str, body: ManualCommitRequest, bg
             status_code=404,
         )
 
-    bg.add_task(git_commit_interpretation, interp_path, body.message)
+    bg.add_task(commit_interp, interp_path, body.message)
     return {"committed": "background", "message": body.message}
 
 
@@ -489,7 +489,7 @@ async def api_entities_for_page(
         )
 
     try:
-        return list_entities_for_page(interp_path, document_id, page_num)
+        return FastJSONResponse(list_entities_for_page(interp_path, document_id, page_num))
     except Exception as e:
         return JSONResponse({"error": f"엔티티 조회 실패: {e}"}, status_code=400)
 
@@ -548,7 +548,9 @@ async def api_list_entities(
                     filtered.append(ent)
             entities = filtered
 
-        return {"entity_type": entity_type, "count": len(entities), "entities": entities}
+        return FastJSONResponse(
+            {"entity_type": entity_type, "count": len(entities), "entities": entities}
+        )
     except ValueError as e:
         return JSONResponse({"error": str(e)}, status_code=400)
 
@@ -611,7 +613,7 @@ async def api_update_entity(
     # git commit — 백그라운드로 실행하여 API 즉시 응답
     if not no_commit:
         commit_msg = f"fix: {entity_type} 엔티티 수정 — {entity_id[:8]}"
-        bg.add_task(git_commit_interpretation, interp_path, commit_msg)
+        bg.add_task(commit_interp, interp_path, commit_msg)
         result["git"] = "background"
     else:
         result["git"] = {"committed": False, "reason": "no_commit=true"}
@@ -746,7 +748,7 @@ async def api_compose_textblock(
     if not no_commit:
         block_ids = [r.layout_block_id or "?" for r in body.source_refs]
         commit_msg = f"feat: TextBlock 편성 — {'+'.join(block_ids)}"
-        bg.add_task(git_commit_interpretation, interp_path, commit_msg)
+        bg.add_task(commit_interp, interp_path, commit_msg)
         result["git"] = "background"
     else:
         result["git"] = {"committed": False, "reason": "no_commit=true"}
@@ -879,7 +881,7 @@ async def api_split_textblock(interp_id: str, body: SplitTextBlockRequest, bg: B
 
     # 백그라운드 git commit — API는 즉시 응답
     commit_msg = f"feat: TextBlock 쪼개기 — {len(created_ids)}개 생성"
-    bg.add_task(git_commit_interpretation, interp_path, commit_msg)
+    bg.add_task(commit_interp, interp_path, commit_msg)
 
     if errors:
         return JSONResponse({
@@ -926,7 +928,7 @@ async def api_reset_composition(interp_id: str, body: ResetCompositionRequest, b
 
     # 백그라운드 git commit — API는 즉시 응답
     commit_msg = f"fix: TextBlock 편성 리셋 — {deprecated_count}개 deprecated"
-    bg.add_task(git_commit_interpretation, interp_path, commit_msg)
+    bg.add_task(commit_interp, interp_path, commit_msg)
 
     if errors:
         return JSONResponse({
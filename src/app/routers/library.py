@@ -216,7 +216,7 @@ async def api_browse_folder():
     목적: 사용자가 경로를 직접 타이핑하지 않고 폴더를 선택할 수 있게 한다.
     출력: { "path": "..." } 또는 취소 시 { "cancelled": true }
     """
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     path = await loop.run_in_executor(_tk_executor, _open_folder_dialog)
     if not path:
         return {"cancelled": True}
@@ -26,7 +26,14 @@ from fastapi import APIRouter, Query
 from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
-from app._state import get_library_path, _get_llm_router, _get_ocr_pipeline, get_llm_drafts
+from app._state import (
+    get_library_path,
+    _get_llm_router,
+    _get_ocr_pipeline,
+    get_llm_draft,
+    set_llm_draft,
+    sse_event,
+)
 
 router = APIRouter(tags=["llm_ocr"])
 
@@ -186,8 +193,7 @@ async def api_analyze_layout(
         return JSONResponse({"error": f"레이아웃 분석 실패: {e}"}, status_code=500)
 
     # Draft 저장
-    drafts = get_llm_drafts()
-    drafts[draft.draft_id] = draft
+    set_llm_draft(draft.draft_id, draft)
     return draft.to_dict()
 
 
@@ -228,9 +234,8 @@ async def api_compare_layout(doc_id: str, page: int, body: CompareLayoutRequest)
         return JSONResponse({"error": f"레이아웃 비교 실패: {e}"}, status_code=500)
 
     # Draft들 저장
-    drafts = get_llm_drafts()
     for d in draft_list:
-        drafts[d.draft_id] = d
+        set_llm_draft(d.draft_id, d)
 
     return [d.to_dict() for d in draft_list]
 
@@ -238,8 +243,7 @@ async def api_compare_layout(doc_id: str, page: int, body: CompareLayoutRequest)
 @router.post("/api/llm/drafts/{draft_id}/review")
 async def api_review_draft(draft_id: str, body: DraftReviewRequest):
     """Draft를 검토 (accept/modify/reject)."""
-    drafts = get_llm_drafts()
-    draft = drafts.get(draft_id)
+    draft = get_llm_draft(draft_id)
     if not draft:
         return JSONResponse({"error": f"Draft 없음: {draft_id}"}, status_code=404)
 
@@ -492,7 +496,6 @@ async def api_run_ocr_stream(
         - error 이벤트: {"type":"error","error":"메시지"}
     """
     import asyncio
-    import json as _json
 
     library_path = get_library_path()
     if library_path is None:
@@ -527,7 +530,7 @@ async def api_run_ocr_stream(
 
     async def _run_ocr_in_thread():
         """OCR를 별도 스레드에서 실행하고 결과를 큐에 넣는다."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
             result = await loop.run_in_executor(
                 None,
@@ -553,7 +556,7 @@ async def api_run_ocr_stream(
             while True:
                 data = await progress_queue.get()
                 event_type = data.get("type", "progress")
-                yield f"data: {_json.dumps(data, ensure_ascii=False)}\n\n"
+                yield sse_event(data)
                 if event_type in ("complete", "error"):
                     break
         finally:
@@ -20,12 +20,18 @@ from fastapi import APIRouter, Query
 from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
-from app._state import get_library_path, _call_llm_text, _call_llm_text_stream
+from app._state import (
+    get_library_path,
+    make_llm_stream_queue,
+    schedule_interp_commit,
+    sse_event,
+    _call_llm_text,
+    _call_llm_text_stream,
+)
 from core.interpretation import (
     get_l5_compare_at_commit,
     get_layer_content,
     get_page_notes,
-    git_commit_interpretation,
     save_page_notes,
 )
 from core.punctuation import (
@@ -367,10 +373,7 @@ async def api_save_punctuation(interp_id: str, page_num: int, body: PunctuationS
     try:
         file_path = save_punctuation(interp_path, part_id, page_num, data)
         # git commit
-        try:
-            git_commit_interpretation(interp_path, f"feat: L5 표점 저장 — page {page_num}")
-        except Exception:
-            pass  # git 실패는 저장 성공에 영향 없음
+        schedule_interp_commit(interp_path, f"feat: L5 표점 저장 — page {page_num}")
         return {"success": True, "file_path": str(file_path.relative_to(_library_path))}
     except Exception as e:
         return JSONResponse({"error": f"표점 저장 실패: {e}"}, status_code=400)
@@ -486,10 +489,7 @@ async def api_save_hyeonto(interp_id: str, page_num: int, body: HyeontoSaveReque
 
     try:
         file_path = save_hyeonto(interp_path, part_id, page_num, data)
-        try:
-            git_commit_interpretation(interp_path, f"feat: L5 현토 저장 — page {page_num}")
-        except Exception:
-            pass
+        schedule_interp_commit(interp_path, f"feat: L5 현토 저장 — page {page_num}")
         return {"success": True, "file_path": str(file_path.relative_to(_library_path))}
     except Exception as e:
         return JSONResponse({"error": f"현토 저장 실패: {e}"}, status_code=400)
@@ -649,10 +649,7 @@ async def api_add_translation(interp_id: str, page_num: int, body: TranslationAd
 
     try:
         save_translations(interp_path, part_id, page_num, data)
-        try:
-            git_commit_interpretation(interp_path, f"feat: L6 번역 추가 — page {page_num}")
-        except Exception:
-            pass
+        schedule_interp_commit(interp_path, f"feat: L6 번역 추가 — page {page_num}")
         return JSONResponse(result, status_code=201)
     except Exception as e:
         return JSONResponse({"error": f"번역 저장 실패: {e}"}, status_code=400)
@@ -683,10 +680,7 @@ async def api_update_translation(
 
     try:
         save_translations(interp_path, part_id, page_num, data)
-        try:
-            git_commit_interpretation(interp_path, f"feat: L6 번역 수정 — page {page_num}")
-        except Exception:
-            pass
+        schedule_interp_commit(interp_path, f"feat: L6 번역 수정 — page {page_num}")
         return result
     except Exception as e:
         return JSONResponse({"error": f"번역 저장 실패: {e}"}, status_code=400)
@@ -715,10 +709,7 @@ async def api_commit_translation(
 
     try:
         save_translations(interp_path, part_id, page_num, data)
-        try:
-            git_commit_interpretation(interp_path, f"feat: L6 번역 확정 — page {page_num}")
-        except Exception:
-            pass
+        schedule_interp_commit(interp_path, f"feat: L6 번역 확정 — page {page_num}")
         return result
     except Exception as e:
         return JSONResponse({"error": f"번역 저장 실패: {e}"}, status_code=400)
@@ -810,13 +801,7 @@ async def api_save_notes(
     try:
         result = save_page_notes(interp_path, part_id, page_num, body.entries)
         # 자동 git commit
-        try:
-            git_commit_interpretation(
-                interp_path,
-                f"docs: 비고 저장 — page {page_num}",
-            )
-        except Exception:
-            pass
+        schedule_interp_commit(interp_path, f"docs: 비고 저장 — page {page_num}")
         return result
     except Exception as e:
         return JSONResponse({"error": f"비고 저장 실패: {e}"}, status_code=400)
@@ -1041,7 +1026,6 @@ async def api_llm_punctuation_stream(body: AiPunctuationRequest):
         error:    {"type":"error","error":"메시지"}
     """
     import asyncio
-    import json as _json
     import re as _re
 
     # 공백/줄바꿈 제거
@@ -1052,7 +1036,7 @@ async def api_llm_punctuation_stream(body: AiPunctuationRequest):
             status_code=400,
         )
 
-    queue: asyncio.Queue = asyncio.Queue()
+    queue = make_llm_stream_queue()
 
     async def _run_llm():
         """LLM 호출 후 marks 정규화를 수행하여 queue에 넣는다."""
@@ -1090,7 +1074,7 @@ async def api_llm_punctuation_stream(body: AiPunctuationRequest):
                         else:
                             result["marks"] = []
 
-                yield f"data: {_json.dumps(data, ensure_ascii=False)}\n\n"
+                yield sse_event(data)
                 if event_type in ("complete", "error"):
                     break
         finally:
@@ -1115,9 +1099,8 @@ async def api_llm_translation_stream(body: AiTranslationRequest):
     LLM 응답 대기 중 progress 이벤트를 실시간으로 전달한다.
     """
     import asyncio
-    import json as _json
 
-    queue: asyncio.Queue = asyncio.Queue()
+    queue = make_llm_stream_queue()
 
     async def _run_llm():
         await _call_llm_text_stream(
@@ -1132,7 +1115,7 @@ async def api_llm_translation_stream(body: AiTranslationRequest):
             while True:
                 data = await queue.get()
                 event_type = data.get("type", "progress")
-                yield f"data: {_json.dumps(data, ensure_ascii=False)}\n\n"
+                yield sse_event(data)
                 if event_type in ("complete", "error"):
                     break
         finally:
@@ -20,6 +20,7 @@ D-001: 이 플랫폼의 주 인터페이스는 GUI이며, CLI는 보조 도구
 """
 
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # src/ 디렉토리를 Python 경로에 추가
@@ -27,10 +28,16 @@ _src_dir = str(Path(__file__).resolve().parent.parent)
 if _src_dir not in sys.path:
     sys.path.insert(0, _src_dir)
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
-from app._state import configure_library, set_library_path  # noqa: F401
+from app._state import (  # noqa: F401
+    ApiError,
+    configure_library,
+    flush_pending_interp_commits,
+    set_library_path,
+)
 from app.routers import (  # noqa: F401
     library,
     documents,
@@ -42,12 +49,35 @@ from app.routers import (  # noqa: F401
     version,
 )
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    yield
+    # 종료 시: 지연 저장·지연 커밋으로 미뤄 둔 편집을 마저 기록한다.
+    # 인용 마크 파일을 먼저 써야 뒤이은 커밋에 포함된다.
+    annotation.flush_pending_citation_saves()
+    flush_pending_interp_commits()
+    # 서지 파서 공용 HTTP 클라이언트의 keep-alive 연결 정리.
+    # parsers는 첫 요청 때 지연 import되므로 여기서도 지연 import한다.
+    from parsers.base import aclose_http_clients
+
+    await aclose_http_clients()
+
+
 app = FastAPI(
     title="고전서지 통합 브라우저",
     description="사람과 LLM이 함께 고전 텍스트를 읽고 번역하고 연구하는 통합 작업 환경",
     version="0.2.0",
+    lifespan=_lifespan,
 )
 
+
+# ── 공통 에러 응답 ─────────────────────────────────
+@app.exception_handler(ApiError)
+async def _api_error_handler(request: Request, exc: ApiError):
+    """라우터 의존성이 던진 ApiError를 기존 API와 같은 {"error": ...} 응답으로 바꾼다."""
+    return JSONResponse({"error": exc.message}, status_code=exc.status_code)
+
+
 # ── 라우터 마운트 ─────────────────────────────────
 app.include_router(library.router)
 app.include_router(documents.router)
@@ -1228,17 +1228,26 @@ async function _aiTagAll() {
         reqBody.force_provider = llmSel.force_provider;
       if (llmSel.force_model) reqBody.force_model = llmSel.force_model;
 
+      // partial: 스트리밍 중 먼저 완성된 주석 — 진행 표시에 개수만 보여 주고,
+      // 적용은 complete 결과로 한다. 재시도·폴백 때 오는 partial_reset이면 0부터 다시 센다.
+      let partialCount = 0;
+      let lastSec = 0;
       const data = await fetchWithSSE(
         "/api/llm/annotation/stream",
         reqBody,
         (progress) => {
-          const sec = progress.elapsed_sec || 0;
+          if (progress.partial_reset) partialCount = 0;
+          if (Array.isArray(progress.partial))
+            partialCount += progress.partial.length;
+          if (progress.elapsed_sec != null) lastSec = progress.elapsed_sec;
+          const sec = lastSec;
+          const got = partialCount ? `, ${partialCount}개 수신` : "";
           if (aiBtn) aiBtn.textContent = `AI 태깅 중… (${sec}초)`;
           if (typeof showEditorProgress === "function") {
             showEditorProgress(
               "ann",
               true,
-              `AI 태깅 처리 중... ${sec}초 경과`,
+              `AI 태깅 처리 중... ${sec}초 경과${got}`,
             );
           }
         },
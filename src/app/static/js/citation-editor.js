@@ -797,9 +797,7 @@ async function _addCitationMark(start, end, selectedText, label, tags) {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({
-          block_id: blockId,
-          start: start,
-          end: end,
+          source: { block_id: blockId, start: start, end: end },
           marked_from: "original",
           source_text_snapshot: selectedText,
           label: label,
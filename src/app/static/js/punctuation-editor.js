@@ -938,15 +938,23 @@ async function _requestAiPunctuation() {
     if (llmSel.force_model) reqBody.force_model = llmSel.force_model;
 
     // SSE 스트리밍으로 LLM 표점 요청 (실패 시 기존 엔드포인트 폴백)
+    // partial: 스트리밍 중 먼저 완성된 표점 — 진행 표시에 개수만 보여 주고,
+    // 적용은 complete 결과로 한다. 재시도·폴백 때 오는 partial_reset이면 0부터 다시 센다.
+    let partialCount = 0;
+    let lastSec = 0;
     const data = await fetchWithSSE(
       "/api/llm/punctuation/stream",
       reqBody,
       (progress) => {
-        const sec = progress.elapsed_sec || 0;
+        if (progress.partial_reset) partialCount = 0;
+        if (Array.isArray(progress.partial)) partialCount += progress.partial.length;
+        if (progress.elapsed_sec != null) lastSec = progress.elapsed_sec;
+        const sec = lastSec;
+        const got = partialCount ? `, ${partialCount}개 수신` : "";
         if (aiBtn) aiBtn.textContent = `생성 중... (${sec}초)`;
-        if (statusEl) statusEl.textContent = `AI 표점 처리 중... ${sec}초 경과`;
+        if (statusEl) statusEl.textContent = `AI 표점 처리 중... ${sec}초 경과${got}`;
         if (typeof showEditorProgress === "function") {
-          showEditorProgress("punct", true, `AI 표점 처리 중... ${sec}초 경과`);
+          showEditorProgress("punct", true, `AI 표점 처리 중... ${sec}초 경과${got}`);
         }
       },
       "/api/llm/punctuation"
@@ -1601,6 +1601,8 @@ function renderDocumentList(docs) {
  * @param {string} url        스트리밍 엔드포인트 URL
  * @param {object} body       POST 요청 body (JSON)
  * @param {function} onProgress  progress 이벤트 콜백 ({type, elapsed_sec, tokens, provider})
+ *                               표점·주석은 partial(먼저 완성된 항목 배열)과
+ *                               partial_reset(새 시도 시작 — 받은 partial을 버림)이 붙을 수 있다.
  * @param {string} fallbackUrl  스트리밍 실패 시 폴백할 기존 엔드포인트 URL
  * @returns {Promise<object>} complete 이벤트의 result 객체
  */
@@ -27,13 +27,15 @@ import difflib
 import json
 import logging
 import os
+import threading
 import unicodedata
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from core.document import get_corrected_text
+from core.json_io import dumps, read_json
 
 logger = logging.getLogger(__name__)
 
@@ -180,14 +182,30 @@ class VariantCharDict:
 
     사전 파일: resources/variant_chars.json
     사용자가 직접 이체자 쌍을 추가하며 사전을 성장시킨다.
+
+    추가 로그: {사전 경로}.log
+        쌍 몇 개를 추가할 때마다 사전 전체를 다시 쓰지 않도록,
+        마지막 전체 저장 이후 추가된 쌍을 한 줄씩("A\tB") 덧붙여 둔다.
+        로드할 때 본 JSON 뒤에 재생하고, save()가 전체를 쓰면 로그를 지운다.
+        삭제는 로그로 표현하지 않는다 — 삭제가 있으면 전체 저장이 필요하다.
+
+    스레드 안전성:
+        서버는 이벤트 루프에서 쌍을 추가·삭제하고, 저장은 스레드풀에서 돌린다.
+        변경과 저장 시점의 스냅숏 뜨기는 self._lock으로 묶고, 파일 쓰기는 락 밖에서 한다.
+        쓰는 도중 추가된 쌍은 새 대기 목록에 남아 다음 저장에서 기록된다.
     """
 
-    def __init__(self, dict_path: Optional[str] = None):
+    def __init__(self, dict_path: Optional[str | os.PathLike] = None):
         """사전을 로드한다.
 
         입력: dict_path — 사전 파일 경로. None이면 기본 경로를 탐색.
         """
         self._variants: dict[str, set[str]] = {}
+        # 마지막 저장(전체 또는 로그) 이후 추가된 쌍
+        self._pending_pairs: list[tuple[str, str]] = []
+        # 로그로 표현할 수 없는 변경(삭제)이 있었는지
+        self._needs_full_save = False
+        self._lock = threading.Lock()
 
         if dict_path is None:
             dict_path = self._find_default_path()
@@ -216,10 +234,10 @@ class VariantCharDict:
                 return abs_path
         return None
 
-    def _load(self, path: str) -> None:
+    def _load(self, path: str | os.PathLike) -> None:
         """JSON 파일에서 이체자 사전을 로드한다."""
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        path = os.fspath(path)
+        data = read_json(path)
 
         variants_raw = data.get("variants", {})
         for char, alts in variants_raw.items():
@@ -228,7 +246,31 @@ class VariantCharDict:
             for alt in alts:
                 self._variants[char].add(alt)
 
-        logger.info("이체자 사전 로드: %d개 항목 (%s)", len(self._variants), path)
+        replayed = self._replay_log(path + ".log")
+        # 로그에서 재생한 쌍은 이미 디스크에 있으므로 대기 목록에서 뺀다.
+        self._pending_pairs.clear()
+
+        logger.info(
+            "이체자 사전 로드: %d개 항목, 로그 %d쌍 (%s)",
+            len(self._variants), replayed, path,
+        )
+
+    def _replay_log(self, log_path: str) -> int:
+        """추가 로그를 읽어 쌍을 다시 등록하고, 재생한 줄 수를 반환한다."""
+        try:
+            with open(log_path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return 0
+
+        count = 0
+        for line in lines:
+            parts = line.split("\t")
+            # 마지막 줄이 쓰다 만 상태일 수 있으므로 형식이 맞지 않으면 건너뛴다.
+            if len(parts) == 2 and parts[0] and parts[1]:
+                self.add_pair(parts[0], parts[1])
+                count += 1
+        return count
 
     def is_variant(self, char_a: str, char_b: str) -> bool:
         """두 글자가 이체자 관계인지 확인한다.
@@ -254,14 +296,22 @@ class VariantCharDict:
         """
         if char_a == char_b:
             return
-        self._variants.setdefault(char_a, set()).add(char_b)
-        self._variants.setdefault(char_b, set()).add(char_a)
+        with self._lock:
+            if (
+                char_b in self._variants.get(char_a, ())
+                and char_a in self._variants.get(char_b, ())
+            ):
+                return
+            self._variants.setdefault(char_a, set()).add(char_b)
+            self._variants.setdefault(char_b, set()).add(char_a)
+            self._pending_pairs.append((char_a, char_b))
 
-    def save(self, path: str) -> None:
-        """사전을 JSON 파일로 저장한다."""
-        serializable = {
-            char: sorted(alts) for char, alts in sorted(self._variants.items())
-        }
+    def to_json_bytes(self) -> bytes:
+        """사전 파일과 같은 형식의 JSON을 bytes로 직렬화한다.
+
+        save()와 내보내기 API가 같은 직렬화를 공유한다.
+        큰 사전에서는 직렬화가 저장 비용의 대부분이므로 core.json_io(orjson)를 쓴다.
+        """
         data = {
             "_format_guide": {
                 "설명": "이체자(異體字) 사전. 같은 글자의 다른 형태를 등록한다.",
@@ -269,10 +319,78 @@ class VariantCharDict:
                 "용도": "정렬 엔진이 OCR↔참조 텍스트 대조 시 이체자를 별도 분류한다.",
             },
             "_version": "0.1.0",
-            "variants": serializable,
+            "variants": self.to_dict(),
         }
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        return dumps(data, indent=True)
+
+    def save(self, path: str | os.PathLike) -> None:
+        """사전을 JSON 파일로 저장한다.
+
+        임시 파일에 먼저 쓰고 os.replace로 바꿔치기한다.
+        저장 도중 프로세스가 죽어도 기존 사전 파일이 반쯤 잘린 채 남지 않는다.
+        쓰기가 실패하면 대기 중이던 쌍과 전체 저장 표시를 되돌려 다음 저장에서 다시 쓴다.
+        """
+        path = os.fspath(path)
+        tmp_path = path + ".tmp"
+        with self._lock:
+            payload = self.to_json_bytes()
+            pending, self._pending_pairs = self._pending_pairs, []
+            needs_full, self._needs_full_save = self._needs_full_save, False
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            self._restore_pending(pending, needs_full)
+            raise
+        # 로그의 내용은 이제 본 파일에 모두 들어 있다.
+        try:
+            os.remove(path + ".log")
+        except FileNotFoundError:
+            pass
+
+    def append_log(self, path: str | os.PathLike) -> int:
+        """마지막 저장 이후 추가된 쌍만 추가 로그에 덧붙인다.
+
+        입력: path — 사전 파일 경로 (로그는 path + ".log").
+        출력: 덧붙인 뒤 로그 파일 크기(bytes).
+        예외: 삭제처럼 로그로 표현할 수 없는 변경이 있으면 ValueError — save()를 써야 한다.
+        """
+        with self._lock:
+            if self._needs_full_save:
+                raise ValueError("삭제된 쌍이 있어 전체 저장이 필요합니다.")
+            pending, self._pending_pairs = self._pending_pairs, []
+
+        log_path = os.fspath(path) + ".log"
+        if pending:
+            lines = "".join(f"{a}\t{b}\n" for a, b in pending)
+            try:
+                with open(log_path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+            except BaseException:
+                self._restore_pending(pending, False)
+                raise
+
+        try:
+            return os.path.getsize(log_path)
+        except FileNotFoundError:
+            return 0
+
+    def _restore_pending(self, pending: list[tuple[str, str]], needs_full: bool) -> None:
+        """저장이 실패했을 때 스냅숏으로 떼어 낸 대기 상태를 되돌린다.
+
+        그 사이 새로 추가된 쌍은 뒤에 그대로 두고, 삭제 표시는 어느 한쪽이라도 있으면 유지한다.
+        """
+        with self._lock:
+            self._pending_pairs[:0] = pending
+            self._needs_full_save = self._needs_full_save or needs_full
+
+    @property
+    def needs_full_save(self) -> bool:
+        """추가 로그로는 반영할 수 없는 변경(삭제)이 있는지."""
+        return self._needs_full_save
 
     @property
     def size(self) -> int:
@@ -298,18 +416,21 @@ class VariantCharDict:
         """
         removed = False
 
-        if char_a in self._variants and char_b in self._variants[char_a]:
-            self._variants[char_a].discard(char_b)
-            if not self._variants[char_a]:
-                del self._variants[char_a]
-            removed = True
-
-        if char_b in self._variants and char_a in self._variants[char_b]:
-            self._variants[char_b].discard(char_a)
-            if not self._variants[char_b]:
-                del self._variants[char_b]
-            removed = True
-
+        with self._lock:
+            if char_a in self._variants and char_b in self._variants[char_a]:
+                self._variants[char_a].discard(char_b)
+                if not self._variants[char_a]:
+                    del self._variants[char_a]
+                removed = True
+
+            if char_b in self._variants and char_a in self._variants[char_b]:
+                self._variants[char_b].discard(char_a)
+                if not self._variants[char_b]:
+                    del self._variants[char_b]
+                removed = True
+
+            if removed:
+                self._needs_full_save = True
         return removed
 
     def export_csv(self) -> str:
@@ -321,24 +442,40 @@ class VariantCharDict:
         왜 이렇게 하는가:
             다른 도구에서 사용하거나 백업하기 위해 범용 형식으로 내보낸다.
         """
+        return "\n".join(self.iter_csv_rows())
+
+    def iter_csv_rows(self) -> Iterator[str]:
+        """CSV 행("글자A,글자B")을 하나씩 내보낸다 (개행 문자 없음).
+
+        export_csv()와 같은 순서·중복 제거 규칙을 따른다.
+        내보내기 API가 전체 CSV 문자열을 만들지 않고 행 단위로 스트리밍할 때 쓴다.
+
+        스트리밍은 스레드풀에서 돌고 그 사이 추가/삭제 API가 사전을 바꿀 수 있으므로,
+        락을 잡고 정렬된 스냅샷을 먼저 뜬 뒤 그것으로 행을 만든다.
+        """
+        with self._lock:
+            snapshot = [(char, sorted(alts)) for char, alts in sorted(self._variants.items())]
+
         seen = set()
-        lines = []
-        for char, alts in sorted(self._variants.items()):
-            for alt in sorted(alts):
-                pair_key = tuple(sorted([char, alt]))
+        for char, alts in snapshot:
+            for alt in alts:
+                pair_key = (char, alt) if char < alt else (alt, char)
                 if pair_key not in seen:
                     seen.add(pair_key)
-                    lines.append(f"{char},{alt}")
-        return "\n".join(lines)
+                    yield f"{char},{alt}"
 
     @property
     def pair_count(self) -> int:
-        """양방향 중복을 제거한 실제 이체자 쌍 수."""
+        """양방향 중복을 제거한 실제 이체자 쌍 수.
+
+        저장 스레드가 메타 사이드카를 쓸 때도 부르므로 락을 잡고 센다.
+        """
         seen = set()
-        for char, alts in self._variants.items():
-            for alt in alts:
-                pair_key = tuple(sorted([char, alt]))
-                seen.add(pair_key)
+        with self._lock:
+            for char, alts in self._variants.items():
+                for alt in alts:
+                    pair_key = tuple(sorted([char, alt]))
+                    seen.add(pair_key)
         return len(seen)
 
     def import_bulk(self, text: str, fmt: str = "auto") -> dict:
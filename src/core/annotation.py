@@ -10,12 +10,13 @@ v2 추가 기능:
 - v1 데이터 로드 시 자동 마이그레이션 (lazy migration)
 """
 
-import json
 import uuid
 from pathlib import Path
 
 from jsonschema import validate
 
+from core.json_io import read_json, write_json_atomic
+
 # ──────────────────────────────────────
 # 스키마 로드 (모듈 레벨 캐시)
 # ──────────────────────────────────────
@@ -31,8 +32,7 @@ def _get_schema() -> dict:
     """주석 JSON 스키마를 로드한다 (최초 1회만 읽음)."""
     global _schema_cache
     if _schema_cache is None:
-        with open(_SCHEMA_PATH, encoding="utf-8") as f:
-            _schema_cache = json.load(f)
+        _schema_cache = read_json(_SCHEMA_PATH)
     return _schema_cache
 
 
@@ -125,7 +125,9 @@ def load_annotations(
     interp_path = Path(interp_path).resolve()
     file_path = _annotation_file_path(interp_path, part_id, page_num)
 
-    if not file_path.exists():
+    try:
+        data = read_json(file_path)
+    except FileNotFoundError:
         return {
             "part_id": part_id,
             "page_number": page_num,
@@ -133,9 +135,6 @@ def load_annotations(
             "blocks": [],
         }
 
-    with open(file_path, encoding="utf-8") as f:
-        data = json.load(f)
-
     # v1 → v2 인메모리 마이그레이션 (파일은 수정하지 않음)
     return _migrate_v1_to_v2(data)
 
@@ -166,8 +165,7 @@ def save_annotations(
     file_path = _annotation_file_path(interp_path, part_id, page_num)
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    text = json.dumps(data, ensure_ascii=False, indent=2) + "\n"
-    file_path.write_text(text, encoding="utf-8")
+    write_json_atomic(file_path, data)
 
     return file_path
 
@@ -214,6 +212,28 @@ def add_annotation(data: dict, block_id: str, annotation: dict) -> dict:
         annotation — 주석 항목. target, type, content 등 포함.
     출력: id가 추가된 annotation dict.
     """
+    _fill_annotation_defaults(annotation)
+    block = _ensure_block(data, block_id)
+    block["annotations"].append(annotation)
+    return annotation
+
+
+def add_annotations(data: dict, block_id: str, annotations: list[dict]) -> list[dict]:
+    """같은 블록에 주석 여러 개를 한 번에 추가한다.
+
+    목적: AI 태깅 결과 일괄 저장. add_annotation을 N번 부르면 블록을 N번 찾으므로,
+          블록은 한 번만 찾고 기본값을 채운 주석들을 한꺼번에 붙인다.
+    출력: id가 추가된 annotation dict 목록 (입력 순서 유지).
+    """
+    for annotation in annotations:
+        _fill_annotation_defaults(annotation)
+    block = _ensure_block(data, block_id)
+    block["annotations"].extend(annotations)
+    return annotations
+
+
+def _fill_annotation_defaults(annotation: dict) -> None:
+    """새 주석에 id와 필수·v2 필드 기본값을 채운다. (내부 유틸리티)"""
     if "id" not in annotation or not annotation["id"]:
         annotation["id"] = _gen_annotation_id()
 
@@ -231,10 +251,6 @@ def add_annotation(data: dict, block_id: str, annotation: dict) -> dict:
             else:
                 annotation[key] = default_value
 
-    block = _ensure_block(data, block_id)
-    block["annotations"].append(annotation)
-    return annotation
-
 
 def update_annotation(
     data: dict, block_id: str, annotation_id: str, updates: dict
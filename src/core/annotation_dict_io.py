@@ -7,11 +7,11 @@
 가져오기 전략: headword 기반 매칭 → 병합(source_references/related_terms 합집합).
 """
 
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 
 from core.annotation import load_annotations, save_annotations, _gen_annotation_id
+from core.json_io import dumps
 
 # ──────────────────────────────────────
 # 내보내기 (Export)
@@ -131,8 +131,7 @@ def save_export(
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     file_path = exports_dir / f"dictionary_{timestamp}.json"
 
-    text = json.dumps(dictionary_data, ensure_ascii=False, indent=2) + "\n"
-    file_path.write_text(text, encoding="utf-8")
+    file_path.write_bytes(dumps(dictionary_data, indent=True) + b"\n")
 
     return file_path
 
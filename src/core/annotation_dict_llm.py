@@ -302,6 +302,9 @@ async def generate_stage1_from_original(
     block_id: str,
     router: LlmRouter,
     existing_annotations: list[dict] | None = None,
+    *,
+    force_provider: str | None = None,
+    force_model: str | None = None,
 ) -> list[dict]:
     """Stage 1: 표점된 원문만으로 사전 항목 초안을 생성한다.
 
@@ -311,6 +314,7 @@ async def generate_stage1_from_original(
         block_id — 대상 블록 ID.
         router — LlmRouter 인스턴스.
         existing_annotations — 기존 주석 목록 (있으면 프롬프트에 포함).
+        force_provider, force_model — 이 호출에만 적용할 provider/모델 지정 (선택).
     출력: annotation 항목 리스트 (annotation_page v2 형식).
     """
     prompt_config = _load_prompt("stage1")
@@ -332,6 +336,8 @@ async def generate_stage1_from_original(
         system=prompt_config["system"],
         purpose="annotation_dict_stage1",
         max_tokens=4096,
+        force_provider=force_provider,
+        force_model=force_model,
     )
 
     raw_annotations = _parse_llm_annotations(response.text)
@@ -375,6 +381,9 @@ async def generate_stage2_from_translation(
     block_id: str,
     router: LlmRouter,
     existing_annotations: list[dict],
+    *,
+    force_provider: str | None = None,
+    force_model: str | None = None,
 ) -> list[dict]:
     """Stage 2: 번역을 참조하여 기존 주석의 문맥적 의미를 보강한다.
 
@@ -385,6 +394,7 @@ async def generate_stage2_from_translation(
         block_id — 대상 블록 ID.
         router — LlmRouter 인스턴스.
         existing_annotations — 1단계 결과 (기존 주석 목록).
+        force_provider, force_model — 이 호출에만 적용할 provider/모델 지정 (선택).
     출력: 보강된 annotation 항목 리스트. 기존 항목과 병합하여 사용.
     """
     prompt_config = _load_prompt("stage2")
@@ -400,6 +410,8 @@ async def generate_stage2_from_translation(
         system=prompt_config["system"],
         purpose="annotation_dict_stage2",
         max_tokens=4096,
+        force_provider=force_provider,
+        force_model=force_model,
     )
 
     raw_annotations = _parse_llm_annotations(response.text)
@@ -447,6 +459,9 @@ async def generate_stage3_from_both(
     block_id: str,
     router: LlmRouter,
     existing_annotations: list[dict] | None = None,
+    *,
+    force_provider: str | None = None,
+    force_model: str | None = None,
 ) -> list[dict]:
     """Stage 3: 원문+번역을 종합하여 최종 통합한다.
 
@@ -461,6 +476,7 @@ async def generate_stage3_from_both(
         block_id — 대상 블록 ID.
         router — LlmRouter 인스턴스.
         existing_annotations — 이전 단계 결과. None이면 일괄 생성 모드.
+        force_provider, force_model — 이 호출에만 적용할 provider/모델 지정 (선택).
     출력: 최종 통합된 annotation 항목 리스트.
     """
     if existing_annotations is None:
@@ -479,6 +495,8 @@ async def generate_stage3_from_both(
         system=prompt_config["system"],
         purpose="annotation_dict_stage3",
         max_tokens=4096,
+        force_provider=force_provider,
+        force_model=force_model,
     )
 
     raw_annotations = _parse_llm_annotations(response.text)
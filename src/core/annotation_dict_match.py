@@ -12,9 +12,11 @@
   한자는 형태소 변화가 없어 정규식 불필요. 표제어가 원문에 나타나면 매칭.
 """
 
-import json
+from collections import OrderedDict
 from pathlib import Path
 
+from core.json_io import JSONDecodeError, dumps, read_json
+
 
 # ──────────────────────────────────────
 # 참조 사전 저장소 관리
@@ -46,8 +48,7 @@ def list_reference_dicts(interp_path: str | Path) -> list[dict]:
     results = []
     for f in sorted(ref_dir.glob("*.json")):
         try:
-            with open(f, encoding="utf-8") as fh:
-                data = json.load(fh)
+            data = read_json(f)
             results.append({
                 "filename": f.name,
                 "source_document_id": data.get("source", {}).get("document_id", ""),
@@ -56,7 +57,7 @@ def list_reference_dicts(interp_path: str | Path) -> list[dict]:
                 "total_entries": data.get("statistics", {}).get("total_entries", len(data.get("entries", []))),
                 "export_timestamp": data.get("export_timestamp"),
             })
-        except (json.JSONDecodeError, OSError):
+        except (JSONDecodeError, OSError):
             # 손상된 파일은 건너뜀
             continue
 
@@ -90,8 +91,7 @@ def register_reference_dict(
 
     file_path = ref_dir / filename
 
-    text = json.dumps(dictionary_data, ensure_ascii=False, indent=2) + "\n"
-    file_path.write_text(text, encoding="utf-8")
+    file_path.write_bytes(dumps(dictionary_data, indent=True) + b"\n")
 
     return file_path
 
@@ -108,8 +108,7 @@ def load_reference_dict(interp_path: str | Path, filename: str) -> dict:
     if not file_path.exists():
         raise FileNotFoundError(f"참조 사전 파일을 찾을 수 없습니다: {file_path}")
 
-    with open(file_path, encoding="utf-8") as f:
-        return json.load(f)
+    return read_json(file_path)
 
 
 def remove_reference_dict(interp_path: str | Path, filename: str) -> bool:
@@ -202,14 +201,32 @@ def match_text(
     if not original_text or not ref_dicts:
         return []
 
-    index = _build_headword_index(ref_dicts)
+    return _match_with_index(original_text, _build_headword_index(ref_dicts), block_id)
+
+
+def _match_with_index(
+    original_text: str,
+    index: list[dict],
+    block_id: str | None = None,
+) -> list[dict]:
+    """이미 구축한 headword 인덱스로 원문을 매칭한다 (match_text 본체).
+
+    왜 분리하는가:
+        match_page_blocks는 블록마다 같은 참조 사전으로 매칭하므로
+        인덱스를 블록마다 다시 만들지 않고 한 번만 만들어 재사용한다.
+    """
     matches = []
     # (headword, source_dict_filename, start) 중복 방지
     # 같은 headword라도 다른 사전에서 오면 별개의 매칭으로 취급
     seen_positions: set[tuple[str, str, int]] = set()
+    # 첫 글자가 원문에 없는 표제어는 find를 돌릴 필요도 없다.
+    # 표제어 수가 많을 때 대부분이 여기서 걸러진다.
+    text_chars = set(original_text)
 
     for item in index:
         hw = item["headword"]
+        if hw[0] not in text_chars:
+            continue
         src_file = item["source_dict_filename"]
         positions = []
 
@@ -251,6 +268,41 @@ def match_text(
     return matches
 
 
+# 참조 사전별 headword 인덱스 캐시.
+# 키: (파일 경로, mtime_ns, size) — 사전을 다시 등록(덮어쓰기)하면 키가 바뀌어 새로 만든다.
+# 번역 편집기는 블록을 옮길 때마다 매칭을 요청하므로, 수천 표제어짜리 사전을
+# 요청마다 읽고 정렬하는 비용을 없앤다.
+_REF_INDEX_CACHE_MAX_SIZE = 32
+_REF_INDEX_CACHE: OrderedDict[tuple[str, int, int], list[dict]] = OrderedDict()
+
+
+def _cached_ref_index(interp_path: Path, filename: str) -> list[dict]:
+    """참조 사전 파일 하나의 headword 인덱스를 반환한다 (파일이 그대로면 캐시 재사용).
+
+    반환 리스트와 그 항목은 캐시와 공유되므로 호출자는 수정하지 않는다.
+    Raises: FileNotFoundError, JSONDecodeError — load_reference_dict와 같음.
+    """
+    file_path = _ref_dict_dir(interp_path) / filename
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"참조 사전 파일을 찾을 수 없습니다: {file_path}") from None
+    key = (str(file_path), st.st_mtime_ns, st.st_size)
+
+    index = _REF_INDEX_CACHE.get(key)
+    if index is not None:
+        _REF_INDEX_CACHE.move_to_end(key)
+        return index
+
+    data = load_reference_dict(interp_path, filename)
+    data["_filename"] = filename  # 매칭 결과에 출처 추적용
+    index = _build_headword_index([data])
+    _REF_INDEX_CACHE[key] = index
+    while len(_REF_INDEX_CACHE) > _REF_INDEX_CACHE_MAX_SIZE:
+        _REF_INDEX_CACHE.popitem(last=False)
+    return index
+
+
 def match_page_blocks(
     interp_path: str | Path,
     blocks_text: list[dict],
@@ -276,23 +328,27 @@ def match_page_blocks(
     if not ref_dir.exists():
         return []
 
-    ref_dicts = []
     if ref_filenames:
         filenames = ref_filenames
     else:
         filenames = [f.name for f in sorted(ref_dir.glob("*.json"))]
 
+    index: list[dict] = []
+    loaded_any = False
     for fname in filenames:
         try:
-            data = load_reference_dict(interp_path, fname)
-            data["_filename"] = fname  # 매칭 결과에 출처 추적용
-            ref_dicts.append(data)
-        except (FileNotFoundError, json.JSONDecodeError):
+            index.extend(_cached_ref_index(interp_path, fname))
+            loaded_any = True
+        except (FileNotFoundError, JSONDecodeError):
             continue
 
-    if not ref_dicts:
+    if not loaded_any:
         return []
 
+    # 사전별로 이미 정렬된 인덱스를 이어 붙였으므로 다시 정렬해도 병합 수준의 비용이다.
+    # (안정 정렬이라 같은 길이 안에서는 사전 순서·항목 순서가 그대로 유지된다)
+    index.sort(key=lambda x: len(x["headword"]), reverse=True)
+
     # 블록별 매칭 수행 후 결과 통합
     all_matches: dict[str, dict] = {}  # headword → match 항목
 
@@ -302,7 +358,7 @@ def match_page_blocks(
         if not text:
             continue
 
-        block_matches = match_text(text, ref_dicts, block_id=block_id)
+        block_matches = _match_with_index(text, index, block_id=block_id)
 
         for m in block_matches:
             hw = m["headword"]
@@ -8,9 +8,10 @@
 서고별로 덮어쓰기한 파일이 있으면 그것을 우선한다.
 """
 
-import json
 from pathlib import Path
 
+from core.json_io import dumps, read_json
+
 # ──────────────────────────────────────
 # 기본 프리셋 경로
 # ──────────────────────────────────────
@@ -27,8 +28,7 @@ PROTECTED_TYPE_IDS = frozenset({"person", "place", "book_title"})
 
 def _load_default_types() -> dict:
     """resources/annotation_types.json에서 기본 프리셋을 로드한다."""
-    with open(_DEFAULT_TYPES_PATH, encoding="utf-8") as f:
-        return json.load(f)
+    return read_json(_DEFAULT_TYPES_PATH)
 
 
 def _work_types_path(work_path: str | Path) -> Path:
@@ -45,18 +45,17 @@ def _work_types_path(work_path: str | Path) -> Path:
 def _load_work_data(work_path: str | Path) -> dict:
     """서고별 설정 파일을 로드한다. 없으면 빈 구조를 반환."""
     custom_path = _work_types_path(work_path)
-    if custom_path.exists():
-        with open(custom_path, encoding="utf-8") as f:
-            return json.load(f)
-    return {"custom": [], "hidden": []}
+    try:
+        return read_json(custom_path)
+    except FileNotFoundError:
+        return {"custom": [], "hidden": []}
 
 
 def _save_work_data(work_path: str | Path, work_data: dict):
     """서고별 설정 파일을 저장한다."""
     custom_path = _work_types_path(work_path)
     custom_path.parent.mkdir(parents=True, exist_ok=True)
-    text = json.dumps(work_data, ensure_ascii=False, indent=2) + "\n"
-    custom_path.write_text(text, encoding="utf-8")
+    custom_path.write_bytes(dumps(work_data, indent=True) + b"\n")
 
 
 # ──────────────────────────────────────
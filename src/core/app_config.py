@@ -18,6 +18,8 @@ import logging
 from datetime import datetime, timezone
 from pathlib import Path
 
+from core.json_io import read_json
+
 logger = logging.getLogger(__name__)
 
 # ── 설정 경로 ──────────────────────────────────
@@ -36,11 +38,10 @@ def load_app_config() -> dict:
 
     출력: 설정 dict. 파일이 없으면 빈 dict.
     """
-    if not CONFIG_FILE.exists():
-        return {}
-
     try:
-        return json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
+        return read_json(CONFIG_FILE)
+    except FileNotFoundError:
+        return {}
     except (json.JSONDecodeError, OSError) as e:
         logger.warning(f"앱 설정 읽기 실패 (기본값 사용): {e}")
         return {}
@@ -14,13 +14,16 @@
   해석 데이터와 섞이지 않도록 citation_marks/ 에 분리 저장한다.
 """
 
-import json
+import os
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 
 from jsonschema import validate
 
+from core.json_io import JSONDecodeError, read_json, write_json_atomic
+
 
 # ──────────────────────────────────────
 # 스키마 로드 (모듈 레벨 캐시)
@@ -37,8 +40,7 @@ def _get_schema() -> dict:
     """인용 마크 JSON 스키마를 로드한다 (최초 1회만 읽음)."""
     global _schema_cache
     if _schema_cache is None:
-        with open(_SCHEMA_PATH, encoding="utf-8") as f:
-            _schema_cache = json.load(f)
+        _schema_cache = read_json(_SCHEMA_PATH)
     return _schema_cache
 
 
@@ -78,15 +80,25 @@ def load_citation_marks(
     interp_path = Path(interp_path).resolve()
     file_path = _citation_mark_file_path(interp_path, part_id, page_num)
 
-    if not file_path.exists():
+    # exists() 확인 후 읽으면 stat이 한 번 더 일어나므로, 바로 읽고 없으면 빈 구조를 돌려준다.
+    try:
+        return read_json(file_path)
+    except FileNotFoundError:
         return {
             "part_id": part_id,
             "page_number": page_num,
             "marks": [],
         }
 
-    with open(file_path, encoding="utf-8") as f:
-        return json.load(f)
+
+def validate_citation_marks(data: dict) -> None:
+    """인용 마크 페이지 데이터를 스키마로 검증한다.
+
+    저장을 뒤로 미루는 호출자(API의 지연 저장)가 편집 시점에 오류를 돌려줄 수 있도록
+    save_citation_marks에서 분리했다.
+    Raises: jsonschema.ValidationError — 스키마 불일치 시.
+    """
+    validate(instance=data, schema=_get_schema())
 
 
 def save_citation_marks(
@@ -106,14 +118,13 @@ def save_citation_marks(
     출력: 저장된 파일 경로.
     Raises: jsonschema.ValidationError — 스키마 불일치 시.
     """
-    validate(instance=data, schema=_get_schema())
+    validate_citation_marks(data)
 
     interp_path = Path(interp_path).resolve()
     file_path = _citation_mark_file_path(interp_path, part_id, page_num)
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    text = json.dumps(data, ensure_ascii=False, indent=2) + "\n"
-    file_path.write_text(text, encoding="utf-8")
+    write_json_atomic(file_path, data)
 
     return file_path
 
@@ -156,6 +167,15 @@ def add_citation_mark(data: dict, mark: dict) -> dict:
     return mark
 
 
+def find_citation_mark(data: dict, mark_id: str) -> dict | None:
+    """페이지 데이터에서 mark_id의 인용 마크를 찾는다. 없으면 None.
+
+    한 페이지의 마크는 수십 개 수준이라 조회 한 번을 위해 색인을 만드는 것보다
+    첫 일치에서 멈추는 순차 탐색이 싸다.
+    """
+    return next((m for m in data.get("marks", []) if m["id"] == mark_id), None)
+
+
 def update_citation_mark(data: dict, mark_id: str, updates: dict) -> dict | None:
     """인용 마크를 수정한다.
 
@@ -163,15 +183,15 @@ def update_citation_mark(data: dict, mark_id: str, updates: dict) -> dict | None
         updates — 수정할 필드. 예: {"label": "핵심 논거", "tags": ["서론"]}.
     출력: 수정된 mark. 없으면 None.
     """
-    for mark in data["marks"]:
-        if mark["id"] == mark_id:
-            for key, value in updates.items():
-                # id, source, created_at는 수정 불가
-                if key in ("id", "source", "created_at"):
-                    continue
-                mark[key] = value
-            return mark
-    return None
+    mark = find_citation_mark(data, mark_id)
+    if mark is None:
+        return None
+    for key, value in updates.items():
+        # id, source, created_at는 수정 불가
+        if key in ("id", "source", "created_at"):
+            continue
+        mark[key] = value
+    return mark
 
 
 def remove_citation_mark(data: dict, mark_id: str) -> bool:
@@ -189,6 +209,70 @@ def remove_citation_mark(data: dict, mark_id: str) -> bool:
 # ──────────────────────────────────────
 
 
+# 페이지 파일 경로 → ((mtime_ns, size), 페이지 번호가 붙은 마크 목록)
+# 전체 목록·내보내기는 요청마다 모든 페이지 파일을 훑는다. 바뀌지 않은 파일은
+# stat만 하고 다시 읽거나 파싱하지 않도록 파싱 결과를 보관한다.
+_PAGE_MARKS_CACHE_MAX_SIZE = 2048
+_page_marks_cache: OrderedDict[str, tuple[tuple[int, int], list[dict]]] = OrderedDict()
+
+
+def _page_marks_with_page_number(entry: os.DirEntry) -> list[dict]:
+    """페이지 파일 하나의 마크 목록(page_number 포함)을 캐시에서 꺼내거나 읽는다."""
+    st = entry.stat()
+    sig = (st.st_mtime_ns, st.st_size)
+    cached = _page_marks_cache.get(entry.path)
+    if cached is not None and cached[0] == sig:
+        _page_marks_cache.move_to_end(entry.path)
+        return cached[1]
+
+    data = read_json(entry.path)
+    page_num = data.get("page_number", 0)
+    marks = []
+    for mark in data.get("marks", []):
+        mark_with_page = dict(mark)
+        mark_with_page["page_number"] = page_num
+        marks.append(mark_with_page)
+
+    _page_marks_cache[entry.path] = (sig, marks)
+    while len(_page_marks_cache) > _PAGE_MARKS_CACHE_MAX_SIZE:
+        _page_marks_cache.popitem(last=False)
+    return marks
+
+
+def _scan_citation_page_files(interp_path: str | Path, part_id: str) -> list[os.DirEntry]:
+    """citation_marks/에서 part_id의 페이지 파일 항목을 이름순으로 반환한다.
+
+    디렉토리가 없으면 []를 반환한다.
+    """
+    cite_dir = Path(interp_path).resolve() / "citation_marks"
+    # glob("{part_id}_page_*_citation_marks.json")과 같은 조건을 문자열 비교로 검사한다.
+    prefix = f"{part_id}_page_"
+    suffix = "_citation_marks.json"
+    try:
+        with os.scandir(cite_dir) as it:
+            return sorted(
+                (e for e in it
+                 if e.name.startswith(prefix) and e.name.endswith(suffix)
+                 and len(e.name) >= len(prefix) + len(suffix)),
+                key=lambda e: e.name,
+            )
+    except FileNotFoundError:
+        return []
+
+
+def citation_marks_signature(interp_path: str | Path, part_id: str = "main") -> list[tuple]:
+    """part_id의 인용 마크 파일들의 (이름, mtime_ns, 크기) 목록.
+
+    목적: 전체 목록 API의 ETag 계산. 파일을 읽지 않고 stat만으로
+          list_all_citation_marks 결과가 바뀌었는지 판단한다.
+    """
+    signature = []
+    for entry in _scan_citation_page_files(interp_path, part_id):
+        st = entry.stat()
+        signature.append((entry.name, st.st_mtime_ns, st.st_size))
+    return signature
+
+
 def list_all_citation_marks(
     interp_path: str | Path, part_id: str = "main"
 ) -> list[dict]:
@@ -203,25 +287,17 @@ def list_all_citation_marks(
     왜 이렇게 하는가:
         연구자는 문서 전체에서 마크한 구절을 한눈에 보고 싶다.
         페이지별 파일을 순회하여 통합 목록을 만든다.
+        파일 내용은 (mtime_ns, size)가 같으면 캐시를 쓰므로, 편집이 없을 때는
+        디렉토리 목록과 stat만으로 끝난다.
     """
-    interp_path = Path(interp_path).resolve()
-    cite_dir = interp_path / "citation_marks"
-
-    if not cite_dir.exists():
-        return []
-
     all_marks = []
-    for f in sorted(cite_dir.glob(f"{part_id}_page_*_citation_marks.json")):
+    for entry in _scan_citation_page_files(interp_path, part_id):
         try:
-            with open(f, encoding="utf-8") as fh:
-                data = json.load(fh)
-            page_num = data.get("page_number", 0)
-            for mark in data.get("marks", []):
-                mark_with_page = dict(mark)
-                mark_with_page["page_number"] = page_num
-                all_marks.append(mark_with_page)
-        except (json.JSONDecodeError, OSError):
+            marks = _page_marks_with_page_number(entry)
+        except (JSONDecodeError, OSError):
             continue
+        # 캐시된 dict를 호출자가 고쳐도 캐시가 오염되지 않도록 얕은 복사
+        all_marks.extend(dict(m) for m in marks)
 
     return all_marks
 
@@ -266,6 +342,32 @@ def resolve_citation_context(
         인용은 원문만이 아니라 표점본·번역·주석이 함께 필요하다.
         하나의 마크에서 모든 레이어를 횡단 조회하여 통합 뷰를 제공한다.
     """
+    contexts, failures = resolve_citation_contexts_bulk(
+        library_path, doc_id, interp_path, part_id, page_num, [mark],
+    )
+    if failures:
+        raise failures[0][1]
+    return contexts[0]
+
+
+def resolve_citation_contexts_bulk(
+    library_path: str | Path,
+    doc_id: str,
+    interp_path: str | Path,
+    part_id: str,
+    page_num: int,
+    marks: list[dict],
+) -> tuple[list[dict], list[tuple[dict, Exception]]]:
+    """같은 페이지의 인용 마크 여러 개를 한 번에 컨텍스트로 변환한다.
+
+    목적: 인용 내보내기처럼 마크를 여러 개 다룰 때, 페이지 단위 파일
+          (L6 번역, L7 주석, 서지정보, L4 페이지 텍스트)과 블록 단위 파일
+          (TextBlock, L5 표점)을 마크마다 다시 읽지 않도록 한다.
+    입력: resolve_citation_context와 같고, mark 대신 marks(같은 페이지의 마크 목록).
+    출력: (contexts, failures).
+        contexts — 성공한 마크의 컨텍스트 (marks 순서 유지).
+        failures — [(mark, 예외), ...]. 한 마크가 실패해도 나머지는 계속 처리한다.
+    """
     # 지연 임포트 — 순환 참조 방지
     from core.document import get_bibliography, get_page_text
     from core.entity import get_entity
@@ -277,113 +379,149 @@ def resolve_citation_context(
     interp_path = Path(interp_path).resolve()
     doc_path = library_path / "documents" / doc_id
 
-    source = mark.get("source", {})
-    block_id = source.get("block_id", "")
-    start = source.get("start", 0)
-    end = source.get("end", 0)
-
-    # ─── L4: 원문 텍스트 ───
-    # TextBlock 기반 마크인지 확인:
-    #   TextBlock ID (UUID)로 저장된 경우, start/end는 TextBlock.original_text 기준이다.
-    #   L4 전체 페이지 텍스트에서 슬라이스하면 오프셋이 불일치한다.
-    #   따라서 TextBlock entity를 먼저 조회하여 블록 텍스트를 사용한다.
-    full_block_text = ""
-    original_text = ""
-    _used_textblock = False
-
-    try:
-        tb = get_entity(interp_path, "text_block", block_id)
-        full_block_text = tb.get("original_text", "")
-        _used_textblock = True
-    except (FileNotFoundError, Exception):
-        # TextBlock이 아닌 경우 (LayoutBlock ID 등) → L4 페이지 텍스트 폴백
-        page_data = get_page_text(doc_path, part_id, page_num)
-        full_block_text = page_data.get("text", "")
-
-    if full_block_text and start <= end < len(full_block_text):
-        original_text = full_block_text[start:end + 1]
-    elif full_block_text and start < len(full_block_text):
-        original_text = full_block_text[start:]
-
-    # ─── L5: 표점 적용본 ───
-    punctuated_text = original_text  # 기본값: 표점 없으면 원문 그대로
+    # ─── 페이지 단위 데이터: 한 번만 읽는다 ───
+    # 읽기 실패는 기존과 같이 "해당 레이어 없음"으로 취급한다.
     try:
-        punct_data = load_punctuation(interp_path, part_id, page_num, block_id)
-        marks_list = punct_data.get("marks", [])
-        if marks_list and full_block_text:
-            # 마크 범위에 해당하는 표점만 필터하여 부분 텍스트에 적용한다.
-            range_marks = _filter_marks_for_range(marks_list, start, end)
-            # 범위 시작을 0으로 맞추기 위해 오프셋 조정
-            adjusted_marks = _adjust_mark_offsets(range_marks, start)
-            punctuated_text = render_punctuated_text(original_text, adjusted_marks)
-    except Exception:
-        # 표점 로드 실패 시 원문 그대로
-        pass
-
-    # ─── L6: 번역 (범위 겹치는 것) ───
-    translations = []
-    try:
-        trans_data = load_translations(interp_path, part_id, page_num)
-        for tr in trans_data.get("translations", []):
-            tr_source = tr.get("source", {})
-            if tr_source.get("block_id") == block_id:
-                tr_start = tr_source.get("start", 0)
-                tr_end = tr_source.get("end", 0)
-                # 범위 겹침 검사: 두 구간이 겹치는지
-                if tr_start <= end and tr_end >= start:
-                    translations.append({
-                        "id": tr.get("id"),
-                        "source_text": tr.get("source_text", ""),
-                        "translation": tr.get("translation", ""),
-                        "target_language": tr.get("target_language", "ko"),
-                        "status": tr.get("status", "draft"),
-                    })
+        page_translations = load_translations(
+            interp_path, part_id, page_num,
+        ).get("translations", [])
     except Exception:
-        pass
-
-    # ─── L7: 주석 (범위 겹치는 것) ───
-    annotations = []
+        page_translations = []
     try:
-        ann_data = load_annotations(interp_path, part_id, page_num)
-        for block in ann_data.get("blocks", []):
-            if block.get("block_id") != block_id:
-                continue
-            for ann in block.get("annotations", []):
-                ann_target = ann.get("target", {})
-                ann_start = ann_target.get("start", 0)
-                ann_end = ann_target.get("end", 0)
-                if ann_start <= end and ann_end >= start:
-                    annotations.append({
-                        "id": ann.get("id"),
-                        "type": ann.get("type", ""),
-                        "label": ann.get("content", {}).get("label", ""),
-                        "description": ann.get("content", {}).get("description", ""),
-                        "dictionary": ann.get("dictionary"),
-                    })
+        page_ann_blocks = load_annotations(interp_path, part_id, page_num).get("blocks", [])
     except Exception:
-        pass
-
-    # ─── 서지정보 ───
-    bibliography = {}
+        page_ann_blocks = []
     try:
         bibliography = get_bibliography(doc_path)
     except Exception:
-        pass
-
-    # ─── 텍스트 변경 감지 ───
-    snapshot = mark.get("source_text_snapshot", "")
-    text_changed = (snapshot != original_text) if snapshot and original_text else False
-
-    return {
-        "mark": mark,
-        "original_text": original_text,
-        "punctuated_text": punctuated_text,
-        "full_block_text": full_block_text,
-        "translations": translations,
-        "annotations": annotations,
-        "bibliography": bibliography,
-        "text_changed": text_changed,
-    }
+        bibliography = {}
+
+    # 블록 단위·지연 로드 데이터 — 처음 필요할 때 읽고 같은 페이지 안에서 재사용한다.
+    block_texts: dict[str, str] = {}
+    punct_marks: dict[str, list] = {}
+    page_text: list[str] = []  # L4 페이지 텍스트 (TextBlock이 아닌 마크가 있을 때만 읽음)
+
+    def _full_block_text(block_id: str) -> str:
+        # TextBlock 기반 마크인지 확인:
+        #   TextBlock ID (UUID)로 저장된 경우, start/end는 TextBlock.original_text 기준이다.
+        #   L4 전체 페이지 텍스트에서 슬라이스하면 오프셋이 불일치한다.
+        #   따라서 TextBlock entity를 먼저 조회하여 블록 텍스트를 사용한다.
+        if block_id in block_texts:
+            return block_texts[block_id]
+        try:
+            tb = get_entity(interp_path, "text_block", block_id)
+            text = tb.get("original_text", "")
+        except (FileNotFoundError, Exception):
+            # TextBlock이 아닌 경우 (LayoutBlock ID 등) → L4 페이지 텍스트 폴백
+            if not page_text:
+                page_text.append(get_page_text(doc_path, part_id, page_num).get("text", ""))
+            text = page_text[0]
+        block_texts[block_id] = text
+        return text
+
+    def _punctuation_marks(block_id: str) -> list:
+        if block_id not in punct_marks:
+            try:
+                punct_marks[block_id] = load_punctuation(
+                    interp_path, part_id, page_num, block_id
+                ).get("marks", [])
+            except Exception:
+                # 표점 로드 실패 시 원문 그대로
+                punct_marks[block_id] = []
+        return punct_marks[block_id]
+
+    contexts = []
+    failures = []
+    for mark in marks:
+        source = mark.get("source", {})
+        block_id = source.get("block_id", "")
+        start = source.get("start", 0)
+        end = source.get("end", 0)
+
+        # ─── L4: 원문 텍스트 ───
+        try:
+            full_block_text = _full_block_text(block_id)
+        except Exception as e:
+            failures.append((mark, e))
+            continue
+
+        original_text = ""
+        if full_block_text and start <= end < len(full_block_text):
+            original_text = full_block_text[start:end + 1]
+        elif full_block_text and start < len(full_block_text):
+            original_text = full_block_text[start:]
+
+        # ─── L5: 표점 적용본 ───
+        punctuated_text = original_text  # 기본값: 표점 없으면 원문 그대로
+        marks_list = _punctuation_marks(block_id)
+        if marks_list and full_block_text:
+            try:
+                # 마크 범위에 해당하는 표점만 필터하여 부분 텍스트에 적용한다.
+                range_marks = _filter_marks_for_range(marks_list, start, end)
+                # 범위 시작을 0으로 맞추기 위해 오프셋 조정
+                adjusted_marks = _adjust_mark_offsets(range_marks, start)
+                punctuated_text = render_punctuated_text(original_text, adjusted_marks)
+            except Exception:
+                pass
+
+        # ─── L6: 번역 (범위 겹치는 것) ───
+        translations = []
+        try:
+            for tr in page_translations:
+                tr_source = tr.get("source", {})
+                if tr_source.get("block_id") == block_id:
+                    tr_start = tr_source.get("start", 0)
+                    tr_end = tr_source.get("end", 0)
+                    # 범위 겹침 검사: 두 구간이 겹치는지
+                    if tr_start <= end and tr_end >= start:
+                        translations.append({
+                            "id": tr.get("id"),
+                            "source_text": tr.get("source_text", ""),
+                            "translation": tr.get("translation", ""),
+                            "target_language": tr.get("target_language", "ko"),
+                            "status": tr.get("status", "draft"),
+                        })
+        except Exception:
+            pass
+
+        # ─── L7: 주석 (범위 겹치는 것) ───
+        annotations = []
+        try:
+            for block in page_ann_blocks:
+                if block.get("block_id") != block_id:
+                    continue
+                for ann in block.get("annotations", []):
+                    ann_target = ann.get("target", {})
+                    ann_start = ann_target.get("start", 0)
+                    ann_end = ann_target.get("end", 0)
+                    if ann_start <= end and ann_end >= start:
+                        annotations.append({
+                            "id": ann.get("id"),
+                            "type": ann.get("type", ""),
+                            "label": ann.get("content", {}).get("label", ""),
+                            "description": ann.get("content", {}).get("description", ""),
+                            "dictionary": ann.get("dictionary"),
+                        })
+        except Exception:
+            pass
+
+        # ─── 텍스트 변경 감지 ───
+        snapshot = mark.get("source_text_snapshot", "")
+        text_changed = (snapshot != original_text) if snapshot and original_text else False
+
+        contexts.append({
+            "mark": mark,
+            "original_text": original_text,
+            "punctuated_text": punctuated_text,
+            "full_block_text": full_block_text,
+            "translations": translations,
+            "annotations": annotations,
+            # 같은 페이지의 마크들이 서지 dict를 공유하지 않도록 얕은 복사
+            "bibliography": dict(bibliography),
+            "text_changed": text_changed,
+        })
+
+    return contexts, failures
 
 
 def _filter_marks_for_range(
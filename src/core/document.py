@@ -16,17 +16,26 @@ platform-v7.md 섹션 10.1의 구조를 따른다:
 """
 
 import json
+import os
 import re
 import shutil
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 
 import git
 
+from core.json_io import read_json
+
 
 # 문헌 ID 패턴: manifest.schema.json의 document_id 규칙과 동일
 _DOC_ID_PATTERN = re.compile(r"^[a-z][a-z0-9_]{0,63}$")
 
+# 일괄 교정용 글자→페이지 역색인 캐시
+# {(문헌 경로, part_id): (페이지 파일 서명, {글자: [페이지 번호, ...]})}
+_CHAR_PAGE_INDEX: OrderedDict = OrderedDict()
+_CHAR_PAGE_INDEX_MAX_SIZE = 16
+
 
 def add_document(
     library_path: str | Path,
@@ -186,7 +195,7 @@ def get_document_info(doc_path: str | Path) -> dict:
             "→ 해결: 올바른 문헌 경로를 지정하세요."
         )
 
-    return json.loads(manifest_path.read_text(encoding="utf-8"))
+    return read_json(manifest_path)
 
 
 def list_pages(doc_path: str | Path) -> list[dict]:
@@ -321,6 +330,39 @@ def get_page_text(doc_path: str | Path, part_id: str, page_num: int) -> dict:
     }
 
 
+def list_page_texts(doc_path: str | Path, part_id: str, page_count: int) -> list[dict]:
+    """한 권(part)의 1~page_count 페이지 텍스트를 한꺼번에 읽는다.
+
+    입력:
+        doc_path — 문헌 디렉토리 경로.
+        part_id — 권 식별자.
+        page_count — 읽을 페이지 수.
+    출력: [{page_num, text}, ...] — 페이지 순서대로. 파일이 없는 페이지는 text="".
+
+    왜 get_page_text를 반복하지 않는가:
+        get_page_text는 호출마다 manifest.json을 다시 파싱하고 exists()+read를 한다.
+        500쪽 권이면 매니페스트 파싱 500번 + stat 1000번이다.
+        여기서는 L4_text/pages/를 scandir로 한 번 훑어 있는 파일 이름만 모은 뒤
+        존재하는 파일만 읽는다.
+    """
+    pages_dir = Path(doc_path) / "L4_text" / "pages"
+    try:
+        with os.scandir(pages_dir) as it:
+            names = {e.name for e in it if e.is_file()}
+    except FileNotFoundError:
+        names = set()
+
+    result: list[dict] = []
+    for page_num in range(1, page_count + 1):
+        # 파일명 규칙은 _text_file_path와 같다: {part_id}_page_{NNN}.txt
+        filename = f"{part_id}_page_{page_num:03d}.txt"
+        text = ""
+        if filename in names:
+            text = (pages_dir / filename).read_text(encoding="utf-8")
+        result.append({"page_num": page_num, "text": text})
+    return result
+
+
 def save_page_text(
     doc_path: str | Path,
     part_id: str,
@@ -388,7 +430,7 @@ def get_page_layout(doc_path: str | Path, part_id: str, page_num: int) -> dict:
     relative_path = layout_path.relative_to(doc_path).as_posix()
 
     if layout_path.exists():
-        data = json.loads(layout_path.read_text(encoding="utf-8"))
+        data = read_json(layout_path)
         data["_meta"] = {
             "document_id": manifest["document_id"],
             "file_path": relative_path,
@@ -448,7 +490,7 @@ def save_page_layout(
         / "schemas" / "source_repo" / "layout_page.schema.json"
     )
     if schema_path.exists():
-        schema = json.loads(schema_path.read_text(encoding="utf-8"))
+        schema = read_json(schema_path)
         # _meta 필드는 내부용이므로 검증 전에 제거
         validate_data = {k: v for k, v in layout_data.items() if not k.startswith("_")}
         jsonschema.validate(instance=validate_data, schema=schema)
@@ -478,7 +520,7 @@ def get_bibliography(doc_path: str | Path) -> dict:
     bib_path = doc_path / "bibliography.json"
 
     if bib_path.exists():
-        return json.loads(bib_path.read_text(encoding="utf-8"))
+        return read_json(bib_path)
 
     # 파일이 없으면 manifest에서 제목만 가져와 기본 구조 반환
     manifest = get_document_info(doc_path)
@@ -528,7 +570,7 @@ def save_bibliography(doc_path: str | Path, bibliography: dict) -> dict:
         / "schemas" / "source_repo" / "bibliography.schema.json"
     )
     if schema_path.exists():
-        schema = json.loads(schema_path.read_text(encoding="utf-8"))
+        schema = read_json(schema_path)
         jsonschema.validate(instance=bibliography, schema=schema)
 
     _write_json(bib_path, bibliography)
@@ -572,7 +614,7 @@ def get_page_corrections(doc_path: str | Path, part_id: str, page_num: int) -> d
     relative_path = corr_path.relative_to(doc_path).as_posix()
 
     if corr_path.exists():
-        data = json.loads(corr_path.read_text(encoding="utf-8"))
+        data = read_json(corr_path)
         data["_meta"] = {
             "document_id": manifest["document_id"],
             "file_path": relative_path,
@@ -862,7 +904,7 @@ def save_page_corrections(
         / "schemas" / "source_repo" / "corrections.schema.json"
     )
     if schema_path.exists():
-        schema = json.loads(schema_path.read_text(encoding="utf-8"))
+        schema = read_json(schema_path)
         # _meta 필드는 내부용이므로 검증 전에 제거
         validate_data = {k: v for k, v in corrections_data.items() if not k.startswith("_")}
         jsonschema.validate(instance=validate_data, schema=schema)
@@ -1175,7 +1217,7 @@ def _update_library_manifest(library_path: Path, doc_id: str, title: str) -> Non
     """서고 매니페스트에 새 문헌을 추가한다. (내부 유틸리티)"""
     manifest_path = library_path / "library_manifest.json"
     if manifest_path.exists():
-        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        manifest = read_json(manifest_path)
     else:
         manifest = {"documents": []}
 
@@ -1956,6 +1998,67 @@ async def create_document_from_url(
 # ──────────────────────────────────────────────────────────
 
 
+def _char_page_index(doc_path: Path, part_id: str) -> dict[str, list[int]]:
+    """권의 L4 텍스트 페이지에 대한 글자→페이지 번호 역색인을 반환한다.
+
+    왜 역색인인가:
+        일괄 교정은 범위 안의 모든 페이지를 열어 글자를 찾는다.
+        천 페이지짜리 문헌이면 미리보기 한 번에 파일 천 개를 읽는다.
+        글자가 나오는 페이지 목록을 기억해 두면 그 페이지만 열면 된다.
+
+    왜 메모리 캐시인가:
+        문헌 폴더에 색인 파일을 두면 문헌 git 저장소의 커밋에 섞여 들어간다.
+        대신 페이지 파일들의 (번호, mtime, 크기) 서명을 함께 저장하고,
+        서명이 달라지면(텍스트 저장·가져오기) 다시 만든다.
+        교정(corrections)은 원문 텍스트를 바꾸지 않으므로 색인에 영향이 없다.
+    """
+    pages_dir = doc_path / "L4_text" / "pages"
+    prefix = f"{part_id}_page_"
+
+    files: list[tuple[int, os.DirEntry]] = []
+    try:
+        with os.scandir(pages_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(prefix) and name.endswith(".txt"):
+                    num = name[len(prefix):-4]
+                    if num.isdigit():
+                        files.append((int(num), entry))
+    except FileNotFoundError:
+        return {}
+    files.sort(key=lambda item: item[0])
+
+    signature = tuple(
+        (page_num, st.st_mtime_ns, st.st_size)
+        for page_num, st in ((n, e.stat()) for n, e in files)
+    )
+    key = (str(doc_path), part_id)
+    cached = _CHAR_PAGE_INDEX.get(key)
+    if cached is not None and cached[0] == signature:
+        _CHAR_PAGE_INDEX.move_to_end(key)
+        return cached[1]
+
+    index: dict[str, list[int]] = {}
+    for page_num, entry in files:
+        text = Path(entry.path).read_text(encoding="utf-8")
+        for ch in set(text):
+            index.setdefault(ch, []).append(page_num)
+
+    _CHAR_PAGE_INDEX[key] = (signature, index)
+    _CHAR_PAGE_INDEX.move_to_end(key)
+    while len(_CHAR_PAGE_INDEX) > _CHAR_PAGE_INDEX_MAX_SIZE:
+        _CHAR_PAGE_INDEX.popitem(last=False)
+    return index
+
+
+def _pages_containing(
+    doc_path: Path, part_id: str, page_start: int, page_end: int, target_char: str
+) -> list[int]:
+    """범위 안에서 target_char가 들어 있는 페이지 번호만 오름차순으로 반환한다."""
+    pages = _char_page_index(doc_path, part_id).get(target_char, ())
+    return [p for p in pages if page_start <= p <= page_end]
+
+
 def search_char_in_pages(
     doc_path: str | Path,
     part_id: str,
@@ -1993,7 +2096,8 @@ def search_char_in_pages(
     doc_path = Path(doc_path).resolve()
     results = []
 
-    for page_num in range(page_start, page_end + 1):
+    # 글자가 실제로 나오는 페이지만 연다 (역색인)
+    for page_num in _pages_containing(doc_path, part_id, page_start, page_end, target_char):
         # 원본 텍스트 로드
         text_result = get_page_text(doc_path, part_id, page_num)
         text = text_result.get("text", "")
@@ -2073,7 +2177,8 @@ def apply_batch_corrections(
     total = 0
     details = []
 
-    for page_num in range(page_start, page_end + 1):
+    # 글자가 실제로 나오는 페이지만 연다 (역색인)
+    for page_num in _pages_containing(doc_path, part_id, page_start, page_end, original_char):
         # 원본 텍스트 로드
         text_result = get_page_text(doc_path, part_id, page_num)
         text = text_result.get("text", "")
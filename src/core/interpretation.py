@@ -30,6 +30,8 @@ from pathlib import Path
 
 import git
 
+from core.json_io import read_json
+
 
 # 해석 저장소 ID 패턴: 영문 소문자+숫자+밑줄
 _INTERP_ID_PATTERN = re.compile(r"^[a-z][a-z0-9_]{0,63}$")
@@ -269,7 +271,7 @@ def check_dependency(library_path: str | Path, interp_id: str) -> dict:
             "→ 해결: 올바른 해석 저장소 경로를 확인하세요."
         )
 
-    dep = json.loads(dep_path.read_text(encoding="utf-8"))
+    dep = read_json(dep_path)
     source_doc_id = dep["source"]["document_id"]
     doc_path = library_path / "documents" / source_doc_id
 
@@ -348,7 +350,7 @@ def acknowledge_changes(
     interp_path = library_path / "interpretations" / interp_id
     dep_path = interp_path / "dependency.json"
 
-    dep = json.loads(dep_path.read_text(encoding="utf-8"))
+    dep = read_json(dep_path)
     acknowledged_count = 0
 
     for tf in dep.get("tracked_files", []):
@@ -395,7 +397,7 @@ def update_base(library_path: str | Path, interp_id: str) -> dict:
     interp_path = library_path / "interpretations" / interp_id
     dep_path = interp_path / "dependency.json"
 
-    dep = json.loads(dep_path.read_text(encoding="utf-8"))
+    dep = read_json(dep_path)
     source_doc_id = dep["source"]["document_id"]
     doc_path = library_path / "documents" / source_doc_id
 
@@ -436,7 +438,7 @@ def list_interpretations(library_path: str | Path) -> list[dict]:
             continue
         manifest_path = d / "manifest.json"
         if manifest_path.exists():
-            info = json.loads(manifest_path.read_text(encoding="utf-8"))
+            info = read_json(manifest_path)
             interpretations.append(info)
 
     return interpretations
@@ -458,7 +460,7 @@ def get_interpretation_info(interp_path: str | Path) -> dict:
             "→ 해결: 올바른 해석 저장소 경로를 지정하세요."
         )
 
-    return json.loads(manifest_path.read_text(encoding="utf-8"))
+    return read_json(manifest_path)
 
 
 def _layer_file_path(
@@ -917,8 +919,7 @@ def _append_based_on_trailer(interp_path: Path, message: str) -> str:
         return message
 
     try:
-        with open(manifest_path, encoding="utf-8") as f:
-            manifest = json.load(f)
+        manifest = read_json(manifest_path)
     except (json.JSONDecodeError, OSError):
         return message
 
@@ -1099,7 +1100,7 @@ def _update_library_manifest_interp(
     """서고 매니페스트에 해석 저장소를 추가한다. (내부 유틸리티)"""
     manifest_path = library_path / "library_manifest.json"
     if manifest_path.exists():
-        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        manifest = read_json(manifest_path)
     else:
         manifest = {"documents": [], "interpretations": []}
 
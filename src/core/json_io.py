@@ -0,0 +1,83 @@
+"""JSON 읽기 헬퍼 — orjson이 있으면 사용하고, 없으면 표준 json으로 폴백한다.
+
+왜 별도 모듈인가:
+    서고 매니페스트, 앱 설정 등 JSON 파일은 여러 모듈에서 반복해서 읽는다.
+    orjson은 bytes를 직접 받아 파싱하므로 read_text()의 UTF-8 디코딩 단계가 없고,
+    표준 json보다 2~3배 빠르다. orjson은 pyproject 의존성이지만, 휠이 없는 플랫폼이나
+    의존성을 빠뜨린 환경에서도 같은 코드가 동작하도록 여기서 한 번만 분기한다.
+
+사용법:
+    from core.json_io import dumps, read_json, write_json_atomic, JSONDecodeError
+
+    data = read_json(path)   # FileNotFoundError / JSONDecodeError는 호출자가 처리
+    path.write_bytes(dumps(data, indent=True))
+    write_json_atomic(path, data)   # 임시 파일 + os.replace
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+try:
+    import orjson as _orjson
+except ImportError:  # 안전망 — 설치가 빠진 환경에서는 표준 json 사용
+    _orjson = None
+
+# orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스이므로
+# 호출자는 어느 쪽이든 이 이름 하나로 잡으면 된다.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str):
+    """JSON 문자열(또는 UTF-8 bytes)을 파싱한다.
+
+    입력: data — JSON 텍스트. bytes면 디코딩 없이 바로 파싱한다.
+    출력: 파싱된 Python 객체.
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: str | Path):
+    """JSON 파일을 읽어 파싱한다.
+
+    입력: path — JSON 파일 경로 (UTF-8).
+    출력: 파싱된 Python 객체.
+    예외: 파일이 없으면 FileNotFoundError, 형식이 잘못되면 JSONDecodeError.
+    """
+    return loads(Path(path).read_bytes())
+
+
+def dumps(obj, *, indent: bool = False) -> bytes:
+    """객체를 UTF-8 JSON bytes로 직렬화한다.
+
+    입력:
+        obj — 직렬화할 객체.
+        indent — True면 2칸 들여쓰기 (사람이 직접 열어보는 파일용).
+    출력: UTF-8 JSON bytes. 비ASCII 문자는 이스케이프하지 않는다
+          (표준 json의 ensure_ascii=False와 같은 결과).
+    """
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(
+        obj, ensure_ascii=False, indent=2 if indent else None
+    ).encode("utf-8")
+
+
+def write_json_atomic(path: str | Path, obj) -> None:
+    """객체를 2칸 들여쓴 JSON으로 저장한다. 임시 파일에 쓴 뒤 os.replace로 바꿔치기한다.
+
+    왜 이렇게 하는가:
+        주석·인용 마크 파일은 편집할 때마다 통째로 다시 쓴다. 쓰는 도중 프로세스가 죽으면
+        write_bytes()는 반쯤 잘린 JSON을 남기고, 그 페이지는 다음 로드에서 깨진다.
+        os.replace는 같은 디렉토리 안에서 원자적이므로 기존 파일 아니면 새 파일만 보인다.
+        임시 파일(*.tmp)은 저장소 .gitignore에 들어 있어 커밋되지 않는다.
+    """
+    path = os.fspath(path)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(dumps(obj, indent=True) + b"\n")
+    os.replace(tmp_path, path)
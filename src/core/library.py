@@ -18,6 +18,8 @@ import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 
+from core.json_io import read_json
+
 
 def init_library(path: str | Path) -> Path:
     """서고 디렉토리 구조를 생성한다.
@@ -82,7 +84,7 @@ def get_library_info(path: str | Path) -> dict:
             "→ 해결: 'init-library' 명령으로 서고를 먼저 생성하세요."
         )
 
-    return json.loads(manifest_path.read_text(encoding="utf-8"))
+    return read_json(manifest_path)
 
 
 def list_documents(path: str | Path) -> list[dict]:
@@ -104,12 +106,34 @@ def list_documents(path: str | Path) -> list[dict]:
             continue
         manifest_path = doc_dir / "manifest.json"
         if manifest_path.exists():
-            doc_info = json.loads(manifest_path.read_text(encoding="utf-8"))
+            doc_info = read_json(manifest_path)
             documents.append(doc_info)
 
     return documents
 
 
+def documents_signature(path: str | Path) -> list[tuple]:
+    """문헌 manifest.json들의 (문헌 ID, mtime_ns, 크기) 목록.
+
+    목적: 문헌 목록 API의 ETag 계산. manifest를 읽지 않고 stat만으로
+          list_documents 결과가 바뀌었는지 판단한다.
+    """
+    docs_dir = Path(path).resolve() / "documents"
+    signature = []
+    try:
+        with os.scandir(docs_dir) as it:
+            names = sorted(e.name for e in it if e.is_dir())
+    except FileNotFoundError:
+        return []
+    for name in names:
+        try:
+            st = os.stat(docs_dir / name / "manifest.json")
+        except FileNotFoundError:
+            continue
+        signature.append((name, st.st_mtime_ns, st.st_size))
+    return signature
+
+
 def list_interpretations(path: str | Path) -> list[dict]:
     """서고의 해석 저장소 목록을 반환한다.
 
@@ -129,7 +153,7 @@ def list_interpretations(path: str | Path) -> list[dict]:
             continue
         manifest_path = d / "manifest.json"
         if manifest_path.exists():
-            info = json.loads(manifest_path.read_text(encoding="utf-8"))
+            info = read_json(manifest_path)
             interpretations.append(info)
 
     return interpretations
@@ -348,7 +372,7 @@ def _find_related_interpretations(library_path: Path, doc_id: str) -> list[str]:
         if not manifest_path.exists():
             continue
         try:
-            info = json.loads(manifest_path.read_text(encoding="utf-8"))
+            info = read_json(manifest_path)
             if info.get("source_document_id") == doc_id:
                 related.append(info.get("interpretation_id", d.name))
         except (json.JSONDecodeError, OSError):
@@ -375,7 +399,7 @@ def _parse_trash_entry(trash_folder: Path) -> dict | None:
     manifest_path = trash_folder / "manifest.json"
     if manifest_path.exists():
         try:
-            info = json.loads(manifest_path.read_text(encoding="utf-8"))
+            info = read_json(manifest_path)
             title = info.get("title", original_id)
         except (json.JSONDecodeError, OSError):
             pass
@@ -11,6 +11,8 @@ from pathlib import Path
 
 from jsonschema import validate
 
+from core.json_io import read_json
+
 # ──────────────────────────────────────
 # 스키마 로드 (모듈 레벨 캐시)
 # ──────────────────────────────────────
@@ -26,8 +28,7 @@ def _get_schema() -> dict:
     """번역 JSON 스키마를 로드한다 (최초 1회만 읽음)."""
     global _schema_cache
     if _schema_cache is None:
-        with open(_SCHEMA_PATH, encoding="utf-8") as f:
-            _schema_cache = json.load(f)
+        _schema_cache = read_json(_SCHEMA_PATH)
     return _schema_cache
 
 
@@ -52,16 +53,16 @@ def load_translations(
     interp_path = Path(interp_path).resolve()
     file_path = _translation_file_path(interp_path, part_id, page_num)
 
-    if not file_path.exists():
+    # exists() 확인 후 읽으면 stat이 한 번 더 일어나므로, 바로 읽고 없으면 빈 구조를 돌려준다.
+    try:
+        return read_json(file_path)
+    except FileNotFoundError:
         return {
             "part_id": part_id,
             "page_number": page_num,
             "translations": [],
         }
 
-    with open(file_path, encoding="utf-8") as f:
-        return json.load(f)
-
 
 def save_translations(
     interp_path: str | Path,
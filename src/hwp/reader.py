@@ -15,7 +15,11 @@ hwp-hwpx-parser가 두 형식을 모두 처리하고 HWP도 전체 파싱하므
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
@@ -27,6 +31,56 @@ from hwp_hwpx_parser import (
 
 logger = logging.getLogger(__name__)
 
+# 파일 내용(sha256) → (저장 시각, 섹션 목록).
+# 왜 내용 해시로 캐시하는가:
+#   가져오기 화면은 같은 파일을 미리보기 → (분리) → 가져오기 순서로 매번 다시 업로드한다.
+#   업로드마다 임시 파일 경로가 달라지므로 경로로는 같은 파일임을 알 수 없고,
+#   책 한 권 분량의 HWP는 파싱에 수 초가 걸린다. 내용 해시는 파싱보다 훨씬 싸다.
+#   파싱 결과는 텍스트뿐이라 항목 수를 작게 잡고, 가져오기 한 번 분량(10분)만 유지한다.
+_SECTIONS_CACHE_TTL_SEC = 600
+_SECTIONS_CACHE_MAX_SIZE = 4
+_sections_cache: OrderedDict[str, tuple[float, list[dict]]] = OrderedDict()
+# 핸들러가 asyncio.to_thread로 부르므로 여러 스레드에서 동시에 접근할 수 있다.
+_sections_cache_lock = threading.Lock()
+
+
+def _file_digest(path: Path) -> str:
+    """파일 내용의 sha256 hex digest를 1 MiB 단위로 읽어 계산한다."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _get_cached_sections(key: str) -> list[dict] | None:
+    now = time.monotonic()
+    with _sections_cache_lock:
+        cached = _sections_cache.get(key)
+        if cached is None:
+            return None
+        ts, sections = cached
+        if now - ts > _SECTIONS_CACHE_TTL_SEC:
+            del _sections_cache[key]
+            return None
+        _sections_cache.move_to_end(key)
+        return sections
+
+
+def _set_cached_sections(key: str, sections: list[dict]) -> None:
+    now = time.monotonic()
+    with _sections_cache_lock:
+        _sections_cache[key] = (now, sections)
+        _sections_cache.move_to_end(key)
+        expired = [
+            k for k, (ts, _) in _sections_cache.items()
+            if now - ts > _SECTIONS_CACHE_TTL_SEC
+        ]
+        for k in expired:
+            del _sections_cache[k]
+        while len(_sections_cache) > _SECTIONS_CACHE_MAX_SIZE:
+            _sections_cache.popitem(last=False)
+
 
 class UnifiedReader:
     """HWP/HWPX 통합 리더.
@@ -60,6 +114,10 @@ class UnifiedReader:
                 "→ 파일의 암호를 해제한 뒤 다시 시도하세요."
             )
 
+        # extract_sections() 결과. extract_metadata()도 섹션 수를 세려고 부르므로
+        # 한 리더에서 메타데이터와 섹션을 모두 뽑을 때 파싱이 두 번 일어나지 않게 한다.
+        self._sections: list[dict] | None = None
+
     @property
     def file_type(self) -> str:
         """파일 형식을 반환한다. "hwpx" | "hwp" """
@@ -89,16 +147,27 @@ class UnifiedReader:
         HWP: 전체 텍스트를 빈 줄 2개 이상 기준으로 분할하여 섹션화.
 
         출력: [{"index": 0, "name": "section0.xml", "text": "..."}, ...]
+              같은 리더·같은 내용의 파일이면 파싱 결과를 재사용한다(모듈 상단 캐시 참고).
+              목록은 호출자끼리 공유되므로 수정하지 말고 읽기만 한다.
 
         왜 섹션이 필요한가:
           HWP/HWPX 가져오기에서 섹션은 PDF 페이지와 매핑하는 최소 단위이다.
           HWPX의 섹션이 반드시 PDF 페이지와 1:1은 아니지만,
           자동 매핑의 출발점으로 사용한다.
         """
-        if self._reader.file_type == FileType.HWPX:
-            return self._extract_hwpx_sections()
-        else:
-            return self._extract_hwp_sections()
+        if self._sections is not None:
+            return self._sections
+
+        key = _file_digest(self._path)
+        sections = _get_cached_sections(key)
+        if sections is None:
+            if self._reader.file_type == FileType.HWPX:
+                sections = self._extract_hwpx_sections()
+            else:
+                sections = self._extract_hwp_sections()
+            _set_cached_sections(key, sections)
+        self._sections = sections
+        return sections
 
     def _extract_hwpx_sections(self) -> list[dict]:
         """HWPX 파일의 실제 섹션별 텍스트를 추출한다.
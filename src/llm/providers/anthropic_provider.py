@@ -51,7 +51,9 @@ class AnthropicProvider(BaseLlmProvider):
         if not api_key:
             raise LlmProviderError("ANTHROPIC_API_KEY가 설정되지 않았습니다.")
 
-        client = anthropic.AsyncAnthropic(api_key=api_key)
+        client = self._shared_client(
+            ("anthropic", api_key), lambda: anthropic.AsyncAnthropic(api_key=api_key),
+        )
         selected_model = model or self.DEFAULT_MODEL
 
         messages = [{"role": "user", "content": prompt}]
@@ -90,7 +92,9 @@ class AnthropicProvider(BaseLlmProvider):
         if not api_key:
             raise LlmProviderError("ANTHROPIC_API_KEY가 설정되지 않았습니다.")
 
-        client = anthropic.AsyncAnthropic(api_key=api_key)
+        client = self._shared_client(
+            ("anthropic", api_key), lambda: anthropic.AsyncAnthropic(api_key=api_key),
+        )
         selected_model = model or self.DEFAULT_MODEL
 
         messages = [
@@ -4,6 +4,9 @@
 router.py가 우선순위에 따라 순서대로 시도.
 """
 
+import asyncio
+import inspect
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -53,6 +56,55 @@ class BaseLlmProvider(ABC):
 
     def __init__(self, config):
         self.config = config
+        # 재사용 HTTP 클라이언트: {이벤트 루프: {키: 클라이언트}}
+        # 왜 루프별인가: httpx/SDK 비동기 클라이언트의 커넥션 풀은 생성된 이벤트 루프에 묶인다.
+        # OCR 엔진처럼 별도 스레드에서 asyncio.run()으로 호출하는 경로도 있으므로
+        # 루프마다 따로 두고, 루프가 사라지면(WeakKeyDictionary) 함께 정리되게 한다.
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _shared_client(self, key, factory):
+        """현재 이벤트 루프에서 재사용할 HTTP 클라이언트를 반환한다.
+
+        왜 재사용하는가:
+            호출마다 클라이언트를 새로 만들면 매번 TCP·TLS 연결을 다시 맺는다 (50~200ms).
+            자동 폴백이 여러 프로바이더를 시도할수록 이 비용이 누적된다.
+
+        입력:
+            key — 클라이언트 구분 키 (API 키가 바뀌면 새 클라이언트가 필요하므로 키에 포함).
+            factory — 클라이언트가 없을 때 호출할 생성 함수.
+        출력: 캐시된(또는 새로 만든) 클라이언트.
+        """
+        loop = asyncio.get_running_loop()
+        per_loop = self._clients.get(loop)
+        if per_loop is None:
+            per_loop = {}
+            self._clients[loop] = per_loop
+        client = per_loop.get(key)
+        if client is None:
+            client = factory()
+            per_loop[key] = client
+        return client
+
+    async def aclose(self):
+        """현재 이벤트 루프에서 만든 재사용 클라이언트를 닫는다 (keep-alive 연결 정리).
+
+        다른 루프(스레드)의 클라이언트는 그 루프에서만 닫을 수 있으므로 건드리지 않는다.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        per_loop = self._clients.pop(loop, None) or {}
+        for client in per_loop.values():
+            close = getattr(client, "aclose", None) or getattr(client, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                pass  # 닫기 실패는 무시 (이미 끊긴 연결 등)
 
     @abstractmethod
     async def is_available(self) -> bool:
@@ -98,6 +150,8 @@ class BaseLlmProvider(ABC):
             progress_callback — 선택적 콜백.
                 {"type":"progress","elapsed_sec":N,"provider":"..."} dict를 받는다.
                 SSE 이벤트로 변환하여 프론트엔드에 전달된다.
+                네이티브 스트리밍 프로바이더는 직전 보고 이후 받은 텍스트를
+                "text_delta" 키로 함께 넘긴다 (호출자의 부분 결과 파싱용).
         출력: LlmResponse (call()과 동일).
         """
         import asyncio
@@ -49,7 +49,7 @@ class Base44BridgeProvider(BaseLlmProvider):
         """Node.js + bridge 스크립트 + Base44 인증 토큰 확인."""
         # 1. Node.js 설치 확인
         try:
-            result = await asyncio.get_event_loop().run_in_executor(
+            result = await asyncio.get_running_loop().run_in_executor(
                 None,
                 functools.partial(
                     subprocess.run,
@@ -103,7 +103,7 @@ class Base44BridgeProvider(BaseLlmProvider):
 
         try:
             # subprocess.run을 스레드 풀에서 실행 (asyncio 이벤트 루프 블로킹 방지)
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             result = await asyncio.wait_for(
                 loop.run_in_executor(
                     None,
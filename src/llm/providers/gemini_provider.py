@@ -103,7 +103,9 @@ class GeminiProvider(BaseLlmProvider):
         if not api_key:
             raise LlmProviderError("GOOGLE_API_KEY가 설정되지 않았습니다.")
 
-        client = genai.Client(api_key=api_key)
+        client = self._shared_client(
+            ("gemini", api_key), lambda: genai.Client(api_key=api_key),
+        )
         selected_model = model or self.DEFAULT_MODEL
 
         # Gemini는 system_instruction을 별도 파라미터로 받음
@@ -166,7 +168,9 @@ class GeminiProvider(BaseLlmProvider):
         if not api_key:
             raise LlmProviderError("GOOGLE_API_KEY가 설정되지 않았습니다.")
 
-        client = genai.Client(api_key=api_key)
+        client = self._shared_client(
+            ("gemini", api_key), lambda: genai.Client(api_key=api_key),
+        )
         selected_model = model or self.DEFAULT_MODEL
 
         # generate_content_stream 메서드 확인 — 없으면 heartbeat 폴백
@@ -189,6 +193,7 @@ class GeminiProvider(BaseLlmProvider):
         full_text = ""
         tokens_out = 0
         last_report = t0
+        reported_len = 0  # text_delta로 이미 보고한 full_text 길이
         finish_reason = ""
 
         stream_or_coro = client.aio.models.generate_content_stream(
@@ -216,11 +221,15 @@ class GeminiProvider(BaseLlmProvider):
             now = time.monotonic()
             if progress_callback and (now - last_report) >= 1.0:
                 last_report = now
+                delta = full_text[reported_len:]
+                reported_len = len(full_text)
                 progress_callback({
                     "type": "progress",
                     "elapsed_sec": round(now - t0, 1),
                     "tokens": tokens_out,
                     "provider": self.provider_id,
+                    # 직전 보고 이후 받은 텍스트 — 호출자가 부분 결과를 미리 파싱할 때 사용
+                    "text_delta": delta,
                 })
 
         elapsed = time.monotonic() - t0
@@ -259,7 +268,9 @@ class GeminiProvider(BaseLlmProvider):
         if not api_key:
             raise LlmProviderError("GOOGLE_API_KEY가 설정되지 않았습니다.")
 
-        client = genai.Client(api_key=api_key)
+        client = self._shared_client(
+            ("gemini", api_key), lambda: genai.Client(api_key=api_key),
+        )
         selected_model = model or self.DEFAULT_MODEL
 
         config = types.GenerateContentConfig(
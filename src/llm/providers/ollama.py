@@ -46,20 +46,29 @@ class OllamaProvider(BaseLlmProvider):
     def _url(self) -> str:
         return self.config.get("ollama_url", "http://localhost:11434")
 
+    def _http_client(self) -> httpx.AsyncClient:
+        """재사용 httpx 클라이언트. 요청별 타임아웃은 호출 시 timeout=으로 지정한다."""
+        return self._shared_client(
+            "httpx",
+            lambda: httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20),
+            ),
+        )
+
     async def is_available(self) -> bool:
         """Ollama 서버가 실행 중인지 확인."""
         try:
-            async with httpx.AsyncClient(timeout=3.0) as client:
-                resp = await client.get(f"{self._url}/api/tags")
-                return resp.status_code == 200
+            client = self._http_client()
+            resp = await client.get(f"{self._url}/api/tags", timeout=3.0)
+            return resp.status_code == 200
         except (httpx.ConnectError, httpx.TimeoutException, OSError):
             return False
 
     async def list_models(self) -> list[dict]:
         """설치된 모델 목록 조회. GUI 드롭다운에서 사용."""
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.get(f"{self._url}/api/tags")
-            data = resp.json()
+        client = self._http_client()
+        resp = await client.get(f"{self._url}/api/tags", timeout=5.0)
+        data = resp.json()
 
         models = []
         for m in data.get("models", []):
@@ -103,15 +112,15 @@ class OllamaProvider(BaseLlmProvider):
         t0 = time.monotonic()
         # 클라우드 프록시 모델(gemini-3-flash-preview:cloud 등)은
         # 네트워크 지연이 추가되므로 타임아웃을 넉넉히 300초로 설정.
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            resp = await client.post(
-                f"{self._url}/api/generate", json=payload
+        client = self._http_client()
+        resp = await client.post(
+            f"{self._url}/api/generate", json=payload, timeout=300.0
+        )
+        if resp.status_code != 200:
+            raise LlmProviderError(
+                f"Ollama 응답 {resp.status_code}: {resp.text[:200]}"
             )
-            if resp.status_code != 200:
-                raise LlmProviderError(
-                    f"Ollama 응답 {resp.status_code}: {resp.text[:200]}"
-                )
-            data = resp.json()
+        data = resp.json()
         elapsed = time.monotonic() - t0
 
         if data.get("error"):
@@ -164,46 +173,51 @@ class OllamaProvider(BaseLlmProvider):
         tokens_out = 0
         tokens_in = None
         last_report = t0
+        reported_len = 0  # text_delta로 이미 보고한 full_text 길이
+
+        client = self._http_client()
+        async with client.stream(
+            "POST", f"{self._url}/api/generate", json=payload, timeout=300.0
+        ) as resp:
+            if resp.status_code != 200:
+                raise LlmProviderError(
+                    f"Ollama 스트리밍 응답 {resp.status_code}"
+                )
 
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            async with client.stream(
-                "POST", f"{self._url}/api/generate", json=payload
-            ) as resp:
-                if resp.status_code != 200:
-                    raise LlmProviderError(
-                        f"Ollama 스트리밍 응답 {resp.status_code}"
-                    )
-
-                async for line in resp.aiter_lines():
-                    if not line.strip():
-                        continue
-                    try:
-                        chunk = _json.loads(line)
-                    except _json.JSONDecodeError:
-                        continue
-
-                    if chunk.get("error"):
-                        raise LlmProviderError(f"Ollama 에러: {chunk['error']}")
-
-                    token = chunk.get("response", "")
-                    full_text += token
-                    tokens_out += 1
-
-                    # 1초마다 progress 콜백
-                    now = time.monotonic()
-                    if progress_callback and (now - last_report) >= 1.0:
-                        last_report = now
-                        progress_callback({
-                            "type": "progress",
-                            "elapsed_sec": round(now - t0, 1),
-                            "tokens": tokens_out,
-                            "provider": self.provider_id,
-                        })
-
-                    if chunk.get("done"):
-                        tokens_in = chunk.get("prompt_eval_count")
-                        tokens_out = chunk.get("eval_count", tokens_out)
-                        break
+            async for line in resp.aiter_lines():
+                if not line.strip():
+                    continue
+                try:
+                    chunk = _json.loads(line)
+                except _json.JSONDecodeError:
+                    continue
+
+                if chunk.get("error"):
+                    raise LlmProviderError(f"Ollama 에러: {chunk['error']}")
+
+                token = chunk.get("response", "")
+                full_text += token
+                tokens_out += 1
+
+                # 1초마다 progress 콜백
+                now = time.monotonic()
+                if progress_callback and (now - last_report) >= 1.0:
+                    last_report = now
+                    delta = full_text[reported_len:]
+                    reported_len = len(full_text)
+                    progress_callback({
+                        "type": "progress",
+                        "elapsed_sec": round(now - t0, 1),
+                        "tokens": tokens_out,
+                        "provider": self.provider_id,
+                        # 직전 보고 이후 받은 텍스트 — 호출자가 부분 결과를 미리 파싱할 때 사용
+                        "text_delta": delta,
+                    })
+
+                if chunk.get("done"):
+                    tokens_in = chunk.get("prompt_eval_count")
+                    tokens_out = chunk.get("eval_count", tokens_out)
+                    break
 
         elapsed = time.monotonic() - t0
 
@@ -238,15 +252,15 @@ class OllamaProvider(BaseLlmProvider):
             payload["system"] = system
 
         t0 = time.monotonic()
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            resp = await client.post(
-                f"{self._url}/api/generate", json=payload
+        client = self._http_client()
+        resp = await client.post(
+            f"{self._url}/api/generate", json=payload, timeout=300.0
+        )
+        if resp.status_code != 200:
+            raise LlmProviderError(
+                f"Ollama vision 응답 {resp.status_code}"
             )
-            if resp.status_code != 200:
-                raise LlmProviderError(
-                    f"Ollama vision 응답 {resp.status_code}"
-                )
-            data = resp.json()
+        data = resp.json()
         elapsed = time.monotonic() - t0
 
         return LlmResponse(
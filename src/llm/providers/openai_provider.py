@@ -80,7 +80,9 @@ class OpenAiProvider(BaseLlmProvider):
         if not api_key:
             raise LlmProviderError("OPENAI_API_KEY가 설정되지 않았습니다.")
 
-        client = openai.AsyncOpenAI(api_key=api_key)
+        client = self._shared_client(
+            ("openai", api_key), lambda: openai.AsyncOpenAI(api_key=api_key),
+        )
         selected_model = model or self.DEFAULT_MODEL
 
         messages = []
@@ -160,7 +162,9 @@ class OpenAiProvider(BaseLlmProvider):
         if not api_key:
             raise LlmProviderError("OPENAI_API_KEY가 설정되지 않았습니다.")
 
-        client = openai.AsyncOpenAI(api_key=api_key)
+        client = self._shared_client(
+            ("openai", api_key), lambda: openai.AsyncOpenAI(api_key=api_key),
+        )
         selected_model = model or self.DEFAULT_MODEL
 
         messages = []
@@ -181,6 +185,7 @@ class OpenAiProvider(BaseLlmProvider):
         full_text = ""
         tokens_out = 0
         last_report = t0
+        reported_len = 0  # text_delta로 이미 보고한 full_text 길이
         finish_reason = ""
 
         try:
@@ -205,11 +210,15 @@ class OpenAiProvider(BaseLlmProvider):
                 now = time.monotonic()
                 if progress_callback and (now - last_report) >= 1.0:
                     last_report = now
+                    delta = full_text[reported_len:]
+                    reported_len = len(full_text)
                     progress_callback({
                         "type": "progress",
                         "elapsed_sec": round(now - t0, 1),
                         "tokens": tokens_out,
                         "provider": self.provider_id,
+                        # 직전 보고 이후 받은 텍스트 — 호출자가 부분 결과를 미리 파싱할 때 사용
+                        "text_delta": delta,
                     })
 
         elapsed = time.monotonic() - t0
@@ -247,7 +256,9 @@ class OpenAiProvider(BaseLlmProvider):
         if not api_key:
             raise LlmProviderError("OPENAI_API_KEY가 설정되지 않았습니다.")
 
-        client = openai.AsyncOpenAI(api_key=api_key)
+        client = self._shared_client(
+            ("openai", api_key), lambda: openai.AsyncOpenAI(api_key=api_key),
+        )
         selected_model = model or self.DEFAULT_MODEL
 
         b64_data = base64.b64encode(image).decode("ascii")
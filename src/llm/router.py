@@ -74,6 +74,11 @@ class LlmRouter:
         # is_available() 캐시: {provider_id: (결과, 타임스탬프)}
         self._avail_cache: dict[str, tuple[bool, float]] = {}
 
+        # 전체 프로바이더 가용성 스냅샷: (타임스탬프, {provider_id: 결과})
+        # 진행 중인 갱신 태스크를 공유하여 동시 요청이 같은 체크를 중복 실행하지 않게 한다.
+        self._avail_snapshot: Optional[tuple[float, dict[str, bool]]] = None
+        self._avail_refresh_task: Optional[asyncio.Task] = None
+
     async def is_available_cached(self, provider: BaseLlmProvider) -> bool:
         """is_available() 결과를 캐싱하여 반환.
 
@@ -97,12 +102,62 @@ class LlmRouter:
         self._avail_cache[pid] = (ok, time.monotonic())
         return ok
 
+    async def aclose(self):
+        """모든 프로바이더의 재사용 HTTP 클라이언트를 닫는다.
+
+        서고 전환으로 라우터를 교체할 때 호출하여 keep-alive 연결을 정리한다.
+        """
+        for provider in self.providers:
+            try:
+                await provider.aclose()
+            except Exception as e:
+                _logger.debug(f"{provider.provider_id} 클라이언트 정리 실패 (무시): {e}")
+
+    async def cached_availability_snapshot(self, ttl: float = 10.0) -> dict[str, bool]:
+        """모든 프로바이더의 가용성을 {provider_id: bool}로 반환한다 (최대 ttl초마다 갱신).
+
+        왜 스냅샷인가:
+            자동 폴백 호출마다 프로바이더 수만큼 코루틴을 만들어 gather하면,
+            개별 캐시가 모두 유효해도 요청마다 같은 작업을 반복한다.
+            ttl 동안은 이미 계산된 dict를 그대로 돌려주고,
+            갱신이 필요하면 동시에 들어온 요청들이 하나의 갱신 태스크를 함께 기다린다.
+
+        개별 결과는 is_available_cached()의 TTL(성공 2분, 실패 30초)을 그대로 따른다.
+        invalidate_cache()를 호출하면 스냅샷도 함께 무효화된다.
+        """
+        now = time.monotonic()
+        snapshot = self._avail_snapshot
+        if snapshot is not None and now - snapshot[0] < ttl:
+            return snapshot[1]
+
+        loop = asyncio.get_running_loop()
+        task = self._avail_refresh_task
+        # 다른 이벤트 루프(별도 스레드의 asyncio.run 등)의 태스크는 기다릴 수 없다
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(self._refresh_availability_snapshot())
+            self._avail_refresh_task = task
+        return await asyncio.shield(task)
+
+    async def _refresh_availability_snapshot(self) -> dict[str, bool]:
+        """모든 프로바이더의 가용성을 병렬로 확인해 스냅샷을 갱신한다."""
+        # Python 3.10 지원을 위해 TaskGroup 대신 gather를 사용한다.
+        results = await asyncio.gather(
+            *[self.is_available_cached(p) for p in self.providers],
+            return_exceptions=True,
+        )
+        availability = {
+            p.provider_id: ok is True for p, ok in zip(self.providers, results)
+        }
+        self._avail_snapshot = (time.monotonic(), availability)
+        return availability
+
     def invalidate_cache(self, provider_id: Optional[str] = None):
         """가용성 캐시를 무효화한다. 설정 변경 시 호출."""
         if provider_id:
             self._avail_cache.pop(provider_id, None)
         else:
             self._avail_cache.clear()
+        self._avail_snapshot = None
 
     def _get_provider(self, provider_id: str) -> Optional[BaseLlmProvider]:
         """provider_id로 provider 객체를 찾는다."""
@@ -157,15 +212,12 @@ class LlmRouter:
         # 1단계: 모든 프로바이더의 가용성을 병렬로 사전 체크 (캐시 활용).
         #   Base44(5s) + Ollama(3s) 순차 체크 → 최대 8초 낭비
         #   병렬 체크 + 캐시 → 첫 호출 max(5,3)=5초, 이후 ~0초
-        avail_results = await asyncio.gather(
-            *[self.is_available_cached(p) for p in self.providers],
-            return_exceptions=True,
-        )
+        availability = await self.cached_availability_snapshot()
 
         # 2단계: 사용 가능한 프로바이더만 우선순위대로 호출
         errors = []
-        for provider, ok in zip(self.providers, avail_results):
-            if ok is not True:
+        for provider in self.providers:
+            if not availability.get(provider.provider_id):
                 continue
             try:
                 response = await provider.call(
@@ -177,7 +229,7 @@ class LlmRouter:
 
             except Exception as e:
                 # 호출 실패 시 캐시 무효화 (다음에 재체크)
-                self._avail_cache.pop(provider.provider_id, None)
+                self.invalidate_cache(provider.provider_id)
                 errors.append(f"{provider.provider_id}: {e}")
                 continue
 
@@ -231,14 +283,11 @@ class LlmRouter:
             return response
 
         # ── 자동 폴백 모드 ──
-        avail_results = await asyncio.gather(
-            *[self.is_available_cached(p) for p in self.providers],
-            return_exceptions=True,
-        )
+        availability = await self.cached_availability_snapshot()
 
         errors = []
-        for provider, ok in zip(self.providers, avail_results):
-            if ok is not True:
+        for provider in self.providers:
+            if not availability.get(provider.provider_id):
                 continue
             try:
                 response = await provider.call_stream(
@@ -250,7 +299,7 @@ class LlmRouter:
                 return response
 
             except Exception as e:
-                self._avail_cache.pop(provider.provider_id, None)
+                self.invalidate_cache(provider.provider_id)
                 errors.append(f"{provider.provider_id}: {e}")
                 continue
 
@@ -299,14 +348,11 @@ class LlmRouter:
 
         # 비전 지원 프로바이더의 가용성을 병렬 체크
         vision_providers = [p for p in self.providers if p.supports_image]
-        avail_results = await asyncio.gather(
-            *[self.is_available_cached(p) for p in vision_providers],
-            return_exceptions=True,
-        )
+        availability = await self.cached_availability_snapshot()
 
         errors = []
-        for provider, ok in zip(vision_providers, avail_results):
-            if ok is not True:
+        for provider in vision_providers:
+            if not availability.get(provider.provider_id):
                 continue
             try:
                 response = await provider.call_with_image(
@@ -315,7 +361,7 @@ class LlmRouter:
                 self.usage_tracker.log(response, purpose=purpose)
                 return response
             except Exception as e:
-                self._avail_cache.pop(provider.provider_id, None)
+                self.invalidate_cache(provider.provider_id)
                 errors.append(f"{provider.provider_id}: {e}")
                 continue
 
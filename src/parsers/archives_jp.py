@@ -24,16 +24,16 @@ platform-v7.md §7.2.3 기반:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-import httpx
 from lxml import html as lxml_html
 
-from parsers.base import BaseFetcher, BaseMapper, register_parser
+from parsers.base import BaseFetcher, BaseMapper, get_http_client, register_parser
 
 logger = logging.getLogger(__name__)
 
@@ -85,12 +85,14 @@ class ArchivesJpFetcher(BaseFetcher):
             "IS_TYPE": "meta",
         }
 
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            response = await client.get(
-                f"{_ARCHIVES_BASE}/DAS/meta/result",
-                params=params,
-            )
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.get(
+            f"{_ARCHIVES_BASE}/DAS/meta/result",
+            params=params,
+            timeout=30.0,
+            follow_redirects=True,
+        )
+        response.raise_for_status()
 
         return _parse_search_results(response.text)
 
@@ -120,9 +122,9 @@ class ArchivesJpFetcher(BaseFetcher):
         """
         url = item_id if item_id.startswith("http") else f"{_ARCHIVES_BASE}{item_id}"
 
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            response = await client.get(url)
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.get(url, timeout=30.0, follow_redirects=True)
+        response.raise_for_status()
 
         return _parse_detail_page(response.text, url)
 
@@ -154,39 +156,39 @@ class ArchivesJpFetcher(BaseFetcher):
             f"{_ARCHIVES_BASE}/DAS/meta/listPhoto"
             f"?LANG=default&BID={bid}&ID=&TYPE=dljpeg"
         )
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            resp = await client.get(list_url)
-            resp.raise_for_status()
+        client = get_http_client()
+        resp = await client.get(list_url, timeout=30.0, follow_redirects=True)
+        resp.raise_for_status()
 
         entries = _parse_list_photo_page(resp.text, bid)
 
         # 각 MID의 페이지 수 조회
         assets = []
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for entry in entries:
-                mid = entry["mid"]
-                try:
-                    size_resp = await client.get(
-                        f"{_ARCHIVES_BASE}/acv/auto_conversion/sizeget"
-                        f"?mid={mid}&dltype=jpeg"
-                    )
-                    size_data = size_resp.json()
-                    ic = size_data.get("imageContents", {})
-                    page_count = ic.get("pageNum", 0)
-                    file_size = ic.get("fileSize", 0)
-                except Exception as e:
-                    logger.warning("sizeget 조회 실패 (%s): %s", mid, e)
-                    page_count = 0
-                    file_size = 0
-
-                assets.append({
-                    "id": mid,           # GUI 표준 키
-                    "asset_id": mid,     # 내부 호환용 (download_asset에서 사용)
-                    "label": entry["label"],
-                    "page_count": page_count,
-                    "file_size": file_size,
-                    "download_type": "jpeg_pages",
-                })
+        for entry in entries:
+            mid = entry["mid"]
+            try:
+                size_resp = await client.get(
+                    f"{_ARCHIVES_BASE}/acv/auto_conversion/sizeget"
+                    f"?mid={mid}&dltype=jpeg",
+                    timeout=30.0,
+                )
+                size_data = size_resp.json()
+                ic = size_data.get("imageContents", {})
+                page_count = ic.get("pageNum", 0)
+                file_size = ic.get("fileSize", 0)
+            except Exception as e:
+                logger.warning("sizeget 조회 실패 (%s): %s", mid, e)
+                page_count = 0
+                file_size = 0
+
+            assets.append({
+                "id": mid,           # GUI 표준 키
+                "asset_id": mid,     # 내부 호환용 (download_asset에서 사용)
+                "label": entry["label"],
+                "page_count": page_count,
+                "file_size": file_size,
+                "download_type": "jpeg_pages",
+            })
 
         return assets
 
@@ -208,21 +210,20 @@ class ArchivesJpFetcher(BaseFetcher):
             PDF는 페이지 단위 관리가 자연스럽다.
             fpdf2는 프로젝트 의존성에 포함되어 있다.
         """
-        from fpdf import FPDF
-
         mid = asset_info["asset_id"]
         label = asset_info.get("label", mid)
         page_count = asset_info.get("page_count", 0)
 
         # 페이지 수 모르면 재조회
         if not page_count:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                size_resp = await client.get(
-                    f"{_ARCHIVES_BASE}/acv/auto_conversion/sizeget"
-                    f"?mid={mid}&dltype=jpeg"
-                )
-                ic = size_resp.json().get("imageContents", {})
-                page_count = ic.get("pageNum", 0)
+            client = get_http_client()
+            size_resp = await client.get(
+                f"{_ARCHIVES_BASE}/acv/auto_conversion/sizeget"
+                f"?mid={mid}&dltype=jpeg",
+                timeout=30.0,
+            )
+            ic = size_resp.json().get("imageContents", {})
+            page_count = ic.get("pageNum", 0)
 
         if not page_count or page_count < 1:
             raise ValueError(f"페이지 수를 알 수 없습니다: {mid}")
@@ -231,39 +232,26 @@ class ArchivesJpFetcher(BaseFetcher):
 
         # 개별 JPEG 다운로드
         jpeg_paths: list[Path] = []
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            for page_num in range(1, page_count + 1):
-                jpeg_url = (
-                    f"{_ARCHIVES_BASE}/acv/auto_conversion/conv/jp2jpeg"
-                    f"?ID={mid}&p={page_num}"
-                )
-                resp = await client.get(jpeg_url)
-                resp.raise_for_status()
-
-                jpeg_path = dest_dir / f"{mid}_p{page_num:04d}.jpg"
-                jpeg_path.write_bytes(resp.content)
-                jpeg_paths.append(jpeg_path)
-
-                if progress_callback:
-                    progress_callback(page_num, page_count)
-
-        # JPEG → PDF 변환 (fpdf2)
-        pdf = FPDF(unit="pt")
-        for jpeg_path in jpeg_paths:
-            # 이미지 크기를 PDF 페이지 크기로 설정 (72dpi 기준)
-            from PIL import Image
-
-            with Image.open(jpeg_path) as img:
-                w_px, h_px = img.size
-            # 150dpi 기준으로 변환 (고서 스캔 해상도)
-            w_pt = w_px * 72 / 150
-            h_pt = h_px * 72 / 150
-            pdf.add_page(format=(w_pt, h_pt))
-            pdf.image(str(jpeg_path), x=0, y=0, w=w_pt, h=h_pt)
+        client = get_http_client()
+        for page_num in range(1, page_count + 1):
+            jpeg_url = (
+                f"{_ARCHIVES_BASE}/acv/auto_conversion/conv/jp2jpeg"
+                f"?ID={mid}&p={page_num}"
+            )
+            resp = await client.get(jpeg_url, timeout=60.0)
+            resp.raise_for_status()
+
+            jpeg_path = dest_dir / f"{mid}_p{page_num:04d}.jpg"
+            jpeg_path.write_bytes(resp.content)
+            jpeg_paths.append(jpeg_path)
 
+            if progress_callback:
+                progress_callback(page_num, page_count)
+
+        # JPEG → PDF 변환 (fpdf2) — 동기 작업이므로 이벤트 루프 밖에서 돌린다
         safe_label = _sanitize_filename(label)
         pdf_path = dest_dir / f"{safe_label}.pdf"
-        pdf.output(str(pdf_path))
+        await asyncio.to_thread(_jpegs_to_pdf, jpeg_paths, pdf_path)
 
         logger.info(
             "PDF 생성 완료: %s (%d페이지, %.1fMB)",
@@ -779,6 +767,28 @@ def _parse_list_photo_page(
     return entries
 
 
+def _jpegs_to_pdf(jpeg_paths: list[Path], pdf_path: Path) -> None:
+    """JPEG 파일들을 한 페이지씩 이어 붙인 PDF로 저장한다.
+
+    왜 별도 동기 함수인가:
+        수십~수백 장을 열어 PDF로 쓰는 작업은 수 초가 걸린다.
+        download_asset(async)에서 asyncio.to_thread로 불러 그동안 다른 요청을 막지 않는다.
+    """
+    from fpdf import FPDF
+    from PIL import Image
+
+    pdf = FPDF(unit="pt")
+    for jpeg_path in jpeg_paths:
+        with Image.open(jpeg_path) as img:
+            w_px, h_px = img.size
+        # 150dpi 기준으로 변환 (고서 스캔 해상도)
+        w_pt = w_px * 72 / 150
+        h_pt = h_px * 72 / 150
+        pdf.add_page(format=(w_pt, h_pt))
+        pdf.image(str(jpeg_path), x=0, y=0, w=w_pt, h=h_pt)
+    pdf.output(str(pdf_path))
+
+
 def _sanitize_filename(name: str) -> str:
     """파일명으로 안전한 문자열을 만든다.
 
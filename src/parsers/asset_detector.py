@@ -19,6 +19,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
 import re
@@ -28,6 +29,8 @@ from urllib.parse import urljoin, urlparse, unquote
 
 import httpx
 
+from parsers.base import get_http_client
+
 logger = logging.getLogger(__name__)
 
 # ── 상수 ──────────────────────────────────────────
@@ -90,19 +93,20 @@ async def detect_direct_download(url: str) -> dict[str, Any] | None:
     if not is_pdf_ext and not is_image_ext:
         # 확장자가 없으면 HEAD 요청으로 Content-Type 확인
         try:
-            async with httpx.AsyncClient(
+            client = get_http_client()
+            resp = await client.head(
+                url,
                 timeout=_HTTP_TIMEOUT,
                 headers=_HTTP_HEADERS,
                 follow_redirects=True,
-            ) as client:
-                resp = await client.head(url)
-                content_type = resp.headers.get("content-type", "").lower()
-                if "application/pdf" in content_type:
-                    is_pdf_ext = True
-                elif any(t in content_type for t in ("image/jpeg", "image/png", "image/tiff")):
-                    is_image_ext = True
-                else:
-                    return None
+            )
+            content_type = resp.headers.get("content-type", "").lower()
+            if "application/pdf" in content_type:
+                is_pdf_ext = True
+            elif any(t in content_type for t in ("image/jpeg", "image/png", "image/tiff")):
+                is_image_ext = True
+            else:
+                return None
         except Exception as e:
             logger.debug(f"HEAD 요청 실패 (에셋 감지 건너뜀): {url} — {e}")
             return None
@@ -110,15 +114,16 @@ async def detect_direct_download(url: str) -> dict[str, Any] | None:
     # 2. 파일 크기 가져오기 (가능하면)
     file_size = None
     try:
-        async with httpx.AsyncClient(
+        client = get_http_client()
+        resp = await client.head(
+            url,
             timeout=_HTTP_TIMEOUT,
             headers=_HTTP_HEADERS,
             follow_redirects=True,
-        ) as client:
-            resp = await client.head(url)
-            cl = resp.headers.get("content-length")
-            if cl:
-                file_size = int(cl)
+        )
+        cl = resp.headers.get("content-length")
+        if cl:
+            file_size = int(cl)
     except Exception:
         pass
 
@@ -313,23 +318,25 @@ async def _download_single_file(
 
     logger.info(f"다운로드 시작: {url} → {file_path.name}")
 
-    async with httpx.AsyncClient(
+    client = get_http_client()
+    # 스트리밍 다운로드 (대용량 PDF 대응)
+    async with client.stream(
+        "GET",
+        url,
         timeout=httpx.Timeout(120.0, connect=15.0),
         headers=_HTTP_HEADERS,
         follow_redirects=True,
-    ) as client:
-        # 스트리밍 다운로드 (대용량 PDF 대응)
-        async with client.stream("GET", url) as resp:
-            resp.raise_for_status()
-            total_size = int(resp.headers.get("content-length", 0))
-            downloaded = 0
-
-            with open(file_path, "wb") as f:
-                async for chunk in resp.aiter_bytes(chunk_size=65536):
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if progress_callback and total_size > 0:
-                        progress_callback(downloaded, total_size)
+    ) as resp:
+        resp.raise_for_status()
+        total_size = int(resp.headers.get("content-length", 0))
+        downloaded = 0
+
+        with open(file_path, "wb") as f:
+            async for chunk in resp.aiter_bytes(chunk_size=65536):
+                f.write(chunk)
+                downloaded += len(chunk)
+                if progress_callback and total_size > 0:
+                    progress_callback(downloaded, total_size)
 
     logger.info(
         "다운로드 완료: %s (%.1fMB)",
@@ -358,9 +365,6 @@ async def _download_image_bundle(
         3. 단일 PDF로 출력
         (archives_jp.py의 JPEG→PDF 변환 패턴과 동일)
     """
-    from fpdf import FPDF
-    from PIL import Image
-
     urls: list[str] = asset_info.get("download_urls", [])
     label = asset_info.get("label", "images")
     total = len(urls)
@@ -371,44 +375,29 @@ async def _download_image_bundle(
     # 1. 이미지 다운로드
     image_paths: list[Path] = []
 
-    async with httpx.AsyncClient(
-        timeout=httpx.Timeout(60.0, connect=15.0),
-        headers=_HTTP_HEADERS,
-        follow_redirects=True,
-    ) as client:
-        for i, img_url in enumerate(urls):
-            ext = _get_file_extension(urlparse(img_url).path.lower()) or ".jpg"
-            img_path = dest_dir / f"_bundle_{i:04d}{ext}"
+    client = get_http_client()
+    for i, img_url in enumerate(urls):
+        ext = _get_file_extension(urlparse(img_url).path.lower()) or ".jpg"
+        img_path = dest_dir / f"_bundle_{i:04d}{ext}"
 
-            resp = await client.get(img_url)
-            resp.raise_for_status()
-            img_path.write_bytes(resp.content)
-            image_paths.append(img_path)
+        resp = await client.get(
+            img_url,
+            timeout=httpx.Timeout(60.0, connect=15.0),
+            headers=_HTTP_HEADERS,
+            follow_redirects=True,
+        )
+        resp.raise_for_status()
+        img_path.write_bytes(resp.content)
+        image_paths.append(img_path)
 
-            if progress_callback:
-                progress_callback(i + 1, total)
+        if progress_callback:
+            progress_callback(i + 1, total)
 
     # 2. 이미지 → PDF 변환 (archives_jp.py 패턴 재사용)
-    pdf = FPDF(unit="pt")
-    for img_path in image_paths:
-        with Image.open(img_path) as img:
-            # RGBA/L/P → RGB 변환 (fpdf2 호환)
-            if img.mode != "RGB":
-                img = img.convert("RGB")
-                rgb_path = img_path.with_suffix(".conv.jpg")
-                img.save(str(rgb_path), "JPEG", quality=95)
-                img_path = rgb_path
-            w_px, h_px = img.size
-
-        # 150dpi 기준으로 변환 (고서 스캔 해상도)
-        w_pt = w_px * 72 / 150
-        h_pt = h_px * 72 / 150
-        pdf.add_page(format=(w_pt, h_pt))
-        pdf.image(str(img_path), x=0, y=0, w=w_pt, h=h_pt)
-
+    # 디코딩·RGB 변환·PDF 쓰기는 동기 작업이므로 이벤트 루프 밖에서 돌린다.
     safe_name = _sanitize_filename(label)
     pdf_path = dest_dir / f"{safe_name}.pdf"
-    pdf.output(str(pdf_path))
+    await asyncio.to_thread(_images_to_pdf, image_paths, pdf_path)
 
     logger.info(
         "이미지 번들 PDF 생성 완료: %s (%d페이지, %.1fMB)",
@@ -484,6 +473,33 @@ def _url_to_asset_id(url: str) -> str:
     return hashlib.md5(url.encode()).hexdigest()[:12]
 
 
+def _images_to_pdf(image_paths: list[Path], pdf_path: Path) -> None:
+    """이미지 파일들을 한 페이지씩 이어 붙인 PDF로 저장한다 (동기).
+
+    RGB가 아닌 이미지는 fpdf2가 다루도록 RGB JPEG로 변환한 사본을 쓴다.
+    """
+    from fpdf import FPDF
+    from PIL import Image
+
+    pdf = FPDF(unit="pt")
+    for img_path in image_paths:
+        with Image.open(img_path) as img:
+            # RGBA/L/P → RGB 변환 (fpdf2 호환)
+            if img.mode != "RGB":
+                img = img.convert("RGB")
+                rgb_path = img_path.with_suffix(".conv.jpg")
+                img.save(str(rgb_path), "JPEG", quality=95)
+                img_path = rgb_path
+            w_px, h_px = img.size
+
+        # 150dpi 기준으로 변환 (고서 스캔 해상도)
+        w_pt = w_px * 72 / 150
+        h_pt = h_px * 72 / 150
+        pdf.add_page(format=(w_pt, h_pt))
+        pdf.image(str(img_path), x=0, y=0, w=w_pt, h=h_pt)
+    pdf.output(str(pdf_path))
+
+
 def _sanitize_filename(name: str) -> str:
     """파일명에 사용할 수 없는 문자를 제거한다.
 
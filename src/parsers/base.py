@@ -14,14 +14,19 @@ platform-v7.md §7.3 아키텍처:
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import re
+import weakref
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import httpx
+
 
 class BaseFetcher(ABC):
     """소스에서 원본 메타데이터를 추출하는 추상 클래스.
@@ -191,6 +196,52 @@ class BaseMapper(ABC):
         }
 
 
+# --- 공용 HTTP 클라이언트 ---
+
+
+# 이벤트 루프별 재사용 클라이언트. {이벤트 루프: httpx.AsyncClient}
+# 왜 루프별인가: httpx 비동기 클라이언트의 커넥션 풀은 생성된 이벤트 루프에 묶인다.
+# (llm.providers.base.BaseLlmProvider._shared_client와 같은 방식)
+_HTTP_CLIENTS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """파서들이 함께 쓰는 httpx 클라이언트를 반환한다 (현재 이벤트 루프 기준).
+
+    왜 재사용하는가:
+        preview-from-url → create-from-url 흐름은 같은 호스트에 요청을 여러 번 보낸다
+        (상세 페이지, 에셋 목록, 페이지 수 조회, 이미지 수십 장).
+        요청마다 클라이언트를 새로 만들면 매번 TCP·TLS 연결과 DNS 조회를 다시 한다.
+        공유 클라이언트의 keep-alive 풀이 이 연결을 재사용한다.
+
+    사용법:
+        타임아웃·리다이렉트·헤더는 클라이언트가 아니라 요청마다 지정한다.
+        클라이언트는 닫지 않는다 (서버 종료 시 aclose_http_clients()가 정리).
+
+        client = get_http_client()
+        resp = await client.get(url, timeout=30.0, follow_redirects=True)
+    """
+    loop = asyncio.get_running_loop()
+    client = _HTTP_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        _HTTP_CLIENTS[loop] = client
+    return client
+
+
+async def aclose_http_clients() -> None:
+    """현재 이벤트 루프의 공용 클라이언트를 닫는다 (keep-alive 연결 정리)."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    client = _HTTP_CLIENTS.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
 # --- 파서 레지스트리 ---
 
 
@@ -376,11 +427,17 @@ def get_supported_sources() -> list[dict[str, str]]:
     ]
 
 
+@functools.lru_cache(maxsize=1)
 def get_registry_json() -> dict:
     """parsers/registry.json을 읽어 반환한다.
 
     왜 이렇게 하는가:
         GUI에서 파서 목록과 메타정보(국가, 접근방법 등)를 표시하기 위해 사용.
+
+    왜 캐시하는가:
+        registry.json은 패키지와 함께 배포되는 정적 파일이라 프로세스 동안 바뀌지 않는다.
+        GET /api/parsers마다 디스크에서 다시 읽고 파싱할 필요가 없다.
+        반환값은 공유 객체이므로 호출자가 수정하지 않는다.
     """
     registry_path = Path(__file__).parent / "registry.json"
     if registry_path.exists():
@@ -36,9 +36,7 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import quote, urlparse
 
-import httpx
-
-from parsers.base import BaseMapper, BaseFetcher, register_parser
+from parsers.base import BaseMapper, BaseFetcher, get_http_client, register_parser
 
 logger = logging.getLogger(__name__)
 
@@ -469,9 +467,9 @@ class GenericLlmFetcher(BaseFetcher):
         encoded_url = quote(url, safe="")
         api_url = f"{_MARKDOWNER_API}?url={encoded_url}"
 
-        async with httpx.AsyncClient(timeout=_MARKDOWNER_TIMEOUT) as client:
-            response = await client.get(api_url)
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.get(api_url, timeout=_MARKDOWNER_TIMEOUT)
+        response.raise_for_status()
 
         markdown = response.text.strip()
 
@@ -495,9 +493,9 @@ class GenericLlmFetcher(BaseFetcher):
         """
         api_url = f"{_JINA_READER_API}{url}"
 
-        async with httpx.AsyncClient(timeout=_MARKDOWNER_TIMEOUT) as client:
-            response = await client.get(api_url)
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.get(api_url, timeout=_MARKDOWNER_TIMEOUT)
+        response.raise_for_status()
 
         markdown = response.text.strip()
 
@@ -521,7 +519,9 @@ class GenericLlmFetcher(BaseFetcher):
         import re as _re
 
         try:
-            async with httpx.AsyncClient(
+            client = get_http_client()
+            response = await client.get(
+                url,
                 timeout=30.0,
                 follow_redirects=True,
                 headers={
@@ -530,9 +530,8 @@ class GenericLlmFetcher(BaseFetcher):
                         "+https://github.com/hw725/classical-text-browser)"
                     ),
                 },
-            ) as client:
-                response = await client.get(url)
-                response.raise_for_status()
+            )
+            response.raise_for_status()
 
             html = response.text
 
@@ -35,7 +35,7 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-import httpx
+from parsers.base import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -51,10 +51,10 @@ async def fetch_iiif_manifest(manifest_url: str) -> dict[str, Any]:
     출력: manifest JSON dict.
     에러: httpx.HTTPStatusError — 네트워크 오류 시.
     """
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(manifest_url)
-        response.raise_for_status()
-        return response.json()
+    client = get_http_client()
+    response = await client.get(manifest_url, timeout=30.0)
+    response.raise_for_status()
+    return response.json()
 
 
 # ──────────────────────────────────────
@@ -299,31 +299,31 @@ async def download_iiif_images_as_pdf(
 
     # 개별 이미지 다운로드
     jpeg_paths: list[Path] = []
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        for i, canvas in enumerate(canvases):
-            image_url = canvas["image_url"]
-
-            # 이미지 크기 조정
-            if max_dimension is not None:
-                image_url = _resize_iiif_url(image_url, max_dimension)
-
-            try:
-                resp = await client.get(image_url)
-                resp.raise_for_status()
-
-                jpeg_path = dest_dir / f"iiif_p{i + 1:04d}.jpg"
-                jpeg_path.write_bytes(resp.content)
-                jpeg_paths.append(jpeg_path)
-            except Exception as e:
-                logger.warning("IIIF 이미지 다운로드 실패 (p.%d/%d): %s", i + 1, total, e)
-                # 개별 페이지 실패 → 건너뛰기, 전체 중단하지 않음
-
-            if progress_callback:
-                progress_callback(i + 1, total)
-
-            # 속도 제한 방지: 페이지 간 0.1초 대기
-            if i < total - 1:
-                await asyncio.sleep(0.1)
+    client = get_http_client()
+    for i, canvas in enumerate(canvases):
+        image_url = canvas["image_url"]
+
+        # 이미지 크기 조정
+        if max_dimension is not None:
+            image_url = _resize_iiif_url(image_url, max_dimension)
+
+        try:
+            resp = await client.get(image_url, timeout=60.0)
+            resp.raise_for_status()
+
+            jpeg_path = dest_dir / f"iiif_p{i + 1:04d}.jpg"
+            jpeg_path.write_bytes(resp.content)
+            jpeg_paths.append(jpeg_path)
+        except Exception as e:
+            logger.warning("IIIF 이미지 다운로드 실패 (p.%d/%d): %s", i + 1, total, e)
+            # 개별 페이지 실패 → 건너뛰기, 전체 중단하지 않음
+
+        if progress_callback:
+            progress_callback(i + 1, total)
+
+        # 속도 제한 방지: 페이지 간 0.1초 대기
+        if i < total - 1:
+            await asyncio.sleep(0.1)
 
     if not jpeg_paths:
         raise ValueError(
@@ -27,10 +27,9 @@ import re
 import xml.etree.ElementTree as ET
 from typing import Any
 
-import httpx
 from lxml import html as lxml_html
 
-from parsers.base import BaseFetcher, BaseMapper, register_parser
+from parsers.base import BaseFetcher, BaseMapper, get_http_client, register_parser
 
 # KORCIS 베이스 URL
 _KORCIS_BASE = "https://www.nl.go.kr"
@@ -81,9 +80,11 @@ class KorcisFetcher(BaseFetcher):
             "searchKeyword": query,
         }
 
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            response = await client.post(_SEARCH_URL, data=data)
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.post(
+            _SEARCH_URL, data=data, timeout=30.0, follow_redirects=True,
+        )
+        response.raise_for_status()
 
         return _parse_search_results(response.text)
 
@@ -106,9 +107,11 @@ class KorcisFetcher(BaseFetcher):
             "marcTarget": "BIB",
         }
 
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            response = await client.get(_MARC_URL, params=params)
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.get(
+            _MARC_URL, params=params, timeout=30.0, follow_redirects=True,
+        )
+        response.raise_for_status()
 
         marc_data = _parse_marc_html(response.text)
         marc_data["vdkvgwkey"] = item_id
@@ -898,9 +901,9 @@ async def openapi_search(
         params["key"] = api_key
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(_OPENAPI_SEARCH_URL, params=params)
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.get(_OPENAPI_SEARCH_URL, params=params, timeout=30.0)
+        response.raise_for_status()
 
         return _parse_openapi_search_xml(response.content)
 
@@ -937,9 +940,9 @@ async def openapi_detail(
         params["key"] = api_key
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(_OPENAPI_DETAIL_URL, params=params)
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.get(_OPENAPI_DETAIL_URL, params=params, timeout=30.0)
+        response.raise_for_status()
 
         return _parse_openapi_detail_xml(response.content)
 
@@ -29,9 +29,7 @@ from pathlib import Path
 from typing import Any
 from xml.etree import ElementTree as ET
 
-import httpx
-
-from parsers.base import BaseFetcher, BaseMapper, register_parser
+from parsers.base import BaseFetcher, BaseMapper, get_http_client, register_parser
 
 logger = logging.getLogger(__name__)
 
@@ -89,9 +87,9 @@ class NdlFetcher(BaseFetcher):
         if mediatype is not None:
             params["mediatype"] = mediatype
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(_NDL_OPENSEARCH_URL, params=params)
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.get(_NDL_OPENSEARCH_URL, params=params, timeout=30.0)
+        response.raise_for_status()
 
         # XML 파싱
         # NDL OpenSearch는 RSS 2.0 형식: <rss><channel><item>...</item></channel></rss>
@@ -192,9 +190,9 @@ class NdlFetcher(BaseFetcher):
         """
         params = {"any": item_id, "cnt": 1}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(_NDL_OPENSEARCH_URL, params=params)
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.get(_NDL_OPENSEARCH_URL, params=params, timeout=30.0)
+        response.raise_for_status()
 
         root = ET.fromstring(response.content)
         items = root.findall(".//item")
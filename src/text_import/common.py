@@ -16,8 +16,21 @@ import unicodedata
 from collections import Counter, defaultdict
 from pathlib import Path
 
+import regex
+
 logger = logging.getLogger(__name__)
 
+# 문자 유형 판별 패턴 — 모듈 로드 시 한 번만 컴파일한다.
+# 왜 미리 컴파일하는가:
+#   regex.findall(r"...", s)처럼 문자열 패턴을 넘기면 호출마다 regex 모듈의
+#   패턴 캐시 조회(플래그 정규화 포함)를 거친다. 줄·글자 단위로 수만 번 부르는
+#   separate_by_script / align_text_to_pages에서는 이 조회가 실제 매칭보다 비쌌다.
+_HAN_RE = regex.compile(r"\p{Han}")
+_HAN_RUN_RE = regex.compile(r"\p{Han}+")
+_HANGUL_RUN_RE = regex.compile(r"\p{Hangul}+")
+# 줄 번호·괄호 번호 등 접두사 (예: "1. ", "3) ", "】")
+_LINE_PREFIX_RE = regex.compile(r"^[\s\d\.\)\]\】\》\>\-\–\—]+")
+
 
 def save_text_to_l4(
     doc_path: Path,
@@ -199,8 +212,6 @@ def separate_by_script(text: str, han_threshold: float = 0.8) -> dict:
             }
         }
     """
-    import regex
-
     lines = text.split("\n")
     original_parts: list[str] = []
     translation_parts: list[str] = []
@@ -224,13 +235,13 @@ def separate_by_script(text: str, han_threshold: float = 0.8) -> dict:
 
         # 줄 번호·괄호 번호 등 접두사 제거 후 분석
         # 예: "1. 昔有善牧者" → "昔有善牧者" 부분만 분석
-        content_for_analysis = regex.sub(
-            r"^[\s\d\.\)\]\】\》\>\-\–\—]+", "", stripped
-        )
+        content_for_analysis = _LINE_PREFIX_RE.sub("", stripped)
 
         # 유니코드 카테고리별 문자 수 계산
-        han_count = len(regex.findall(r"\p{Han}", content_for_analysis))
-        hangul_count = len(regex.findall(r"\p{Hangul}", content_for_analysis))
+        # 글자마다 매치 객체를 만들지 않도록 연속 구간(run) 단위로 찾아 길이를 더한다.
+        # 한문 줄은 한자가 통째로 한 구간이라 매치가 줄당 몇 개로 줄어든다.
+        han_count = sum(map(len, _HAN_RUN_RE.findall(content_for_analysis)))
+        hangul_count = sum(map(len, _HANGUL_RUN_RE.findall(content_for_analysis)))
 
         if han_count == 0 and hangul_count == 0:
             # 순수 숫자/기호/라틴 → 직전 분류 따르기
@@ -534,8 +545,6 @@ def align_text_to_pages(
             anchor: str,            # 사용된 대표 앵커 문자열
         }]
     """
-    import regex
-
     # ── 0단계: NFC 정규화 ──
     imported_text = _nfc(imported_text)
 
@@ -543,10 +552,10 @@ def align_text_to_pages(
     # han_to_pos[i] = imported_text에서 i번째 한자의 실제 위치
     han_chars: list[str] = []
     han_to_pos: list[int] = []
-    for i, ch in enumerate(imported_text):
-        if regex.match(r"\p{Han}", ch):
-            han_chars.append(ch)
-            han_to_pos.append(i)
+    # 글자마다 regex.match를 부르지 않고 한 번의 스캔으로 한자 위치를 모은다.
+    for m in _HAN_RE.finditer(imported_text):
+        han_chars.append(m.group())
+        han_to_pos.append(m.start())
     han_string = "".join(han_chars)
 
     if not han_string:
@@ -570,7 +579,7 @@ def align_text_to_pages(
 
     for page in page_texts:
         page_text = _nfc(page.get("text", ""))
-        page_han = "".join(regex.findall(r"\p{Han}", page_text))
+        page_han = "".join(_HAN_RE.findall(page_text))
         anchors = _extract_multi_anchors(page_han, anchor_length)
         ocr_preview = page_text.strip()[:80]
 
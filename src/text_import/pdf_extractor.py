@@ -51,6 +51,28 @@ class PdfTextExtractor:
                 f"→ 원인: {e}"
             ) from e
 
+    @classmethod
+    def from_bytes(cls, data: bytes, name: str = "<upload>") -> "PdfTextExtractor":
+        """메모리에 있는 PDF bytes로 추출기를 만든다.
+
+        입력: data — PDF 파일 내용, name — 오류 메시지에 쓸 이름
+        에러: ValueError — PDF를 열 수 없을 때
+
+        왜 필요한가: 작은 업로드는 임시 파일에 쓰고 다시 읽을 필요 없이 바로 연다.
+        """
+        import fitz  # PyMuPDF
+
+        self = cls.__new__(cls)
+        self._path = Path(name)
+        try:
+            self._doc = fitz.open(stream=data, filetype="pdf")
+        except Exception as e:
+            raise ValueError(
+                f"PDF 파일을 열 수 없습니다: {name}\n"
+                f"→ 원인: {e}"
+            ) from e
+        return self
+
     @property
     def page_count(self) -> int:
         """PDF 전체 페이지 수."""
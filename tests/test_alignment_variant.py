@@ -1,6 +1,7 @@
 """이체자 사전 테스트."""
 
 import json
+import os
 
 import pytest
 
@@ -75,3 +76,56 @@ class TestVariantCharDict:
         d = variant_dict.to_dict()
         assert "裴" in d
         assert "裵" in d["裴"]
+
+    def test_append_log_replayed_on_load(self, tmp_path, variant_dict):
+        path = str(tmp_path / "variant_chars.json")
+        variant_dict.add_pair("齒", "歯")
+        variant_dict.append_log(path)
+        assert (tmp_path / "variant_chars.json.log").exists()
+
+        reloaded = VariantCharDict(path)
+        assert reloaded.is_variant("齒", "歯") is True
+        assert reloaded.is_variant("說", "説") is True
+
+    def test_save_clears_log(self, tmp_path, variant_dict):
+        path = str(tmp_path / "variant_chars.json")
+        variant_dict.add_pair("齒", "歯")
+        variant_dict.append_log(path)
+        variant_dict.remove_pair("說", "説")
+        assert variant_dict.needs_full_save is True
+        with pytest.raises(ValueError):
+            variant_dict.append_log(path)
+
+        variant_dict.save(path)
+        assert not (tmp_path / "variant_chars.json.log").exists()
+        reloaded = VariantCharDict(path)
+        assert reloaded.is_variant("齒", "歯") is True
+        assert reloaded.is_variant("說", "説") is False
+
+    def test_pair_added_during_append_log_is_kept(self, tmp_path, variant_dict, monkeypatch):
+        """로그를 쓰는 도중(다른 스레드에서) 추가된 쌍은 지워지지 않고 다음 저장에 실린다."""
+        path = str(tmp_path / "variant_chars.json")
+        variant_dict.save(path)
+        variant_dict.add_pair("齒", "歯")
+
+        real_fsync = os.fsync
+
+        def fsync_then_add(fd):
+            real_fsync(fd)
+            variant_dict.add_pair("國", "国")
+
+        monkeypatch.setattr(os, "fsync", fsync_then_add)
+        variant_dict.append_log(path)
+        monkeypatch.setattr(os, "fsync", real_fsync)
+
+        variant_dict.append_log(path)
+        reloaded = VariantCharDict(path)
+        assert reloaded.is_variant("齒", "歯") is True
+        assert reloaded.is_variant("國", "国") is True
+
+    def test_iter_csv_rows_survives_concurrent_add(self, variant_dict):
+        """내보내기 도중 쌍이 추가되어도 순회가 깨지지 않는다 (시작 시점 스냅샷)."""
+        rows = variant_dict.iter_csv_rows()
+        first = next(rows)
+        variant_dict.add_pair("說", "说")
+        assert [first, *rows] == ["経,經", "裴,裵", "說,説"]
@@ -114,6 +114,7 @@ class TestAnnotationSchema:
 
 from src.core.annotation import (
     add_annotation,
+    add_annotations,
     get_annotation_summary,
     get_annotations_by_type,
     remove_annotation,
@@ -170,6 +171,27 @@ class TestAnnotationCRUD:
         })
         assert len(data["blocks"]) == 2
 
+    def test_add_annotations_bulk(self):
+        data = _empty_data()
+        add_annotation(data, "p01_b01", {
+            "target": {"start": 0, "end": 1},
+            "type": "person",
+            "content": {"label": "A", "description": ""},
+        })
+        added = add_annotations(data, "p01_b01", [
+            {"target": {"start": 2, "end": 3}, "type": "term",
+             "content": {"label": "B", "description": ""}},
+            {"target": {"start": 4, "end": 5}, "type": "place",
+             "content": {"label": "C", "description": ""}, "status": "accepted"},
+        ])
+        # 기존 블록에 순서대로 붙고, 기본값이 채워진다
+        assert len(data["blocks"]) == 1
+        labels = [a["content"]["label"] for a in data["blocks"][0]["annotations"]]
+        assert labels == ["A", "B", "C"]
+        assert all(a["id"].startswith("ann_") for a in added)
+        assert [a["status"] for a in added] == ["draft", "accepted"]
+        assert added[0]["generation_history"] == []
+
     def test_update_annotation(self):
         data = _empty_data()
         ann = add_annotation(data, "p01_b01", {
@@ -255,6 +255,22 @@ def test_match_page_blocks():
         print("  [PASS] match_page_blocks")
 
 
+def test_match_page_blocks_reregistered_dict():
+    """같은 파일명으로 다시 등록하면 캐시된 인덱스 대신 새 내용으로 매칭한다."""
+    with tempfile.TemporaryDirectory() as tmp:
+        interp = Path(tmp) / "interp"
+        interp.mkdir()
+
+        data = _sample_dict()
+        register_reference_dict(interp, data, filename="monggu.json")
+        blocks = [{"block_id": "p01_b01", "text": "王戎簡要裴楷清通"}]
+        assert "清通" not in [m["headword"] for m in match_page_blocks(interp, blocks)]
+
+        data["entries"].append({"headword": "清通", "type": "term"})
+        register_reference_dict(interp, data, filename="monggu.json")
+        assert "清通" in [m["headword"] for m in match_page_blocks(interp, blocks)]
+
+
 # ────────────────────────────────
 # 테스트 7: format_for_translation_context
 # ────────────────────────────────
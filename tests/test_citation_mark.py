@@ -24,6 +24,7 @@ from core.citation_mark import (
     list_all_citation_marks,
     load_citation_marks,
     remove_citation_mark,
+    resolve_citation_contexts_bulk,
     save_citation_marks,
     update_citation_mark,
 )
@@ -238,6 +239,61 @@ def test_list_all_citation_marks():
         assert 2 in pages
 
 
+def test_list_all_citation_marks_sees_updates():
+    """파싱 캐시를 쓰더라도 저장 후 다시 수집하면 바뀐 내용이 보인다."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        interp_path = Path(tmpdir)
+        data = _make_empty_page(page_num=1)
+        added = add_citation_mark(data, _make_mark(start=0, end=1, text="王戎"))
+        save_citation_marks(interp_path, "main", 1, data)
+        assert list_all_citation_marks(interp_path, "main")[0].get("label") is None
+
+        update_citation_mark(data, added["id"], {"label": "핵심 논거"})
+        save_citation_marks(interp_path, "main", 1, data)
+        all_marks = list_all_citation_marks(interp_path, "main")
+        assert [m["label"] for m in all_marks] == ["핵심 논거"]
+
+        # 반환된 dict를 고쳐도 다음 수집 결과에는 영향이 없다
+        all_marks[0]["label"] = "변경"
+        assert list_all_citation_marks(interp_path, "main")[0]["label"] == "핵심 논거"
+
+
+def test_resolve_citation_contexts_bulk():
+    """같은 페이지 마크 여러 개를 한 번에 해석 — 순서 유지, 실패는 따로 반환."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        library = Path(tmpdir)
+        doc_path = library / "documents" / "doc"
+        (doc_path / "L4_text" / "pages").mkdir(parents=True)
+        (doc_path / "manifest.json").write_text(
+            json.dumps({"document_id": "doc", "title": "世說新語"}), encoding="utf-8"
+        )
+        (doc_path / "L4_text" / "pages" / "main_page_001.txt").write_text(
+            "王戎簡要裴楷清通", encoding="utf-8"
+        )
+        interp_path = library / "interpretations" / "interp"
+        interp_path.mkdir(parents=True)
+
+        marks = [
+            {"id": "a", **_make_mark(start=4, end=5, text="裴楷")},
+            {"id": "b", **_make_mark(start=0, end=1, text="王戎")},
+        ]
+        contexts, failures = resolve_citation_contexts_bulk(
+            library, "doc", interp_path, "main", 1, marks,
+        )
+        assert failures == []
+        assert [c["mark"]["id"] for c in contexts] == ["a", "b"]
+        assert contexts[0]["original_text"] == "裴楷"
+        assert contexts[1]["original_text"] == "王戎"
+        assert contexts[0]["text_changed"] is False
+
+        # 문헌이 없으면 페이지 텍스트 폴백이 실패 → failures로 반환
+        contexts, failures = resolve_citation_contexts_bulk(
+            library, "missing", interp_path, "main", 1, marks[:1],
+        )
+        assert contexts == []
+        assert failures[0][0]["id"] == "a"
+
+
 # ──────────────────────────────────────
 # 5. 표점 필터 유틸리티
 # ──────────────────────────────────────
@@ -370,6 +426,8 @@ if __name__ == "__main__":
         test_load_nonexistent_returns_empty,
         test_schema_validation_rejects_invalid,
         test_list_all_citation_marks,
+        test_list_all_citation_marks_sees_updates,
+        test_resolve_citation_contexts_bulk,
         test_filter_marks_for_range,
         test_adjust_mark_offsets,
         test_format_citation_full,
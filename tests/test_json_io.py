@@ -0,0 +1,59 @@
+"""json_io.py JSON 읽기 헬퍼 테스트.
+
+테스트 항목:
+1. read_json — UTF-8 JSON 파일 파싱 (한자·한글 포함)
+2. 예외 — 파일 없음(FileNotFoundError), 형식 오류(JSONDecodeError)
+3. loads — str/bytes 입력 모두 처리
+4. write_json_atomic — 표준 json 들여쓰기와 같은 결과, 임시 파일 미잔류
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from core.json_io import JSONDecodeError, loads, read_json, write_json_atomic
+
+
+def test_read_json_utf8():
+    """한자·한글이 포함된 JSON 파일을 그대로 읽는다."""
+    with tempfile.TemporaryDirectory() as td:
+        path = Path(td) / "manifest.json"
+        path.write_text('{"name": "蒙求 서고", "docs": [1, 2]}', encoding="utf-8")
+        assert read_json(path) == {"name": "蒙求 서고", "docs": [1, 2]}
+
+
+def test_read_json_missing_file():
+    """파일이 없으면 FileNotFoundError를 그대로 전파한다."""
+    with tempfile.TemporaryDirectory() as td:
+        with pytest.raises(FileNotFoundError):
+            read_json(Path(td) / "없음.json")
+
+
+def test_read_json_invalid():
+    """형식이 잘못된 JSON은 JSONDecodeError (orjson 사용 여부와 무관)."""
+    with tempfile.TemporaryDirectory() as td:
+        path = Path(td) / "broken.json"
+        path.write_text("{broken", encoding="utf-8")
+        with pytest.raises(JSONDecodeError):
+            read_json(path)
+
+
+def test_loads_str_and_bytes():
+    """str과 UTF-8 bytes 입력 모두 같은 결과를 낸다."""
+    text = '{"title": "王戎"}'
+    assert loads(text) == loads(text.encode("utf-8")) == {"title": "王戎"}
+
+
+def test_write_json_atomic():
+    """기존 파일을 덮어쓰고, 표준 json(indent=2, ensure_ascii=False)과 같은 텍스트를 남긴다."""
+    with tempfile.TemporaryDirectory() as td:
+        path = Path(td) / "page.json"
+        path.write_text("{}", encoding="utf-8")
+        data = {"label": "王戎", "marks": [{"start": 0, "end": 1}]}
+        write_json_atomic(path, data)
+        assert path.read_text(encoding="utf-8") == (
+            json.dumps(data, ensure_ascii=False, indent=2) + "\n"
+        )
+        assert [p.name for p in Path(td).iterdir()] == ["page.json"]
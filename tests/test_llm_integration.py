@@ -480,6 +480,28 @@ class TestLlmRouter:
         assert models[0]["provider"] == "mock_p"
         assert models[0]["available"] is True
 
+    @pytest.mark.asyncio
+    async def test_availability_snapshot_cached(self):
+        """가용성 스냅샷은 TTL 동안 재사용되고, invalidate_cache()로 무효화된다."""
+        config = LlmConfig()
+        p1 = MockProvider(config, provider_id="a", available=True)
+        p2 = MockProvider(config, provider_id="b", available=False)
+
+        from llm.router import LlmRouter
+        router = LlmRouter(config)
+        router.providers = [p1, p2]
+
+        snapshot = await router.cached_availability_snapshot()
+        assert snapshot == {"a": True, "b": False}
+
+        # 가용성이 바뀌어도 TTL 동안은 같은 스냅샷
+        p2._available = True
+        assert await router.cached_availability_snapshot() is snapshot
+
+        # 스냅샷과 개별 캐시를 무효화하면 다시 확인
+        router.invalidate_cache()
+        assert await router.cached_availability_snapshot() == {"a": True, "b": True}
+
 
 # ─── layout_analyzer JSON 파싱 테스트 ────────────────────────
 